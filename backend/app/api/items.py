@@ -1,13 +1,32 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import List, Optional
 from ..services.data_service import data_service
-from ..models.items import Item, ItemSearchResponse
+from ..services.response_cache import json_response, response_cache
+from ..services.projection import ITEM_FIELDS, ITEM_VIEWS, parse_fields, project
+from ..models.items import Item, ItemBatchResponse, ItemSearchResponse
+from ..models.batch import BatchRequest
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
+def _parse_stat_ranges(specs: Optional[List[str]]) -> List[tuple]:
+    """Parse "field:min:max" range specs; either bound may be left empty."""
+    ranges = []
+    for spec in specs or []:
+        parts = spec.split(":")
+        if len(parts) != 3:
+            raise HTTPException(status_code=400, detail=f"Invalid stat range {spec!r}, expected field:min:max")
+        field, low, high = parts
+        try:
+            ranges.append((field, float(low) if low else None, float(high) if high else None))
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid stat range {spec!r}, bounds must be numbers")
+    return ranges
+
+
 @router.get("", response_model=ItemSearchResponse)
 async def search_items(
+    request: Request,
     q: Optional[str] = Query(None, description="Search query"),
     category: Optional[str] = Query(None, description="Filter by category"),
     subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
@@ -15,17 +34,33 @@ async def search_items(
     trader: Optional[str] = Query(None, description="Filter by trader"),
     min_value: Optional[int] = Query(None, description="Minimum value"),
     max_value: Optional[int] = Query(None, description="Maximum value"),
+    stat: Optional[List[str]] = Query(None, description="Numeric range as field:min:max, e.g. damage:20: (repeatable)"),
+    sort: Optional[str] = Query(None, description="Numeric field to sort by, prefix with - for descending"),
     limit: int = Query(50, ge=1, le=200, description="Results per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset")
+    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (overrides offset)"),
+    facets: bool = Query(True, description="Include facet counts"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,name,rarity"),
+    view: Optional[str] = Query(None, description="full (default) or summary: no stats, crafting or recycle blocks")
 ):
     """
     Search and filter items from the Arc Raiders database.
 
-    - Full-text search across item names and descriptions
+    - Full-text search across item names and descriptions, ranked by relevance
+    - Partial words match by prefix (e.g. "rust" finds "Rusted Gear")
     - Filter by category, rarity, trader, and value range
-    - Paginated results
+    - Filter by ranges over value, weight and stats (damage, fire_rate, accuracy, range, armor, durability)
+    - Sort by any of those numeric fields
+    - Paginated results, by offset or by `next_cursor`
+    - Facet counts per category, rarity and trader within the current filter
+    - Sparse results with `fields` or `view=summary`; full detail stays at /items/{item_id}
     """
-    items, total = await data_service.search_items(
+    try:
+        projection = parse_fields(fields, view, ITEM_FIELDS, ITEM_VIEWS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filters = dict(
         query=q,
         category=category,
         subcategory=subcategory,
@@ -33,30 +68,95 @@ async def search_items(
         trader=trader,
         min_value=min_value,
         max_value=max_value,
-        limit=limit,
-        offset=offset
+        stat_ranges=_parse_stat_ranges(stat)
     )
 
-    return ItemSearchResponse(
-        items=items,
-        total=total,
-        limit=limit,
-        offset=offset
-    )
+    async def build():
+        try:
+            items, total, next_cursor = await data_service.search_items(
+                **filters,
+                sort=sort,
+                limit=limit,
+                offset=offset,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        facet_counts = await data_service.get_item_facets(**filters) if facets else {}
+        if projection is not None:
+            return {
+                "items": [project(item, projection) for item in items],
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": next_cursor,
+                "facets": facet_counts,
+            }
+        return ItemSearchResponse(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+            facets=facet_counts
+        )
+
+    # Keyed by free-form q/stat/cursor values, mostly never requested twice
+    return await response_cache.serve(request, ("items",), build, compress_on_miss=False)
+
+
+@router.get("/aggregates")
+async def get_item_aggregates(
+    q: Optional[str] = Query(None, description="Search query"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+    rarity: Optional[str] = Query(None, description="Filter by rarity"),
+    trader: Optional[str] = Query(None, description="Filter by trader"),
+    min_value: Optional[int] = Query(None, description="Minimum value"),
+    max_value: Optional[int] = Query(None, description="Maximum value"),
+    stat: Optional[List[str]] = Query(None, description="Numeric range as field:min:max (repeatable)")
+):
+    """Count, min, max and mean of each numeric item field within the filter."""
+    try:
+        aggregates = await data_service.get_item_aggregates(
+            query=q,
+            category=category,
+            subcategory=subcategory,
+            rarity=rarity,
+            trader=trader,
+            min_value=min_value,
+            max_value=max_value,
+            stat_ranges=_parse_stat_ranges(stat)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"aggregates": aggregates}
 
 
 @router.get("/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get all available item categories."""
-    categories = await data_service.get_categories()
-    return {"categories": categories}
+    async def build():
+        return {"categories": await data_service.get_categories()}
+
+    return await response_cache.serve(request, ("items",), build)
 
 
 @router.get("/rarities")
-async def get_rarities():
+async def get_rarities(request: Request):
     """Get all available item rarities."""
-    rarities = await data_service.get_rarities()
-    return {"rarities": rarities}
+    async def build():
+        return {"rarities": await data_service.get_rarities()}
+
+    return await response_cache.serve(request, ("items",), build)
+
+
+@router.post("/batch", response_model=ItemBatchResponse)
+async def get_items_batch(batch: BatchRequest):
+    """Get many items by ID in one request; ids that do not exist are listed in `missing`."""
+    items, missing = await data_service.get_batch("items", batch.ids)
+    return json_response(ItemBatchResponse(items=items, missing=missing))
 
 
 @router.get("/{item_id}", response_model=Item)
@@ -65,36 +165,24 @@ async def get_item(item_id: str):
     item = await data_service.get_item_by_id(item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return json_response(item)
 
 
 @router.get("/{item_id}/related")
 async def get_related_items(item_id: str, limit: int = Query(5, ge=1, le=20)):
     """Get items related to this one (same category, used in same quests, etc.)."""
-    item = await data_service.get_item_by_id(item_id)
-    if not item:
+    related = await data_service.get_related_items(item_id, limit)
+    if related is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    return {"related": related}
+
+
+@router.get("/{item_id}/sources")
+async def get_item_sources(item_id: str):
+    """Get which upstream source (metaforge, ardb, raidtheory) each field of an item came from."""
+    sources = await data_service.get_item_sources(item_id)
+    if sources is None:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    # Find related items by category and quest requirements
-    all_items = await data_service.get_all_items()
-    related = []
-
-    for other in all_items:
-        if other.id == item_id:
-            continue
-
-        score = 0
-        if other.category == item.category:
-            score += 2
-        if other.subcategory == item.subcategory:
-            score += 1
-        if other.rarity == item.rarity:
-            score += 1
-        if set(other.quest_requirements) & set(item.quest_requirements):
-            score += 3
-
-        if score > 0:
-            related.append((score, other))
-
-    related.sort(key=lambda x: x[0], reverse=True)
-    return {"related": [item for _, item in related[:limit]]}
+    return {"item_id": item_id, "sources": sources}
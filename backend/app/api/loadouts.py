@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
 from ..services.data_service import data_service
-from ..models.loadouts import Weapon, ArmorPiece, WeaponDPSCalculation
+from ..services.response_cache import json_response, response_cache
+from ..models.loadouts import Weapon, ArmorPiece, WeaponBatchResponse, WeaponDPSCalculation
+from ..models.batch import BatchRequest
 
 router = APIRouter(prefix="/loadouts", tags=["loadouts"])
 
@@ -40,11 +42,36 @@ async def get_weapons(
     return {"weapons": weapons_with_dps, "total": len(weapons_with_dps)}
 
 
+@router.post("/weapons/batch", response_model=WeaponBatchResponse)
+async def get_weapons_batch(batch: BatchRequest):
+    """Get many weapons by ID in one request; ids that are not weapons are listed in `missing`."""
+    weapons, missing = await data_service.get_batch("weapons", batch.ids)
+    return json_response(WeaponBatchResponse(weapons=weapons, missing=missing))
+
+
+@router.get("/weapons/compare")
+async def compare_weapons(
+    weapon_ids: str = Query(..., description="Comma-separated weapon IDs")
+):
+    """Compare multiple weapons side by side."""
+    ids = [id.strip() for id in weapon_ids.split(",")]
+    weapons, _ = await data_service.get_batch("weapons", ids)
+
+    comparison = []
+    for weapon in weapons:
+        dps = data_service.calculate_weapon_dps(weapon)
+        comparison.append({
+            **weapon.model_dump(),
+            "calculated_dps": dps
+        })
+
+    return {"comparison": comparison}
+
+
 @router.get("/weapons/{weapon_id}")
 async def get_weapon(weapon_id: str):
     """Get detailed weapon stats and DPS calculation."""
-    weapons = await data_service.get_weapons()
-    weapon = next((w for w in weapons if w.id == weapon_id), None)
+    weapon = await data_service.get_weapon_by_id(weapon_id)
 
     if not weapon:
         raise HTTPException(status_code=404, detail="Weapon not found")
@@ -67,27 +94,6 @@ async def get_weapon(weapon_id: str):
     }
 
 
-@router.get("/weapons/compare")
-async def compare_weapons(
-    weapon_ids: str = Query(..., description="Comma-separated weapon IDs")
-):
-    """Compare multiple weapons side by side."""
-    ids = [id.strip() for id in weapon_ids.split(",")]
-    weapons = await data_service.get_weapons()
-
-    comparison = []
-    for weapon_id in ids:
-        weapon = next((w for w in weapons if w.id == weapon_id), None)
-        if weapon:
-            dps = data_service.calculate_weapon_dps(weapon)
-            comparison.append({
-                **weapon.model_dump(),
-                "calculated_dps": dps
-            })
-
-    return {"comparison": comparison}
-
-
 @router.get("/armor")
 async def get_armor(
     slot: Optional[str] = Query(None, description="Filter by armor slot"),
@@ -107,8 +113,8 @@ async def get_armor(
     if rarity:
         armor = [a for a in armor if a.rarity == rarity]
 
-    # Sort by armor value
-    armor.sort(key=lambda x: x.armor_value, reverse=True)
+    # Sort by armor value (into a new list, the unfiltered one is shared)
+    armor = sorted(armor, key=lambda x: x.armor_value, reverse=True)
 
     return {"armor": armor, "total": len(armor)}
 
@@ -116,8 +122,7 @@ async def get_armor(
 @router.get("/armor/{armor_id}")
 async def get_armor_piece(armor_id: str):
     """Get detailed armor piece stats."""
-    armor_list = await data_service.get_armor()
-    armor = next((a for a in armor_list if a.id == armor_id), None)
+    armor = await data_service.get_armor_by_id(armor_id)
 
     if not armor:
         raise HTTPException(status_code=404, detail="Armor not found")
@@ -135,8 +140,8 @@ async def calculate_loadout_stats(loadout: dict):
     weapon_ids = loadout.get("weapon_ids", [])
     armor_ids = loadout.get("armor_ids", [])
 
-    weapons = await data_service.get_weapons()
-    armor_list = await data_service.get_armor()
+    weapons = await data_service.get_many("weapons", weapon_ids)
+    armor_list = await data_service.get_many("armor", armor_ids)
 
     total_dps = 0
     total_armor = 0
@@ -144,14 +149,14 @@ async def calculate_loadout_stats(loadout: dict):
 
     selected_weapons = []
     for wid in weapon_ids:
-        weapon = next((w for w in weapons if w.id == wid), None)
+        weapon = weapons.get(wid)
         if weapon:
             selected_weapons.append(weapon)
             total_dps += data_service.calculate_weapon_dps(weapon)
 
     selected_armor = []
     for aid in armor_ids:
-        armor = next((a for a in armor_list if a.id == aid), None)
+        armor = armor_list.get(aid)
         if armor:
             selected_armor.append(armor)
             total_armor += armor.armor_value
@@ -177,39 +182,42 @@ async def calculate_loadout_stats(loadout: dict):
 
 
 @router.get("/tier-list")
-async def get_weapon_tier_list():
+async def get_weapon_tier_list(request: Request):
     """Get weapons organized by tier based on DPS."""
-    weapons = await data_service.get_weapons()
+    async def build():
+        weapons = await data_service.get_weapons()
 
-    weapons_with_dps = []
-    for weapon in weapons:
-        dps = data_service.calculate_weapon_dps(weapon)
-        weapons_with_dps.append({
-            **weapon.model_dump(),
-            "calculated_dps": dps
-        })
+        weapons_with_dps = []
+        for weapon in weapons:
+            dps = data_service.calculate_weapon_dps(weapon)
+            weapons_with_dps.append({
+                **weapon.model_dump(),
+                "calculated_dps": dps
+            })
 
-    # Sort by DPS
-    weapons_with_dps.sort(key=lambda x: x["calculated_dps"], reverse=True)
+        # Sort by DPS
+        weapons_with_dps.sort(key=lambda x: x["calculated_dps"], reverse=True)
+
+        # Assign tiers based on DPS percentile
+        total = len(weapons_with_dps)
+        if total == 0:
+            return {"tiers": {}}
+
+        tiers = {"S": [], "A": [], "B": [], "C": [], "D": []}
+
+        for i, weapon in enumerate(weapons_with_dps):
+            percentile = i / total
+            if percentile < 0.1:
+                tiers["S"].append(weapon)
+            elif percentile < 0.3:
+                tiers["A"].append(weapon)
+            elif percentile < 0.55:
+                tiers["B"].append(weapon)
+            elif percentile < 0.8:
+                tiers["C"].append(weapon)
+            else:
+                tiers["D"].append(weapon)
+
+        return {"tiers": tiers}
 
-    # Assign tiers based on DPS percentile
-    total = len(weapons_with_dps)
-    if total == 0:
-        return {"tiers": {}}
-
-    tiers = {"S": [], "A": [], "B": [], "C": [], "D": []}
-
-    for i, weapon in enumerate(weapons_with_dps):
-        percentile = i / total
-        if percentile < 0.1:
-            tiers["S"].append(weapon)
-        elif percentile < 0.3:
-            tiers["A"].append(weapon)
-        elif percentile < 0.55:
-            tiers["B"].append(weapon)
-        elif percentile < 0.8:
-            tiers["C"].append(weapon)
-        else:
-            tiers["D"].append(weapon)
-
-    return {"tiers": tiers}
+    return await response_cache.serve(request, ("items",), build)
@@ -1,36 +1,58 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
 from ..services.data_service import data_service
+from ..services.response_cache import response_cache
+from ..services.projection import MAP_FIELDS, MAP_VIEWS, parse_fields, project_map
 from ..models.maps import GameMap, MapListResponse
 
 router = APIRouter(prefix="/maps", tags=["maps"])
 
 
 @router.get("", response_model=MapListResponse)
-async def get_maps():
+async def get_maps(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,marker_count"),
+    view: Optional[str] = Query(None, description="full (default) or summary: basic info and marker/zone counts")
+):
     """
     Get all available maps.
 
-    Returns basic info for each map including name, description, and thumbnail.
+    Returns every map with its markers, zones and extractions, or only the
+    requested `fields` / `view` (e.g. `view=summary` for a map picker). Full
+    detail stays available at /maps/{map_id}.
     """
-    maps = await data_service.get_all_maps()
-    return MapListResponse(maps=maps, total=len(maps))
+    try:
+        projection = parse_fields(fields, view, MAP_FIELDS, MAP_VIEWS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def build():
+        maps = await data_service.get_all_maps()
+        if projection is None:
+            return MapListResponse(maps=maps, total=len(maps))
+        return {"maps": [project_map(game_map, projection) for game_map in maps], "total": len(maps)}
+
+    return await response_cache.serve(request, ("maps",), build)
 
 
 @router.get("/{map_id}", response_model=GameMap)
-async def get_map(map_id: str):
+async def get_map(map_id: str, request: Request):
     """
     Get detailed map data including all markers, zones, and extractions.
     """
-    game_map = await data_service.get_map_by_id(map_id)
-    if not game_map:
-        raise HTTPException(status_code=404, detail="Map not found")
-    return game_map
+    async def build():
+        game_map = await data_service.get_map_by_id(map_id)
+        if not game_map:
+            raise HTTPException(status_code=404, detail="Map not found")
+        return game_map
+
+    return await response_cache.serve(request, ("maps",), build)
 
 
 @router.get("/{map_id}/markers")
 async def get_map_markers(
     map_id: str,
+    request: Request,
     type: Optional[str] = Query(None, description="Filter by marker type")
 ):
     """
@@ -38,16 +60,19 @@ async def get_map_markers(
 
     Filter by type: extraction, loot, enemy, quest, trader, landmark
     """
-    game_map = await data_service.get_map_by_id(map_id)
-    if not game_map:
-        raise HTTPException(status_code=404, detail="Map not found")
+    async def build():
+        game_map = await data_service.get_map_by_id(map_id)
+        if not game_map:
+            raise HTTPException(status_code=404, detail="Map not found")
+
+        markers = game_map.markers + game_map.extractions
 
-    markers = game_map.markers + game_map.extractions
+        if type:
+            markers = [m for m in markers if m.type == type]
 
-    if type:
-        markers = [m for m in markers if m.type == type]
+        return {"markers": markers, "total": len(markers)}
 
-    return {"markers": markers, "total": len(markers)}
+    return await response_cache.serve(request, ("maps",), build)
 
 
 @router.get("/{map_id}/extractions")
@@ -90,18 +115,15 @@ async def get_map_quests(map_id: str):
         raise HTTPException(status_code=404, detail="Map not found")
 
     # Get quests for this location
-    quests, _ = await data_service.search_quests(location=game_map.name)
+    quests, _, _ = await data_service.search_quests(location=game_map.name)
 
     # Also get quests referenced by map markers
     quest_ids_from_markers = set()
     for marker in game_map.markers:
         quest_ids_from_markers.update(marker.quests)
 
-    marker_quests = []
-    for quest_id in quest_ids_from_markers:
-        quest = await data_service.get_quest_by_id(quest_id)
-        if quest and quest not in quests:
-            marker_quests.append(quest)
+    found = await data_service.get_many("quests", quest_ids_from_markers)
+    marker_quests = [quest for quest in found.values() if quest not in quests]
 
     return {
         "map_id": map_id,
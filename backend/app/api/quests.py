@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
 from ..services.data_service import data_service
-from ..models.quests import Quest, QuestSearchResponse
+from ..services.response_cache import json_response, response_cache
+from ..models.quests import Quest, QuestBatchResponse, QuestSearchResponse
+from ..models.batch import BatchRequest
 
 router = APIRouter(prefix="/quests", tags=["quests"])
 
@@ -13,53 +15,80 @@ async def search_quests(
     type: Optional[str] = Query(None, description="Filter by quest type"),
     location: Optional[str] = Query(None, description="Filter by location/map"),
     limit: int = Query(50, ge=1, le=200, description="Results per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset")
+    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (overrides offset)"),
+    facets: bool = Query(True, description="Include facet counts")
 ):
     """
     Search and filter quests.
 
-    - Full-text search across quest names and descriptions
+    - Full-text search across quest names and descriptions, ranked by relevance
     - Filter by giver, type, and location
-    - Paginated results
+    - Paginated results, by offset or by `next_cursor`
+    - Facet counts per giver, type and location within the current filter
     """
-    quests, total = await data_service.search_quests(
+    filters = dict(
         query=q,
         giver=giver,
         quest_type=type,
-        location=location,
-        limit=limit,
-        offset=offset
+        location=location
     )
-
-    return QuestSearchResponse(
+    try:
+        quests, total, next_cursor = await data_service.search_quests(
+            **filters,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return json_response(QuestSearchResponse(
         quests=quests,
         total=total,
         limit=limit,
-        offset=offset
-    )
+        offset=offset,
+        next_cursor=next_cursor,
+        facets=await data_service.get_quest_facets(**filters) if facets else {}
+    ))
 
 
 @router.get("/givers")
-async def get_quest_givers():
+async def get_quest_givers(request: Request):
     """Get all quest givers (NPCs/traders)."""
-    givers = await data_service.get_quest_givers()
-    return {"givers": givers}
+    async def build():
+        return {"givers": await data_service.get_quest_givers()}
+
+    return await response_cache.serve(request, ("quests",), build)
 
 
 @router.get("/types")
-async def get_quest_types():
+async def get_quest_types(request: Request):
     """Get all quest types."""
-    quests = await data_service.get_all_quests()
-    types = {q.type for q in quests if q.type}
-    return {"types": sorted(list(types))}
+    async def build():
+        quests = await data_service.get_all_quests()
+        types = {q.type for q in quests if q.type}
+        return {"types": sorted(list(types))}
+
+    return await response_cache.serve(request, ("quests",), build)
 
 
 @router.get("/locations")
-async def get_quest_locations():
+async def get_quest_locations(request: Request):
     """Get all quest locations."""
-    quests = await data_service.get_all_quests()
-    locations = {q.location for q in quests if q.location}
-    return {"locations": sorted(list(locations))}
+    async def build():
+        quests = await data_service.get_all_quests()
+        locations = {q.location for q in quests if q.location}
+        return {"locations": sorted(list(locations))}
+
+    return await response_cache.serve(request, ("quests",), build)
+
+
+@router.post("/batch", response_model=QuestBatchResponse)
+async def get_quests_batch(batch: BatchRequest):
+    """Get many quests by ID in one request; ids that do not exist are listed in `missing`."""
+    quests, missing = await data_service.get_batch("quests", batch.ids)
+    return json_response(QuestBatchResponse(quests=quests, missing=missing))
 
 
 @router.get("/{quest_id}", response_model=Quest)
@@ -68,7 +97,7 @@ async def get_quest(quest_id: str):
     quest = await data_service.get_quest_by_id(quest_id)
     if not quest:
         raise HTTPException(status_code=404, detail="Quest not found")
-    return quest
+    return json_response(quest)
 
 
 @router.get("/{quest_id}/requirements")
@@ -79,16 +108,17 @@ async def get_quest_requirements(quest_id: str):
         raise HTTPException(status_code=404, detail="Quest not found")
 
     # Get full item details for required items
+    item_ids = [item_req.get("id") or item_req.get("item_id") for item_req in quest.required_items]
+    items = await data_service.get_many("items", [item_id for item_id in item_ids if item_id])
+
     required_items = []
-    for item_req in quest.required_items:
-        item_id = item_req.get("id") or item_req.get("item_id")
-        if item_id:
-            item = await data_service.get_item_by_id(item_id)
-            if item:
-                required_items.append({
-                    "item": item,
-                    "count": item_req.get("count", 1)
-                })
+    for item_id, item_req in zip(item_ids, quest.required_items):
+        item = items.get(item_id)
+        if item:
+            required_items.append({
+                "item": item,
+                "count": item_req.get("count", 1)
+            })
 
     return {
         "quest_id": quest_id,
@@ -107,11 +137,8 @@ async def get_quest_chain(quest_id: str):
     all_quests = await data_service.get_all_quests()
 
     # Find prerequisites
-    prerequisites = []
-    for prereq_id in quest.prerequisites:
-        prereq = await data_service.get_quest_by_id(prereq_id)
-        if prereq:
-            prerequisites.append(prereq)
+    found = await data_service.get_many("quests", quest.prerequisites)
+    prerequisites = [found[prereq_id] for prereq_id in quest.prerequisites if prereq_id in found]
 
     # Find quests that have this quest as a prerequisite
     follow_ups = [
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Query
+from typing import Optional
+from ..services.data_service import data_service
+from ..services.response_cache import json_response
+from ..models.search import SuggestResponse
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, description="Partially typed name"),
+    types: Optional[str] = Query(None, description="Comma-separated: item, quest, marker"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions")
+):
+    """
+    Typeahead suggestions across items, quests and map markers.
+
+    Matching is typo-tolerant ("rusted gaer" finds "Rusted Gear") and the
+    last word is treated as a prefix while it is still being typed.
+    """
+    kinds = [t.strip() for t in types.split(",")] if types else None
+    suggestions = await data_service.suggest(q, limit=limit, kinds=kinds)
+    return json_response(SuggestResponse(query=q, suggestions=suggestions))
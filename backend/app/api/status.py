@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Query
+from ..services.data_service import data_service
+from ..services.response_cache import response_cache
+
+router = APIRouter(prefix="/status", tags=["status"])
+
+
+@router.get("/single-flight")
+async def get_single_flight_stats():
+    """
+    Get request-coalescing counters per cache key.
+
+    `loads` counts upstream loads started, `coalesced` counts callers that
+    waited on an already in-flight load instead of starting their own.
+    """
+    return {"single_flight": data_service.get_single_flight_stats()}
+
+
+@router.get("/refresh")
+async def get_refresh_stats():
+    """
+    Get dataset refresh counters per cache key.
+
+    `unchanged` counts refreshes short-circuited because the upstream
+    answered 304 Not Modified or sent an identical payload.
+    """
+    return {"refresh": data_service.get_refresh_stats()}
+
+
+@router.get("/sources")
+async def get_source_stats():
+    """
+    Get the outcome of the latest fetch of each item source.
+
+    `late` means the source missed the merge deadline; its previous records
+    were used and the fetch finishes in the background.
+    """
+    return {"sources": data_service.get_source_stats()}
+
+
+@router.get("/shared-cache")
+async def get_shared_cache_stats():
+    """
+    Get the state of the Redis L2 shared by all workers.
+
+    `versions` is the shared snapshot version of each dataset this worker holds.
+    """
+    return {"shared_cache": data_service.get_shared_cache_stats()}
+
+
+@router.get("/upstreams")
+async def get_upstream_stats():
+    """
+    Get circuit breaker state and call counters per upstream.
+
+    While a breaker is `open` calls to that upstream fail fast; after
+    `retry_in` seconds one trial call decides whether it closes again.
+    """
+    return {"upstreams": data_service.get_upstream_stats()}
+
+
+@router.get("/response-cache")
+async def get_response_cache_stats():
+    """
+    Get hit and miss counters of the encoded response cache.
+
+    Hits are served from stored bytes without rebuilding or re-encoding the body.
+    """
+    return {"response_cache": response_cache.status()}
+
+
+@router.get("/changelog")
+async def get_changelog(limit: int = Query(20, ge=1, le=100)):
+    """Get the most recent dataset changes (added/removed/changed ids per refresh)."""
+    return {"changelog": list(data_service.changelog)[-limit:]}
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from ..services.data_service import data_service
+from ..services.response_cache import response_cache
+
+router = APIRouter(tags=["sync"])
+
+# A sync cursor is the content digest of each synced dataset, dot-separated in
+# SYNC_DATASETS order, so it means the same data in every worker and across
+# restarts, and stays valid per dataset
+
+
+def _cursor(digests: dict) -> str:
+    return ".".join(digests[dataset] for dataset in data_service.SYNC_DATASETS)
+
+
+def _parse_cursor(since: str) -> dict:
+    digests = since.split(".")
+    if len(digests) != len(data_service.SYNC_DATASETS) or not all(digests):
+        raise ValueError(since)
+    return dict(zip(data_service.SYNC_DATASETS, digests))
+
+
+@router.get("/bundle")
+async def get_bundle(request: Request):
+    """
+    Every item, quest and map in one response, for taking the app offline.
+
+    The body is built and compressed once per dataset version. Keep its
+    `version` and pass it to /sync to fetch only what changed since.
+    """
+    async def build():
+        bundle = await data_service.get_bundle()
+        return {"version": _cursor(bundle.pop("digests")), **bundle}
+
+    return await response_cache.serve(request, data_service.SYNC_DATASETS, build)
+
+
+@router.get("/sync")
+async def sync(
+    request: Request,
+    since: str = Query(..., description="`version` of the bundle or of the last sync")
+):
+    """
+    Records added, changed and removed since a bundle or sync `version`.
+
+    Per dataset, `added` and `changed` hold whole records and `removed` ids.
+    When a dataset's version is not known here (too old, or issued before a
+    restart or by another worker for data never loaded here), `reset` is
+    true and `added` holds all its records: replace the local copy with them.
+    """
+    try:
+        digests = _parse_cursor(since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid sync version {since!r}")
+
+    async def build():
+        delta = await data_service.get_changes_since(digests)
+        return {"since": since, "version": _cursor(delta.pop("digests")), **delta}
+
+    return await response_cache.serve(request, data_service.SYNC_DATASETS, build)
@@ -1,7 +1,13 @@
+import os
 from typing import Optional
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
+# The backend directory: relative paths in settings are resolved against it,
+# not against whatever directory the server was started from
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
 class Settings(BaseSettings):
     app_name: str = "Arc Raiders Companion"
@@ -13,13 +19,99 @@ class Settings(BaseSettings):
     ardb_api_url: str = "https://ardb.app/api"
     raidtheory_github_url: str = "https://raw.githubusercontent.com/RaidTheory/arcraiders-data/main"
 
+    # Upstream HTTP clients: each upstream gets its own connection pool, retry
+    # policy and circuit breaker. HTTP/2 is used when the h2 package is installed.
+    upstream_http2: bool = True
+    upstream_max_connections: dict[str, int] = {"metaforge": 10, "ardb": 4, "raidtheory": 4}
+    upstream_connect_timeout: float = 5.0
+    upstream_read_timeout: float = 10.0
+    upstream_pool_timeout: float = 5.0  # Waiting for a free pooled connection
+    upstream_retries: int = 2  # Retries after the first attempt
+    upstream_backoff_base: float = 0.25  # Seconds; doubled per retry, with full jitter
+    upstream_backoff_max: float = 4.0
+    breaker_failure_threshold: int = 5  # Consecutive failed calls before failing fast
+    breaker_reset_timeout: float = 30.0  # Seconds before a trial call is let through
+
+    # Paged ingestion of MetaForge collections
+    ingest_page_size: int = 500
+    ingest_concurrency: int = 4  # Pages in flight at once
+    ingest_max_pages: int = 200
+
+    # Normalization: a batch of at least normalize_pool_threshold new records is
+    # spread over normalize_processes worker processes (0 keeps it in-process)
+    normalize_processes: int = 0
+    normalize_pool_threshold: int = 20000
+
+    # Multi-source item merge: all sources are fetched concurrently and each
+    # field is taken from the first source that has it, in this order unless
+    # overridden per field (RaidTheory's datamined recipes are the most complete)
+    raidtheory_items_path: str = "items.json"
+    merge_sources: list[str] = ["metaforge", "ardb", "raidtheory"]
+    merge_field_precedence: dict[str, list[str]] = {
+        "crafting": ["raidtheory", "metaforge", "ardb"],
+        "recycle": ["raidtheory", "metaforge", "ardb"],
+    }
+    merge_deadline: float = 10.0  # Seconds to wait for slow sources before merging without them
+    merge_hedge_after: float = 3.0  # Seconds before racing a second request to a slow source
+    # Local clone of RaidTheory/arcraiders-data, read instead of GitHub when set
+    # (a relative path is taken from the backend directory).
+    # raidtheory_items_path may then name a directory of per-item JSON files.
+    # Only items come from RaidTheory: quests and maps are MetaForge's alone,
+    # so offline they are served from the snapshot below, not from the clone.
+    raidtheory_local_path: Optional[str] = None
+
+    # On-disk snapshot of the normalized datasets and their indexes, loaded at
+    # startup so the API serves immediately and works offline ("" disables it).
+    # A relative path is taken from the backend directory.
+    snapshot_path: str = "data/snapshot.bin"
+    snapshot_delay: float = 2.0  # Seconds to batch dataset refreshes before writing
+
     # Cache settings (in seconds)
     cache_ttl_items: int = 3600  # 1 hour
     cache_ttl_events: int = 300  # 5 minutes
     cache_ttl_traders: int = 600  # 10 minutes
 
-    # Redis (optional, falls back to in-memory cache)
+    # Encoded JSON bodies of hot read endpoints, per path, query and dataset version
+    response_cache_size: int = 512
+    # Cached bodies at least this large are also stored gzip- and brotli-compressed
+    compress_min_size: int = 1024
+    gzip_level: int = 9
+    brotli_quality: int = 9  # 0-11; compression runs once per dataset version
+
+    # Offline sync: id->fingerprint maps of this many recent versions of each
+    # dataset are kept to answer /api/sync; older cursors get that dataset in full
+    sync_retained_versions: int = 16
+
+    # Stale-while-revalidate: past the TTLs above, cached data keeps being served
+    # while a background refresh runs. Past these hard TTLs it is dropped and the
+    # next request reloads it inline.
+    stale_while_revalidate: bool = True
+    cache_hard_ttl_items: int = 86400  # 24 hours
+    cache_hard_ttl_events: int = 1800  # 30 minutes
+    cache_hard_ttl_traders: int = 3600  # 1 hour
+    cache_refresh_retry: int = 60  # Minimum seconds between background refresh attempts
+
+    # Startup preload: each source is fetched concurrently within its own budget (seconds)
+    startup_budgets: dict[str, float] = {
+        "items": 20.0,
+        "quests": 15.0,
+        "maps": 15.0,
+        "events": 5.0,
+        "traders": 5.0,
+    }
+
+    # Redis (optional, falls back to in-memory cache): shared dataset snapshots
+    # across workers, with one worker refreshing each dataset at a time
     redis_url: Optional[str] = None
+    redis_lock_timeout: float = 60.0  # Longest a worker may hold a dataset's refresh lock
+    # Key signing shared snapshots (HMAC-SHA256); required with redis_url, since
+    # workers unpickle what they read from Redis
+    redis_secret: Optional[str] = None
+
+    @field_validator("snapshot_path", "raidtheory_local_path")
+    @classmethod
+    def _from_backend_dir(cls, path: Optional[str]) -> Optional[str]:
+        return os.path.join(BACKEND_DIR, path) if path else path
 
     class Config:
         env_file = ".env"
@@ -1,21 +1,31 @@
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import get_settings
-from .api import items, events, quests, maps, loadouts
+from .api import items, events, quests, maps, loadouts, search, status, sync
 from .services.data_service import data_service
+from .services.response_cache import response_cache
+from .services.http_cache import ConditionalGetMiddleware
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: pre-load caches
+    # Startup: serve the on-disk snapshot and refresh behind it, or else
+    # pre-load caches, all sources at once
     print("Loading Arc Raiders data...")
-    await data_service.get_all_items()
-    await data_service.get_all_quests()
-    await data_service.get_all_maps()
-    print("Data loaded successfully!")
+    started = time.perf_counter()
+    await data_service.start_shared_cache()
+    if data_service.load_snapshot():
+        print(f"Snapshot loaded in {time.perf_counter() - started:.2f}s, refreshing in the background")
+        data_service.refresh_in_background()
+    else:
+        report = await data_service.preload()
+        for source, result in report.items():
+            print(f"  {source}: {result['status']}, {result['records']} records in {result['seconds']}s")
+        print(f"Data loaded in {time.perf_counter() - started:.2f}s")
     yield
     # Shutdown: cleanup
     await data_service.close()
@@ -46,6 +56,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# ETags, Cache-Control and 304s on read endpoints (inside CORS, so 304s get CORS headers)
+app.add_middleware(ConditionalGetMiddleware)
+
 # CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +79,9 @@ app.include_router(events.router, prefix="/api")
 app.include_router(quests.router, prefix="/api")
 app.include_router(maps.router, prefix="/api")
 app.include_router(loadouts.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(status.router, prefix="/api")
+app.include_router(sync.router, prefix="/api")
 
 
 @app.get("/")
@@ -84,21 +100,24 @@ async def health_check():
 
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(request: Request):
     """Get database statistics."""
-    items_list = await data_service.get_all_items()
-    categories = await data_service.get_categories()
-    rarities = await data_service.get_rarities()
-    quests_list = await data_service.get_all_quests()
-    maps_list = await data_service.get_all_maps()
-    weapons = await data_service.get_weapons()
-
-    return {
-        "total_items": len(items_list),
-        "total_quests": len(quests_list),
-        "total_maps": len(maps_list),
-        "total_weapons": len(weapons),
-        "categories": len(categories),
-        "rarities": len(rarities),
-        "data_sources": ["MetaForge", "ARDB", "RaidTheory"]
-    }
+    async def build():
+        items_list = await data_service.get_all_items()
+        categories = await data_service.get_categories()
+        rarities = await data_service.get_rarities()
+        quests_list = await data_service.get_all_quests()
+        maps_list = await data_service.get_all_maps()
+        weapons = await data_service.get_weapons()
+
+        return {
+            "total_items": len(items_list),
+            "total_quests": len(quests_list),
+            "total_maps": len(maps_list),
+            "total_weapons": len(weapons),
+            "categories": len(categories),
+            "rarities": len(rarities),
+            "data_sources": ["MetaForge", "ARDB", "RaidTheory"]
+        }
+
+    return await response_cache.serve(request, ("items", "quests", "maps"), build)
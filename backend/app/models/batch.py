@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 500
+
+
+class BatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
@@ -40,6 +40,11 @@ class Item(BaseModel):
     image_url: Optional[str] = None
 
 
+class ItemBatchResponse(BaseModel):
+    items: list[Item]  # In request order, repeats dropped
+    missing: list[str]  # Requested ids that do not exist
+
+
 class ItemSearchParams(BaseModel):
     query: Optional[str] = None
     category: Optional[str] = None
@@ -57,3 +62,5 @@ class ItemSearchResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    facets: dict[str, dict[str, int]] = {}  # Counts per category/rarity/trader
@@ -26,6 +26,11 @@ class Weapon(BaseModel):
     image_url: Optional[str] = None
 
 
+class WeaponBatchResponse(BaseModel):
+    weapons: list[Weapon]  # In request order, repeats dropped
+    missing: list[str]  # Requested ids that are not weapons
+
+
 class ArmorPiece(BaseModel):
     id: str
     name: str
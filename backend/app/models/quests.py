@@ -32,6 +32,11 @@ class Quest(BaseModel):
     image_url: Optional[str] = None
 
 
+class QuestBatchResponse(BaseModel):
+    quests: list[Quest]  # In request order, repeats dropped
+    missing: list[str]  # Requested ids that do not exist
+
+
 class QuestSearchParams(BaseModel):
     query: Optional[str] = None
     giver: Optional[str] = None
@@ -46,3 +51,5 @@ class QuestSearchResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
+    facets: dict[str, dict[str, int]] = {}  # Counts per giver/type/location
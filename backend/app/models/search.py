@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class SearchSuggestion(BaseModel):
+    type: str  # item, quest, marker
+    id: str
+    name: str
+    map_id: Optional[str] = None  # Map containing the marker
+    score: float  # 0-1, higher is a closer match
+
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: list[SearchSuggestion]
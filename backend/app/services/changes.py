@@ -0,0 +1,61 @@
+import hashlib
+import json
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+def fingerprint(raw: dict) -> str:
+    """Stable hash of a raw upstream record, independent of key order."""
+    encoded = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+def diff_fingerprints(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Compare id->fingerprint maps of two loads of a dataset."""
+    return {
+        "added": [record_id for record_id in new if record_id not in old],
+        "removed": [record_id for record_id in old if record_id not in new],
+        "changed": [
+            record_id for record_id, fp in new.items()
+            if record_id in old and old[record_id] != fp
+        ],
+    }
+
+
+class IncrementalNormalizer:
+    """
+    Normalize raw records as they arrive, reusing results for known fingerprints.
+
+    `previous` maps fingerprints from the last load to their normalized
+    entries. Records with a new fingerprint are normalized together by
+    `normalize_many` (default: `normalize` one by one). After all records are
+    added, `entries` and `fingerprints` are in upstream order and
+    `by_fingerprint` is the map to keep for next time.
+    """
+
+    def __init__(self, previous: Dict[str, object], normalize: Callable[[dict], object],
+                 normalize_many: Optional[Callable[[List[dict]], List[object]]] = None):
+        self.previous = previous
+        self.normalize_many = normalize_many or (lambda raws: [normalize(raw) for raw in raws])
+        self.entries: List[object] = []
+        self.fingerprints: List[str] = []
+        self.by_fingerprint: Dict[str, object] = {}
+
+    def add(self, raws: Iterable):
+        start = len(self.fingerprints)
+        pending: Dict[str, dict] = {}
+        for raw in raws:
+            # Skip anything that is not a record object
+            if not isinstance(raw, dict):
+                continue
+            fp = fingerprint(raw)
+            if fp not in self.by_fingerprint:
+                if fp in self.previous:
+                    self.by_fingerprint[fp] = self.previous[fp]
+                else:
+                    pending.setdefault(fp, raw)
+            self.fingerprints.append(fp)
+
+        if pending:
+            normalized = self.normalize_many(list(pending.values()))
+            self.by_fingerprint.update(zip(pending, normalized))
+        self.entries.extend(self.by_fingerprint[fp] for fp in self.fingerprints[start:])
@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .records import ItemRecord
+
+# Numeric item attributes available for vectorized filtering, sorting and aggregates
+ITEM_NUMERIC_FIELDS = (
+    "value", "weight", "damage", "fire_rate", "accuracy", "range", "armor", "durability"
+)
+_STAT_FIELDS = {"damage", "fire_rate", "accuracy", "range", "armor", "durability"}
+
+
+def _read(item: ItemRecord, field: str) -> Optional[float]:
+    if field in _STAT_FIELDS:
+        return getattr(item.stats, field) if item.stats else None
+    return getattr(item, field)
+
+
+class ItemColumns:
+    """
+    Columnar snapshot of item numeric attributes.
+
+    Each field is a float64 array indexed by item ordinal, with missing
+    values stored as NaN and a boolean mask marking which values are present.
+    """
+
+    def __init__(self, items: List[ItemRecord]):
+        self.size = len(items)
+        self.data: Dict[str, np.ndarray] = {}
+        self.valid: Dict[str, np.ndarray] = {}
+        for field in ITEM_NUMERIC_FIELDS:
+            values = [_read(item, field) for item in items]
+            column = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            self.data[field] = column
+            self.valid[field] = ~np.isnan(column)
+
+    def update(self, ordinals: Iterable[int], items: List[ItemRecord]):
+        """Rewrite the rows of the given ordinals from the current items, in place."""
+        for ordinal in ordinals:
+            item = items[ordinal]
+            for field in ITEM_NUMERIC_FIELDS:
+                value = _read(item, field)
+                self.data[field][ordinal] = np.nan if value is None else value
+                self.valid[field][ordinal] = value is not None
+
+    def _column(self, field: str) -> np.ndarray:
+        if field not in self.data:
+            raise ValueError(f"Unknown numeric field: {field}")
+        return self.data[field]
+
+    def mask_between(self, field: str, low: Optional[float] = None,
+                     high: Optional[float] = None) -> np.ndarray:
+        """Boolean mask of items whose value lies in the inclusive range."""
+        column = self._column(field)
+        mask = self.valid[field].copy()
+        if low is not None:
+            mask &= column >= low
+        if high is not None:
+            mask &= column <= high
+        return mask
+
+    def ordinals_matching(self, ranges: Iterable[Tuple[str, Optional[float], Optional[float]]]) -> List[int]:
+        """Ordinals satisfying every (field, low, high) range."""
+        mask = np.ones(self.size, dtype=bool)
+        for field, low, high in ranges:
+            mask &= self.mask_between(field, low, high)
+        return np.flatnonzero(mask).tolist()
+
+    def sort_keys(self, field: str, ordinals: Iterable[int],
+                  descending: bool = False) -> Tuple[List[int], List[float]]:
+        """
+        Order ordinals by a field, missing values last, ties by ordinal.
+
+        Returns (ordinals, scores) where scores decrease along the order, as
+        pagination.SearchResult expects.
+        """
+        ordinals = np.fromiter(ordinals, dtype=np.int64)
+        values = self._column(field)[ordinals]
+        scores = values if descending else -values
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        order = np.lexsort((ordinals, -scores))
+        return ordinals[order].tolist(), scores[order].tolist()
+
+    def aggregate(self, ordinals: Optional[Iterable[int]] = None) -> Dict[str, dict]:
+        """Count, min, max and mean of every field across the given items."""
+        if ordinals is not None:
+            ordinals = np.fromiter(ordinals, dtype=np.int64)
+        summary = {}
+        for field in ITEM_NUMERIC_FIELDS:
+            column = self.data[field]
+            present = self.valid[field]
+            if ordinals is not None:
+                column, present = column[ordinals], present[ordinals]
+            values = column[present]
+            if values.size == 0:
+                summary[field] = {"count": 0, "min": None, "max": None, "mean": None}
+                continue
+            summary[field] = {
+                "count": int(values.size),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": round(float(values.mean()), 2),
+            }
+        return summary
@@ -1,131 +1,1259 @@
+import asyncio
+import hashlib
+import heapq
+import json
+import os
+import time
 import httpx
-from typing import Optional, List, Set
-from cachetools import TTLCache
+from collections import OrderedDict, deque
+from typing import Optional, List, Set, Dict, Iterable, Callable
+from cachetools import TTLCache, LRUCache
 from ..core.config import get_settings
-from ..models.items import Item, ItemStats, CraftingRecipe, RecycleYield
-from ..models.quests import Quest, QuestObjective, QuestReward
-from ..models.maps import GameMap, MapMarker, MapZone
+from ..models.items import Item, ItemStats
+from ..models.quests import Quest
+from ..models.maps import GameMap
 from ..models.loadouts import Weapon, ArmorPiece, WeaponMod
+from .indexes import TextIndex, FieldIndex, RangeIndex, TrigramIndex
+from .pagination import SearchResult, count_facets
+from .columns import ItemColumns, ITEM_NUMERIC_FIELDS
+from .changes import IncrementalNormalizer, diff_fingerprints
+from .ingest import IncompleteFetch, stream_page, total_pages
+from .merge import ITEM_FIELD_ALIASES, hedged, merge_records
+from .snapshot import decode_snapshot, encode_snapshot, read_snapshot, write_snapshot
+from .shared_cache import SharedCache
+from .upstream import CircuitBreaker, UpstreamClient
+from .normalize import normalize_batch, normalize_item, normalize_map, normalize_quest
+from .records import ItemRecord
 
 settings = get_settings()
 
-# In-memory cache (fallback when Redis unavailable)
-_items_cache: TTLCache = TTLCache(maxsize=1000, ttl=settings.cache_ttl_items)
-_events_cache: TTLCache = TTLCache(maxsize=100, ttl=settings.cache_ttl_events)
-_traders_cache: TTLCache = TTLCache(maxsize=50, ttl=settings.cache_ttl_traders)
-_quests_cache: TTLCache = TTLCache(maxsize=500, ttl=settings.cache_ttl_items)
-_maps_cache: TTLCache = TTLCache(maxsize=20, ttl=settings.cache_ttl_items)
+
+def _hard_ttl(soft_ttl: int, hard_ttl: int) -> int:
+    """How long entries stay in the cache at all: the hard TTL when serving stale data."""
+    return max(soft_ttl, hard_ttl) if settings.stale_while_revalidate else soft_ttl
+
+
+# In-process L1 cache; with redis_url set, Redis holds the shared L2 (see shared_cache.py)
+_items_cache: TTLCache = TTLCache(maxsize=1000, ttl=_hard_ttl(settings.cache_ttl_items, settings.cache_hard_ttl_items))
+_events_cache: TTLCache = TTLCache(maxsize=100, ttl=_hard_ttl(settings.cache_ttl_events, settings.cache_hard_ttl_events))
+_traders_cache: TTLCache = TTLCache(maxsize=50, ttl=_hard_ttl(settings.cache_ttl_traders, settings.cache_hard_ttl_traders))
+_quests_cache: TTLCache = TTLCache(maxsize=500, ttl=_hard_ttl(settings.cache_ttl_items, settings.cache_hard_ttl_items))
+_maps_cache: TTLCache = TTLCache(maxsize=20, ttl=_hard_ttl(settings.cache_ttl_items, settings.cache_hard_ttl_items))
+
+# Soft TTL per cache key: once exceeded, the entry is refreshed in the background
+_SOFT_TTLS = {
+    "all_items": settings.cache_ttl_items,
+    "all_quests": settings.cache_ttl_items,
+    "all_maps": settings.cache_ttl_items,
+    "events": settings.cache_ttl_events,
+    "traders": settings.cache_ttl_traders,
+}
 
 
 class ArcDataService:
     """Service for fetching Arc Raiders data from community APIs."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
-        self._all_items: List[Item] = []
+    # Upstream APIs, each with its own connection pool, retries and circuit breaker
+    UPSTREAMS = ("metaforge", "ardb", "raidtheory")
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.upstreams: Dict[str, UpstreamClient] = {
+            name: self._build_upstream(name, transport) for name in self.UPSTREAMS
+        }
+
+        # Bumped every time a dataset is reloaded; derived caches key on it
+        self.dataset_version = 0
+        self._versions: Dict[str, int] = {"items": 0, "quests": 0, "maps": 0, "events": 0, "traders": 0}
+        self._search_cache: LRUCache = LRUCache(maxsize=256)
+        self._digests: Dict[str, tuple] = {}
+
+        # Single-flight: concurrent cache misses for one key share a single load
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flight_stats: Dict[str, Dict[str, int]] = {}
+
+        # Stale-while-revalidate bookkeeping, per cache key
+        self._loaded_at: Dict[str, float] = {}
+        self._refresh_attempted_at: Dict[str, float] = {}
+        self._last_good: Dict[str, object] = {}
+
+        # Conditional upstream requests: validators per source, and which source
+        # each cached dataset was last normalized from
+        self._validators: Dict[str, dict] = {}
+        self._loaded_from: Dict[str, str] = {}
+        self._refresh_stats: Dict[str, Dict[str, int]] = {}
+
+        # Multi-source item merge: last good raw records and in-flight fetch per
+        # source, a counter of record deliveries (vs. the one last merged), the
+        # outcome of each source's latest fetch, and field provenance per item
+        self._source_records: Dict[str, List[dict]] = {}
+        self._source_fetches: Dict[str, asyncio.Future] = {}
+        self._source_generation = 0
+        self._merged_generation = -1
+        self._source_stats: Dict[str, dict] = {}
+        self._item_sources: Dict[str, Dict[str, str]] = {}
+
+        # Incremental refresh: normalized entries keyed by raw-record fingerprint,
+        # the fingerprint of each loaded ordinal, and id->fingerprint per dataset
+        self._item_entries: Dict[str, tuple] = {}
+        self._quest_entries: Dict[str, Quest] = {}
+        self._map_entries: Dict[str, GameMap] = {}
+        self._item_fingerprints: List[str] = []
+        self._quest_fingerprints: List[str] = []
+        self._map_fingerprints: List[str] = []
+        self._id_fingerprints: Dict[str, Dict[str, str]] = {"items": {}, "quests": {}, "maps": {}}
+        self.changelog: deque = deque(maxlen=100)
+        # id->fingerprint maps of recent contents of each dataset, by digest, for sync deltas
+        self._id_history: Dict[str, OrderedDict] = {dataset: OrderedDict() for dataset in self.SYNC_DATASETS}
+        self._change_listeners: List[Callable[[dict], None]] = []
+
+        # Items are held as compact records; models are built per response (see records.py)
+        self._all_items: List[ItemRecord] = []
         self._categories: Set[str] = set()
         self._rarities: Set[str] = set()
+        self._item_text_index = self._build_text_index([], self._item_text_fields)
+        self._item_field_indexes = self._build_field_indexes([], self.ITEM_FILTER_FIELDS)
+        self._item_value_index = RangeIndex()
+        self._item_columns = ItemColumns([])
+        self._all_quests: List[Quest] = []
+        self._quest_text_index = self._build_text_index([], self._quest_text_fields)
+        self._quest_field_indexes = self._build_field_indexes([], self.QUEST_FILTER_FIELDS)
+        self._all_maps: List[GameMap] = []
+        self._weapons: List[Weapon] = []
+        self._armor: List[ArmorPiece] = []
+
+        # Primary-key lookups, rebuilt alongside each cached collection
+        self._quests_by_id: Dict[str, Quest] = {}
+        self._maps_by_id: Dict[str, GameMap] = {}
+        self._weapons_by_id: Dict[str, Weapon] = {}
+        self._armor_by_id: Dict[str, ArmorPiece] = {}
+
+        # Related-items neighbourhoods, memoized per item for the loaded dataset
+        self._item_ordinals: Dict[str, int] = {}
+        self._item_groups = self._build_item_groups([])
+        self._item_quest_index = FieldIndex()
+        self._related: Dict[int, List[int]] = {}
+
+        # Typo-tolerant name indexes behind search suggestions
+        self._item_name_index = TrigramIndex()
+        self._quest_name_index = TrigramIndex()
+        self._marker_name_index = TrigramIndex()
+        self._marker_refs: List[tuple] = []
+
+        # On-disk snapshot, written shortly after any dataset changes
+        self._snapshot_task: Optional[asyncio.Future] = None
+        self.add_change_listener(self._schedule_snapshot)
+
+        # Redis L2 shared by all workers, and the shared version of each dataset held
+        self._shared: Optional[SharedCache] = None
+        self._shared_seen: Dict[str, Optional[int]] = {}
 
     async def close(self):
-        await self.client.aclose()
+        if self._snapshot_task is not None:
+            await self._snapshot_task
+        if self._shared is not None:
+            await self._shared.close()
+        for upstream in self.upstreams.values():
+            await upstream.aclose()
+
+    @staticmethod
+    def _build_upstream(name: str, transport: Optional[httpx.AsyncBaseTransport] = None) -> UpstreamClient:
+        return UpstreamClient(
+            name,
+            max_connections=settings.upstream_max_connections.get(name, 10),
+            timeout=httpx.Timeout(
+                settings.upstream_read_timeout,
+                connect=settings.upstream_connect_timeout,
+                pool=settings.upstream_pool_timeout
+            ),
+            retries=settings.upstream_retries,
+            backoff_base=settings.upstream_backoff_base,
+            backoff_max=settings.upstream_backoff_max,
+            breaker=CircuitBreaker(settings.breaker_failure_threshold, settings.breaker_reset_timeout),
+            http2=settings.upstream_http2,
+            transport=transport
+        )
+
+    def get_upstream_stats(self) -> Dict[str, dict]:
+        """Circuit breaker state and call, retry and failure counters per upstream."""
+        return {name: upstream.status() for name, upstream in self.upstreams.items()}
+
+    # Cache, cache key and records attribute of each snapshotted dataset
+    DATASET_CACHES = {
+        "items": (_items_cache, "all_items", "_all_items"),
+        "quests": (_quests_cache, "all_quests", "_all_quests"),
+        "maps": (_maps_cache, "all_maps", "_all_maps"),
+    }
+
+    # Attributes holding each dataset and its indexes, plus what conditional
+    # refreshes and the multi-source merge pick up from
+    DATASET_FIELDS = {
+        "items": (
+            "_all_items", "_item_entries", "_item_fingerprints", "_categories", "_rarities",
+            "_item_text_index", "_item_name_index", "_item_field_indexes", "_item_value_index",
+            "_item_columns", "_item_quest_index", "_item_groups", "_item_ordinals",
+            "_weapons", "_weapons_by_id", "_armor", "_armor_by_id",
+            "_source_records", "_source_generation", "_merged_generation", "_item_sources",
+        ),
+        "quests": (
+            "_all_quests", "_quest_entries", "_quest_fingerprints", "_quests_by_id",
+            "_quest_text_index", "_quest_name_index", "_quest_field_indexes",
+        ),
+        "maps": (
+            "_all_maps", "_map_entries", "_map_fingerprints", "_maps_by_id",
+            "_marker_refs", "_marker_name_index",
+        ),
+    }
+
+    # Snapshots are only read back by the same release with the same
+    # DATASET_FIELDS, so a snapshot of another layout is ignored, never misread
+    SNAPSHOT_TAG = "+".join([
+        settings.app_version,
+        hashlib.sha1(json.dumps(DATASET_FIELDS, sort_keys=True).encode()).hexdigest()[:12],
+    ])
+
+    # Cache, cache key and loader of every versioned dataset, for derived responses
+    VERSIONED = {
+        "items": (_items_cache, "all_items", "_load_items"),
+        "quests": (_quests_cache, "all_quests", "_load_quests"),
+        "maps": (_maps_cache, "all_maps", "_load_maps"),
+        "events": (_events_cache, "events", "_load_events"),
+        "traders": (_traders_cache, "traders", "_load_traders"),
+    }
+
+    def _dataset_state(self, dataset: str) -> dict:
+        """Everything needed to restore a dataset elsewhere, for snapshots and the shared cache."""
+        key = self.DATASET_CACHES[dataset][1]
+        return {
+            "fields": {name: getattr(self, name) for name in self.DATASET_FIELDS[dataset]},
+            "version": self._versions[dataset],
+            "id_fingerprints": self._id_fingerprints[dataset],
+            "loaded_from": self._loaded_from.get(key),
+            "validators": {
+                source: validators for source, validators in self._validators.items()
+                if source.endswith(f":{dataset}")
+            },
+            "saved_at": time.time(),
+        }
+
+    def _apply_dataset_state(self, dataset: str, state: dict, announce: bool = True):
+        """
+        Swap in a dataset and its indexes from _dataset_state, as if just loaded.
+
+        With `announce`, what changed is published like a reload's
+        (see _record_changes); a snapshot loaded at startup has nothing to
+        invalidate and is not announced.
+        """
+        cache, key, records_field = self.DATASET_CACHES[dataset]
+        for name, value in state["fields"].items():
+            setattr(self, name, value)
+        self._versions[dataset] = state["version"]
+        self.dataset_version = max(self.dataset_version, state["version"])
+        if announce:
+            self._publish_changes(dataset, state["id_fingerprints"])
+        else:
+            self._id_fingerprints[dataset] = state["id_fingerprints"]
+            self._retain_contents(dataset)
+        if state["loaded_from"]:
+            self._loaded_from[key] = state["loaded_from"]
+        self._validators.update(state["validators"])
+        self._search_cache.clear()
+        if dataset == "items":
+            self._related = {}
+
+        records = getattr(self, records_field)
+        if records:
+            self._store(cache, key, records)
+            # Age the entry by the snapshot's age so it is revalidated on schedule
+            self._loaded_at[key] -= max(0.0, time.time() - state["saved_at"])
+
+    def load_snapshot(self) -> bool:
+        """Restore datasets and indexes from the on-disk snapshot. Returns whether one was loaded."""
+        if not settings.snapshot_path:
+            return False
+        try:
+            state = read_snapshot(settings.snapshot_path, self.SNAPSHOT_TAG)
+            if state is None:
+                return False
+            for dataset, dataset_state in state.items():
+                self._apply_dataset_state(dataset, dataset_state, announce=False)
+        except Exception as e:
+            # Startup falls back to preload(), which reloads every dataset
+            print(f"Snapshot load error: {e}")
+            return False
+        return True
+
+    def _schedule_snapshot(self, change: Optional[dict] = None):
+        """Write the snapshot soon, once for a burst of dataset changes."""
+        if settings.snapshot_path and self._snapshot_task is None:
+            self._snapshot_task = asyncio.ensure_future(self._save_snapshot())
+
+    async def _save_snapshot(self):
+        try:
+            await asyncio.sleep(settings.snapshot_delay)
+            # Encode on the event loop so no refresh patches the state mid-way
+            state = {dataset: self._dataset_state(dataset) for dataset in self.DATASET_CACHES}
+            data = encode_snapshot(state, self.SNAPSHOT_TAG)
+            await asyncio.to_thread(write_snapshot, settings.snapshot_path, data)
+        except Exception as e:
+            print(f"Snapshot save error: {e}")
+        finally:
+            self._snapshot_task = None
+
+    # ===== SHARED CACHE =====
+
+    async def start_shared_cache(self):
+        """Connect the Redis L2 when redis_url is set; without it each worker caches alone."""
+        if not settings.redis_url:
+            return
+        if not settings.redis_secret:
+            print("redis_url is set without redis_secret, using the in-process cache only")
+            return
+        shared = SharedCache(settings.redis_url, settings.redis_lock_timeout, settings.redis_secret)
+        try:
+            await shared.connect(self._on_shared_message)
+        except Exception as e:
+            print(f"Redis unavailable, using the in-process cache only: {e}")
+            await shared.close()
+            return
+        self._shared = shared
+
+    def get_shared_cache_stats(self) -> dict:
+        """Whether the Redis L2 is in use, and the shared version of each dataset held."""
+        return {
+            "enabled": self._shared is not None,
+            "worker": self._shared.worker_id if self._shared else None,
+            "versions": dict(self._shared_seen),
+        }
+
+    async def _adopt_shared(self, dataset: str, version: Optional[int] = None) -> bool:
+        """Swap in a shared snapshot of a dataset (the latest by default) unless it is already held."""
+        if version is None:
+            version = await self._shared.current_version(dataset)
+        if version is None or version == self._shared_seen.get(dataset):
+            return False
+        data = await self._shared.get(dataset, version)
+        if data is None:
+            return False
+        # A writable copy, so numpy columns can be patched in place later
+        state = decode_snapshot(memoryview(bytearray(data)), self.SNAPSHOT_TAG)
+        if state is None:
+            return False
+        state["version"] = version
+        self._apply_dataset_state(dataset, state)
+        self._shared_seen[dataset] = version
+        return True
+
+    async def _on_shared_message(self, announcement: dict):
+        """Follow another worker's refresh: swap in its new snapshot, or just its freshness."""
+        dataset = announcement.get("dataset")
+        if dataset not in self.DATASET_CACHES:
+            return
+        if announcement["version"] != self._shared_seen.get(dataset):
+            await self._adopt_shared(dataset, announcement["version"])
+            return
+        # Refreshed elsewhere and unchanged: that counts as our refresh too
+        key = self.DATASET_CACHES[dataset][1]
+        if key in self._loaded_at:
+            age = max(0.0, time.time() - announcement["published_at"])
+            self._loaded_at[key] = time.monotonic() - age
+
+    async def _load_coordinated(self, key: str, load):
+        """
+        Run a dataset load so that only one worker cluster-wide refreshes it.
+
+        Without the Redis L2 this is just `load()`. Otherwise a newer shared
+        snapshot is adopted instead of fetching; failing that, the worker
+        holding the dataset's lock loads from upstream and publishes the
+        result, while the others wait for that publication.
+        """
+        dataset = next((name for name, (_, k, _) in self.DATASET_CACHES.items() if k == key), None)
+        if self._shared is None or dataset is None:
+            return await load()
+        records_field = self.DATASET_CACHES[dataset][2]
+
+        try:
+            if await self._adopt_shared(dataset):
+                return getattr(self, records_field)
+            lock = await self._shared.acquire_lock(dataset)
+            if lock is None:
+                await self._shared.wait_unlocked(dataset, settings.redis_lock_timeout)
+                if await self._adopt_shared(dataset):
+                    return getattr(self, records_field)
+                # The other worker's refresh found nothing new, or failed
+                if time.monotonic() - self._loaded_at.get(key, float("-inf")) <= _SOFT_TTLS[key]:
+                    return getattr(self, records_field)
+                return await load()
+        except Exception as e:
+            print(f"Shared cache error: {e}")
+            return await load()
+
+        try:
+            version, loaded_at = self._versions[dataset], self._loaded_at.get(key)
+            records = await load()
+            if self._loaded_at.get(key) != loaded_at:
+                await self._publish_shared(dataset, changed=self._versions[dataset] != version)
+            return records
+        finally:
+            await self._shared.release_lock(lock)
+
+    async def _publish_shared(self, dataset: str, changed: bool):
+        """Publish a dataset this worker just refreshed, or only its freshness when unchanged."""
+        try:
+            data = encode_snapshot(self._dataset_state(dataset), self.SNAPSHOT_TAG) if changed else None
+            # Kept in Redis as long as the dataset's own local cache keeps it
+            ttl = int(self.VERSIONED[dataset][0].ttl)
+            version = await self._shared.publish(dataset, data, ttl)
+        except Exception as e:
+            print(f"Shared cache publish error: {e}")
+            return
+        if changed:
+            # Adopt the cluster-wide version number so every worker agrees on it
+            self._versions[dataset] = version
+            self.dataset_version = max(self.dataset_version, version)
+            self._search_cache.clear()
+        self._shared_seen[dataset] = version
+
+    def refresh_in_background(self):
+        """Start reloading every dataset from upstream without waiting for it."""
+        for key, load in (
+            ("all_items", self._load_items),
+            ("all_quests", self._load_quests),
+            ("all_maps", self._load_maps),
+            ("events", self._load_events),
+            ("traders", self._load_traders),
+        ):
+            if key not in self._inflight:
+                self._start_flight(key, load)
+
+    async def preload(self) -> Dict[str, dict]:
+        """
+        Load every dataset concurrently, each within its startup budget.
+
+        A source that errors or runs over budget is reported; an over-budget
+        load keeps running in the background. Returns per-source status, record count and
+        elapsed seconds.
+        """
+        loaders = {
+            "items": self.get_all_items,
+            "quests": self.get_all_quests,
+            "maps": self.get_all_maps,
+            "events": self.fetch_events,
+            "traders": self.fetch_traders,
+        }
+
+        async def timed(source: str, loader) -> dict:
+            started = time.perf_counter()
+            budget = settings.startup_budgets.get(source)
+            try:
+                records = await asyncio.wait_for(loader(), timeout=budget)
+                status = "ok" if records else "empty"
+                count = len(records)
+            except asyncio.TimeoutError:
+                status, count = "timeout", 0
+            except Exception as e:
+                print(f"Preload {source} error: {e}")
+                status, count = "error", 0
+            return {
+                "status": status,
+                "records": count,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+
+        results = await asyncio.gather(*(timed(source, loader) for source, loader in loaders.items()))
+        return dict(zip(loaders, results))
+
+    async def _single_flight(self, key: str, load):
+        """
+        Run `load()` once for all concurrent callers of the same key.
+
+        The first caller starts the load and later callers await the same
+        result. The load is shielded, so a caller that gives up (e.g. a
+        startup budget expiring) does not cancel it for everyone else.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_flight(key, load)
+        else:
+            self._flight_stats[key]["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _start_flight(self, key: str, load) -> asyncio.Future:
+        stats = self._flight_stats.setdefault(key, {"loads": 0, "coalesced": 0})
+        stats["loads"] += 1
+        task = asyncio.ensure_future(self._load_coordinated(key, load))
+        self._inflight[key] = task
+
+        def finished(done: asyncio.Future):
+            self._inflight.pop(key, None)
+            if not done.cancelled() and done.exception():
+                print(f"Load {key} error: {done.exception()}")
+
+        task.add_done_callback(finished)
+        return task
+
+    def _revalidate_if_stale(self, key: str, load):
+        """
+        Start a background refresh once a cached entry is past its soft TTL.
+
+        Callers keep getting the cached value meanwhile. Attempts are spaced
+        by cache_refresh_retry so a failing upstream is not hammered; a failed
+        refresh leaves the last good snapshot in place.
+        """
+        if not settings.stale_while_revalidate or key in self._inflight:
+            return
+        now = time.monotonic()
+        if now - self._loaded_at.get(key, now) <= _SOFT_TTLS[key]:
+            return
+        if now - self._refresh_attempted_at.get(key, 0.0) < settings.cache_refresh_retry:
+            return
+        self._refresh_attempted_at[key] = now
+        self._start_flight(key, load)
+
+    def _store(self, cache: TTLCache, key: str, value):
+        """Cache a freshly loaded dataset and keep it as the last good snapshot."""
+        cache[key] = value
+        self._loaded_at[key] = time.monotonic()
+        self._last_good[key] = value
+
+    def _keep_last_good(self, cache: TTLCache, key: str):
+        """
+        After a failed load: cache the last good snapshot again and return it.
+
+        Its _loaded_at is left as it was, so it stays stale and background
+        refreshes keep retrying it, spaced by cache_refresh_retry, instead of
+        every request past the hard TTL reloading inline from a dead upstream.
+        """
+        if key not in self._last_good:
+            return []
+        cache[key] = self._last_good[key]
+        self._refresh_attempted_at[key] = time.monotonic()
+        return self._last_good[key]
+
+    def get_digests(self, datasets: Iterable[str]) -> tuple:
+        """Current digest of each of the given datasets (see VERSIONED and get_digest)."""
+        return tuple(self.get_digest(dataset) for dataset in datasets)
+
+    # Per-record fingerprints of each snapshotted dataset, in load order
+    FINGERPRINT_FIELDS = {"items": "_item_fingerprints", "quests": "_quest_fingerprints", "maps": "_map_fingerprints"}
+
+    def get_digest(self, dataset: str) -> str:
+        """
+        Digest of a dataset's current contents, memoized per loaded payload.
+
+        Unlike versions, digests agree between workers and across restarts,
+        so they can back HTTP validators and sync cursors.
+        """
+        if dataset in self.FINGERPRINT_FIELDS:
+            source = getattr(self, self.FINGERPRINT_FIELDS[dataset])
+        else:
+            source = self._last_good.get(self.VERSIONED[dataset][1])
+        # Keyed on the object, not the version: a version adopted from the
+        # shared cache may repeat a number this worker already used
+        memo = self._digests.get(dataset)
+        if memo is not None and memo[0] is source:
+            return memo[1]
+        if dataset in self.FINGERPRINT_FIELDS:
+            basis = "\n".join(source)
+        else:
+            basis = json.dumps(source, sort_keys=True)
+        digest = hashlib.sha256(basis.encode()).hexdigest()[:16]
+        self._digests[dataset] = (source, digest)
+        return digest
+
+    def touch(self, dataset: str) -> bool:
+        """
+        Whether a dataset is cached, for callers serving something derived from it.
+
+        Starts a background refresh when it is past its soft TTL, as reading
+        it through get_all_* would. False means the next read reloads it.
+        """
+        cache, key, load = self.VERSIONED[dataset]
+        if key not in cache:
+            return False
+        self._revalidate_if_stale(key, getattr(self, load))
+        return True
+
+    def freshness(self, dataset: str) -> int:
+        """Seconds until a dataset is due for a refresh (0 once it is stale or not loaded)."""
+        key = self.VERSIONED[dataset][1]
+        loaded_at = self._loaded_at.get(key)
+        if loaded_at is None:
+            return 0
+        return max(0, int(_SOFT_TTLS[key] - (time.monotonic() - loaded_at)))
+
+    def get_single_flight_stats(self) -> Dict[str, dict]:
+        """Loads started and callers coalesced onto an in-flight load, per cache key."""
+        return {
+            key: {**stats, "in_flight": key in self._inflight}
+            for key, stats in self._flight_stats.items()
+        }
+
+    def add_change_listener(self, listener: Callable[[dict], None]):
+        """Call `listener` with each changelog entry, for targeted cache invalidation."""
+        self._change_listeners.append(listener)
+
+    def _record_changes(self, dataset: str, records: list, fingerprints: List[str]) -> Optional[dict]:
+        """Diff a reloaded dataset against the previous load and publish the changelog entry."""
+        return self._publish_changes(dataset, {record.id: fp for record, fp in zip(records, fingerprints)})
+
+    def _publish_changes(self, dataset: str, new_ids: Dict[str, str]) -> Optional[dict]:
+        """Diff new id->fingerprint pairs against the held ones; log and announce any change."""
+        changes = diff_fingerprints(self._id_fingerprints[dataset], new_ids)
+        self._id_fingerprints[dataset] = new_ids
+        self._retain_contents(dataset)
+        if not any(changes.values()):
+            return None
+        entry = {"dataset": dataset, "version": self._versions[dataset], **changes}
+        self.changelog.append(entry)
+        for listener in self._change_listeners:
+            listener(entry)
+        return entry
+
+    def _retain_contents(self, dataset: str):
+        """Keep the current id->fingerprint map of a dataset, dropping the oldest past the limit."""
+        history = self._id_history[dataset]
+        digest = self.get_digest(dataset)
+        history.pop(digest, None)
+        history[digest] = self._id_fingerprints[dataset]
+        while len(history) > settings.sync_retained_versions:
+            history.popitem(last=False)
+
+    def _bump_version(self, dataset: str):
+        """Record that a dataset was reloaded, dropping results derived from the old one."""
+        self.dataset_version += 1
+        self._versions[dataset] = self.dataset_version
+        self._search_cache.clear()
+
+    async def _get_json(self, source: str, url: str, params: Optional[dict] = None,
+                        conditional: bool = False):
+        """
+        GET a JSON payload and remember its validators for the next request.
+
+        With `conditional`, sends If-None-Match/If-Modified-Since from the
+        previous response and returns None when the upstream answers 304 or
+        the body hashes the same as last time.
+        """
+        previous = self._validators.get(source, {})
+        headers = {}
+        if conditional:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        upstream = self.upstreams[source.split(":")[0]]
+        response = await upstream.get(url, params=params, headers=headers)
+        if conditional and response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        digest = hashlib.sha256(response.content).hexdigest()
+        self._validators[source] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "hash": digest,
+        }
+        if conditional and digest == previous.get("hash"):
+            return None
+        return response.json()
+
+    async def _read_local_json(self, source: str, path: str, conditional: bool = False):
+        """
+        Read a JSON payload from disk, the offline counterpart of _get_json.
+
+        A directory is read as one record per *.json file (files holding a
+        list contribute every element). Returns None when `conditional` and
+        the contents hash the same as last time.
+        """
+        def read() -> tuple:
+            digest = hashlib.sha256()
+            if not os.path.isdir(path):
+                with open(path, "rb") as f:
+                    content = f.read()
+                digest.update(content)
+                return digest.hexdigest(), json.loads(content)
+            records = []
+            for name in sorted(os.listdir(path)):
+                if not name.endswith(".json"):
+                    continue
+                with open(os.path.join(path, name), "rb") as f:
+                    content = f.read()
+                digest.update(content)
+                data = json.loads(content)
+                records.extend(data if isinstance(data, list) else [data])
+            return digest.hexdigest(), records
+
+        digest, data = await asyncio.to_thread(read)
+        previous = self._validators.get(source, {})
+        self._validators[source] = {"hash": digest}
+        if conditional and digest == previous.get("hash"):
+            return None
+        return data
+
+    async def _fetch_paged(self, source: str, url: str, key: str, conditional: bool = False,
+                           on_page: Optional[Callable[[List[dict]], None]] = None) -> Optional[List[dict]]:
+        """
+        Fetch every page of a paginated upstream collection.
+
+        The first page reveals the page count; the rest are requested
+        concurrently, at most ingest_concurrency at a time, and each page is
+        decoded while its body streams in. Pages are passed to `on_page` in
+        order as soon as they and all earlier pages have arrived. Returns None
+        when the collection is unchanged since the last fetch (see _get_json).
+
+        Raises IncompleteFetch, holding the records that were fetched, when
+        ingest_max_pages cuts the collection short.
+        """
+        page_size = settings.ingest_page_size
+        max_pages = settings.ingest_max_pages
+        previous = self._validators.get(source, {})
+        headers = {}
+        # HTTP validators only describe the whole collection when it fit on one page
+        if conditional and previous.get("pages") == 1:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        upstream = self.upstreams[source.split(":")[0]]
+
+        def page_request(number: int, headers: Optional[dict] = None):
+            params = {"page": number, "limit": page_size}
+            return lambda client: stream_page(client, url, key, params, headers)
+
+        first = await upstream.call(page_request(1, headers))
+        if first is None:
+            return None
+        pages = [first]
+        if on_page:
+            on_page(first.records)
+
+        async def fetch(number: int):
+            page = await upstream.call(page_request(number))
+            if page is None:
+                raise ValueError(f"Unexpected 304 for page {number}")
+            return page
+
+        count = total_pages(first.meta, page_size)
+        if len(first.records) > page_size:
+            # Upstream ignored the page size and sent everything
+            count = 1
+        elif count == 1 and len(first.records) == page_size:
+            # A full page claimed to be the only one: don't trust it, probe on
+            count = None
+
+        truncated = None
+        if count is None:
+            # No pagination metadata: keep going while pages come back full,
+            # stopping if the upstream ignores `page` and repeats itself
+            while len(pages[-1].records) >= page_size:
+                if len(pages) >= max_pages:
+                    truncated = f"{len(pages)}+ pages"
+                    break
+                page = await fetch(len(pages) + 1)
+                if page.digest == pages[-1].digest:
+                    break
+                pages.append(page)
+                if on_page:
+                    on_page(page.records)
+        elif count > 1:
+            semaphore = asyncio.Semaphore(settings.ingest_concurrency)
+
+            async def fetch_bounded(number: int):
+                async with semaphore:
+                    return await fetch(number)
+
+            tasks = [
+                asyncio.ensure_future(fetch_bounded(number))
+                for number in range(2, min(count, max_pages) + 1)
+            ]
+            if count > max_pages:
+                truncated = f"{count} pages"
+            try:
+                for task in tasks:
+                    page = await task
+                    pages.append(page)
+                    if on_page:
+                        on_page(page.records)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        records = [record for page in pages for record in page.records]
+        if truncated:
+            # Not the whole collection: no validators, so the next fetch
+            # can't mistake it for the complete one
+            self._validators.pop(source, None)
+            raise IncompleteFetch(
+                f"{source} stopped at ingest_max_pages={max_pages} of {truncated}", records
+            )
 
-    async def fetch_items_from_metaforge(self) -> List[dict]:
-        """Fetch items from MetaForge API."""
+        digest = first.digest
+        if len(pages) > 1:
+            digest = hashlib.sha256("".join(page.digest for page in pages).encode()).hexdigest()
+        self._validators[source] = {
+            "etag": first.etag,
+            "last_modified": first.last_modified,
+            "hash": digest,
+            "pages": len(pages),
+        }
+        if conditional and digest == previous.get("hash"):
+            return None
+        return records
+
+    def _record_refresh(self, key: str, changed: bool):
+        stats = self._refresh_stats.setdefault(key, {"changed": 0, "unchanged": 0})
+        stats["changed" if changed else "unchanged"] += 1
+
+    def get_refresh_stats(self) -> Dict[str, dict]:
+        """Refreshes that found new data vs. were short-circuited as unchanged, per cache key."""
+        return {
+            key: {**stats, "source": self._loaded_from.get(key)}
+            for key, stats in self._refresh_stats.items()
+        }
+
+    async def fetch_items_from_metaforge(self, conditional: bool = False) -> Optional[List[dict]]:
+        """Fetch all pages of items from MetaForge API. Returns None if unchanged (see _fetch_paged)."""
         try:
-            response = await self.client.get(
+            return await self._fetch_paged(
+                "metaforge:items",
                 f"{settings.metaforge_api_url}/items",
-                params={"limit": 1000}
+                "items",
+                conditional=conditional
             )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("items", data) if isinstance(data, dict) else data
+        except IncompleteFetch as e:
+            # Only good enough when there is nothing better: replacing a full
+            # load with it would read as the cut-off records being removed
+            print(f"MetaForge API warning: {e}")
+            return [] if conditional else e.records
         except Exception as e:
             print(f"MetaForge API error: {e}")
             return []
 
-    async def fetch_items_from_ardb(self) -> List[dict]:
-        """Fetch items from ARDB API (backup source)."""
+    async def fetch_items_from_ardb(self, conditional: bool = False) -> Optional[List[dict]]:
+        """Fetch items from ARDB API. Returns None if unchanged."""
         try:
-            response = await self.client.get(f"{settings.ardb_api_url}/items")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json("ardb:items", f"{settings.ardb_api_url}/items", conditional=conditional)
+            if data is None:
+                return None
             return data.get("items", data) if isinstance(data, dict) else data
         except Exception as e:
             print(f"ARDB API error: {e}")
             return []
 
+    async def fetch_items_from_raidtheory(self, conditional: bool = False) -> Optional[List[dict]]:
+        """Fetch items from the RaidTheory data repository. Returns None if unchanged."""
+        try:
+            if settings.raidtheory_local_path:
+                data = await self._read_local_json(
+                    "raidtheory:items",
+                    os.path.join(settings.raidtheory_local_path, settings.raidtheory_items_path),
+                    conditional=conditional
+                )
+            else:
+                data = await self._get_json(
+                    "raidtheory:items",
+                    f"{settings.raidtheory_github_url}/{settings.raidtheory_items_path}",
+                    conditional=conditional
+                )
+            if data is None:
+                return None
+            records = data.get("items", data) if isinstance(data, dict) else data
+            return [self._delocalize(raw) for raw in records if isinstance(raw, dict)]
+        except Exception as e:
+            print(f"RaidTheory data error: {e}")
+            return []
+
+    @staticmethod
+    def _delocalize(raw: dict) -> dict:
+        """Replace localized {"en": ..., "de": ...} values with their English text."""
+        return {
+            key: value["en"] if isinstance(value, dict) and "en" in value else value
+            for key, value in raw.items()
+        }
+
     def _normalize_item(self, raw: dict, source: str) -> Item:
         """Normalize item data from different sources into unified format."""
-        # Handle different field names from different APIs
-        item_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
-
-        stats = None
-        if raw.get("stats"):
-            stats = ItemStats(**raw["stats"])
-
-        crafting = None
-        if raw.get("crafting") or raw.get("recipe"):
-            craft_data = raw.get("crafting") or raw.get("recipe", {})
-            crafting = CraftingRecipe(
-                result_quantity=craft_data.get("result_quantity", 1),
-                ingredients=craft_data.get("ingredients", {}),
-                crafting_time=craft_data.get("time"),
-                required_hideout_level=craft_data.get("hideout_level")
-            )
-
-        recycle = None
-        if raw.get("recycle") or raw.get("recycling"):
-            recycle_data = raw.get("recycle") or raw.get("recycling", {})
-            recycle = RecycleYield(materials=recycle_data.get("materials", recycle_data))
-
-        return Item(
-            id=str(item_id),
-            name=raw.get("name", "Unknown"),
-            description=raw.get("description") or raw.get("desc"),
-            category=raw.get("category", "misc"),
-            subcategory=raw.get("subcategory") or raw.get("type"),
-            rarity=raw.get("rarity") or raw.get("tier"),
-            weight=raw.get("weight"),
-            value=raw.get("value") or raw.get("price"),
-            stats=stats,
-            crafting=crafting,
-            recycle=recycle,
-            traders=raw.get("traders", []),
-            quest_requirements=raw.get("quests", []),
-            image_url=raw.get("image") or raw.get("icon")
+        return normalize_item(raw)
+
+    # ===== SEARCH INDEXES =====
+
+    # Name hits rank above description hits
+    TEXT_FIELD_WEIGHTS = {"name": 3.0, "description": 1.0}
+
+    @staticmethod
+    def _item_text_fields(item: ItemRecord) -> dict:
+        return {"name": item.name, "description": item.description}
+
+    @staticmethod
+    def _quest_text_fields(quest: Quest) -> dict:
+        return {"name": quest.name, "description": quest.description}
+
+    def _build_text_index(self, records: list, fields) -> TextIndex:
+        """Build a full-text index over a freshly loaded collection."""
+        index = TextIndex(self.TEXT_FIELD_WEIGHTS)
+        for ordinal, record in enumerate(records):
+            index.add(ordinal, fields(record))
+        return index
+
+    @staticmethod
+    def _index_by_id(records: list) -> dict:
+        """Map ids to records, keeping the first record when ids repeat."""
+        return {record.id: record for record in reversed(records)}
+
+    @staticmethod
+    def _build_name_index(records: list) -> TrigramIndex:
+        index = TrigramIndex()
+        for ordinal, record in enumerate(records):
+            index.add(ordinal, record.name)
+        return index
+
+    # Item fields with equality filters, mapped to the values each item carries
+    ITEM_FILTER_FIELDS = {
+        "category": lambda item: (item.category,),
+        "subcategory": lambda item: (item.subcategory,),
+        "rarity": lambda item: (item.rarity,),
+        "trader": lambda item: item.traders,
+    }
+
+    ITEM_FACET_FIELDS = {
+        "category": ITEM_FILTER_FIELDS["category"],
+        "rarity": ITEM_FILTER_FIELDS["rarity"],
+        "trader": ITEM_FILTER_FIELDS["trader"],
+    }
+
+    QUEST_FILTER_FIELDS = {
+        "giver": lambda quest: (quest.giver,),
+        "type": lambda quest: (quest.type,),
+        "location": lambda quest: (quest.location,),
+    }
+
+    @staticmethod
+    def _build_field_indexes(records: list, fields: dict) -> dict:
+        """Build posting sets for every filterable field of a collection."""
+        indexes = {field: FieldIndex() for field in fields}
+        for ordinal, record in enumerate(records):
+            for field, values in fields.items():
+                indexes[field].add(ordinal, values(record))
+        return indexes
+
+    @staticmethod
+    def _intersect_filters(indexes: dict, filters: dict) -> Optional[Set[int]]:
+        """
+        Intersect the posting sets of all active filters, smallest first.
+
+        Returns None when no filter is active, meaning every record matches.
+        """
+        postings = sorted(
+            (indexes[field].get(value) for field, value in filters.items() if value),
+            key=len
         )
+        if not postings:
+            return None
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+        return candidates
+
+    @staticmethod
+    def _rank(candidates: Optional[Set[int]], ranked: list, size: int) -> SearchResult:
+        """Order matching ordinals by relevance when ranked, otherwise by collection order."""
+        if ranked:
+            matches = [(o, score) for o, score in ranked if candidates is None or o in candidates]
+            return SearchResult([o for o, _ in matches], [score for _, score in matches])
+        if candidates is None:
+            return SearchResult(range(size))
+        return SearchResult(sorted(candidates))
+
+    def _build_item_value_index(self, items: List[ItemRecord]) -> RangeIndex:
+        index = RangeIndex()
+        for ordinal, item in enumerate(items):
+            # Items without a value never match a value range
+            if item.value:
+                index.add(ordinal, item.value)
+        return index
+
+    # ===== RELATED ITEMS =====
+
+    # Score for each attribute two items share; sharing a quest scores RELATED_QUEST_SCORE
+    RELATED_FIELD_SCORES = {"category": 2, "subcategory": 1, "rarity": 1}
+    RELATED_QUEST_SCORE = 3
+    RELATED_MAX = 20
+
+    def _build_item_groups(self, items: List[ItemRecord]) -> dict:
+        """Group item ordinals by each related-items field, including missing values."""
+        groups = {field: {} for field in self.RELATED_FIELD_SCORES}
+        for ordinal, item in enumerate(items):
+            for field, by_value in groups.items():
+                by_value.setdefault(getattr(item, field), []).append(ordinal)
+        return groups
+
+    def _compute_related(self, ordinal: int) -> List[int]:
+        """Score every item sharing an attribute or quest and keep the best RELATED_MAX."""
+        item = self._all_items[ordinal]
+        scores: Dict[int, int] = {}
+
+        for field, score in self.RELATED_FIELD_SCORES.items():
+            for other in self._item_groups[field].get(getattr(item, field), ()):
+                scores[other] = scores.get(other, 0) + score
+
+        # Only items that share a quest get the quest bonus, once per pair
+        sharing_quest = set()
+        for quest_id in set(item.quest_requirements):
+            sharing_quest |= self._item_quest_index.get(quest_id)
+        for other in sharing_quest:
+            scores[other] = scores.get(other, 0) + self.RELATED_QUEST_SCORE
+
+        candidates = (
+            (score, other) for other, score in scores.items()
+            if self._all_items[other].id != item.id
+        )
+        # Highest score first, ties keep collection order
+        best = heapq.nsmallest(self.RELATED_MAX, candidates, key=lambda pair: (-pair[0], pair[1]))
+        return [other for _, other in best]
 
-    async def get_all_items(self, force_refresh: bool = False) -> List[Item]:
-        """Get all items, using cache when available."""
+    async def get_related_items(self, item_id: str, limit: int = 5) -> Optional[List[Item]]:
+        """Get items related to this one, or None if the item does not exist."""
+        await self.get_all_items()
+        ordinal = self._item_ordinals.get(item_id)
+        if ordinal is None:
+            return None
+
+        related = self._related.get(ordinal)
+        if related is None:
+            related = self._related[ordinal] = self._compute_related(ordinal)
+        return [self._all_items[other].to_model() for other in related[:limit]]
+
+    async def get_all_items(self, force_refresh: bool = False) -> List[ItemRecord]:
+        """Get all items as compact records, using cache when available."""
         cache_key = "all_items"
 
         if not force_refresh and cache_key in _items_cache:
+            self._revalidate_if_stale(cache_key, self._load_items)
             return _items_cache[cache_key]
 
-        # Try MetaForge first, fall back to ARDB
-        raw_items = await self.fetch_items_from_metaforge()
-        source = "metaforge"
+        return await self._single_flight(cache_key, self._load_items)
+
+    # Item sources, each fetched by its fetch_items_from_<source> method
+    ITEM_SOURCES = ("metaforge", "ardb", "raidtheory")
+
+    def _fetch_item_source(self, source: str) -> asyncio.Future:
+        """Start, or join the in-flight, hedged fetch of one item source."""
+        task = self._source_fetches.get(source)
+        if task is not None:
+            return task
+
+        fetch = getattr(self, f"fetch_items_from_{source}")
+        # A source we already hold records from only needs to say whether they changed
+        conditional = source in self._source_records
+        started = time.perf_counter()
+
+        async def run():
+            records = await hedged(lambda: fetch(conditional=conditional), settings.merge_hedge_after)
+            if records:
+                self._source_records[source] = records
+                self._source_generation += 1
+            self._source_stats[source] = {
+                "status": "unchanged" if records is None else "ok" if records else "error",
+                "records": len(self._source_records.get(source, ())),
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+            return records
+
+        task = asyncio.ensure_future(run())
+        self._source_fetches[source] = task
+        task.add_done_callback(lambda _: self._source_fetches.pop(source, None))
+        return task
+
+    def get_source_stats(self) -> Dict[str, dict]:
+        """Outcome of the latest fetch of each item source."""
+        return dict(self._source_stats)
+
+    async def get_item_sources(self, item_id: str) -> Optional[Dict[str, str]]:
+        """Get which source each field of an item came from, or None if the item does not exist."""
+        await self.get_all_items()
+        return self._item_sources.get(item_id)
 
-        if not raw_items:
-            raw_items = await self.fetch_items_from_ardb()
-            source = "ardb"
+    async def _load_items(self) -> List[ItemRecord]:
+        """Fetch, merge and normalize items from every source, patching derived indexes from the diff."""
+        cache_key = "all_items"
 
-        if not raw_items:
-            # Return cached items if available, even if expired
-            return self._all_items if self._all_items else []
+        # Fetch every source at once and merge whatever arrived by the deadline.
+        # A source that is late, failed or unchanged contributes its last good
+        # records; a late fetch keeps running and lands in the next refresh.
+        sources = [source for source in settings.merge_sources if source in self.ITEM_SOURCES]
+        fetches = {source: self._fetch_item_source(source) for source in sources}
+        if fetches:
+            await asyncio.wait(fetches.values(), timeout=settings.merge_deadline)
+        for source, task in fetches.items():
+            if not task.done():
+                self._source_stats[source] = {**self._source_stats.get(source, {}), "status": "late"}
+
+        if self._all_items and self._source_generation == self._merged_generation:
+            # No source delivered new records: keep every derived index as it is
+            self._record_refresh(cache_key, changed=False)
+            self._store(_items_cache, cache_key, self._all_items)
+            return self._all_items
+
+        records_by_source = {source: self._source_records.get(source) for source in sources}
+        if not any(records_by_source.values()):
+            # Keep serving the last good items, even if expired
+            return self._keep_last_good(_items_cache, cache_key)
+        self._merged_generation = self._source_generation
+
+        merged = merge_records(records_by_source, sources, settings.merge_field_precedence, ITEM_FIELD_ALIASES)
+
+        # Only merged records with a new fingerprint get normalized, the rest are
+        # reused. A large batch is normalized off the event loop.
+        normalizer = IncrementalNormalizer(
+            self._item_entries,
+            lambda raw: self._item_entry(raw, "merged"),
+            normalize_many=self._item_entries_many
+        )
+        await asyncio.to_thread(normalizer.add, [record for record, _ in merged])
+        entries, fingerprints = normalizer.entries, normalizer.fingerprints
+        self._item_entries = normalizer.by_fingerprint
+        self._item_sources = {
+            item.id: provenance
+            for (item, _, _), (_, provenance) in reversed(list(zip(entries, merged)))
+        }
+        self._loaded_from[cache_key] = "+".join(source for source in sources if records_by_source[source])
+        if fingerprints == self._item_fingerprints:
+            self._record_refresh(cache_key, changed=False)
+            self._store(_items_cache, cache_key, self._all_items)
+            return self._all_items
+
+        items = [item for item, _, _ in entries]
+        old_items, old_fingerprints = self._all_items, self._item_fingerprints
+        self._all_items = items
+        self._item_fingerprints = fingerprints
 
-        # Filter to only include valid dict items
-        valid_items = [raw for raw in raw_items if isinstance(raw, dict)]
-        items = [self._normalize_item(raw, source) for raw in valid_items]
+        # Patch indexes in place when existing records kept their ordinals
+        if len(items) >= len(old_items) and all(a.id == b.id for a, b in zip(old_items, items)):
+            changed = [o for o, fp in enumerate(old_fingerprints) if fingerprints[o] != fp]
+            self._patch_item_indexes(old_items, changed, range(len(old_items), len(items)))
+        else:
+            self._build_item_indexes(items)
 
-        # Update cache and metadata
-        self._all_items = items
+        # Cheap derived views are rebuilt from the reused records
         self._categories = {item.category for item in items if item.category}
         self._rarities = {item.rarity for item in items if item.rarity}
-        _items_cache[cache_key] = items
+        self._weapons = [weapon for _, weapon, _ in entries if weapon]
+        self._weapons_by_id = self._index_by_id(self._weapons)
+        self._armor = [armor for _, _, armor in entries if armor]
+        self._armor_by_id = self._index_by_id(self._armor)
+        self._item_ordinals = {item.id: ordinal for ordinal, item in reversed(list(enumerate(items)))}
+        self._item_groups = self._build_item_groups(items)
+        self._related = {}
+        self._bump_version("items")
+        self._record_changes("items", items, fingerprints)
+        self._record_refresh(cache_key, changed=True)
+        self._store(_items_cache, cache_key, items)
 
         return items
 
+    def _item_entry(self, raw: dict, source: str) -> tuple:
+        """Normalize one raw item into (item record, weapon or None, armor or None)."""
+        item = self._normalize_item(raw, source)
+        return ItemRecord(item), self._weapon_from_item(item), self._armor_from_item(item)
+
+    def _item_entries_many(self, raws: List[dict]) -> List[tuple]:
+        """_item_entry for a batch, in a process pool when it is large (see normalize_batch)."""
+        items = normalize_batch(
+            normalize_item, raws, settings.normalize_processes, settings.normalize_pool_threshold
+        )
+        return [(ItemRecord(item), self._weapon_from_item(item), self._armor_from_item(item)) for item in items]
+
+    def _build_item_indexes(self, items: List[ItemRecord]):
+        """Build every ordinal-based item index from scratch."""
+        self._item_text_index = self._build_text_index(items, self._item_text_fields)
+        self._item_name_index = self._build_name_index(items)
+        self._item_field_indexes = self._build_field_indexes(items, self.ITEM_FILTER_FIELDS)
+        self._item_value_index = self._build_item_value_index(items)
+        self._item_columns = ItemColumns(items)
+        self._item_quest_index = FieldIndex()
+        for ordinal, item in enumerate(items):
+            self._item_quest_index.add(ordinal, item.quest_requirements)
+
+    def _patch_item_indexes(self, old_items: List[ItemRecord], changed: List[int], added: Iterable[int]):
+        """Update item indexes for changed ordinals and ordinals appended after the old ones."""
+        items = self._all_items
+        for ordinal in changed:
+            old = old_items[ordinal]
+            self._item_text_index.remove(ordinal, self._item_text_fields(old))
+            self._item_name_index.remove(ordinal, old.name)
+            for field, values in self.ITEM_FILTER_FIELDS.items():
+                self._item_field_indexes[field].remove(ordinal, values(old))
+            self._item_value_index.remove(ordinal)
+            self._item_quest_index.remove(ordinal, old.quest_requirements)
+
+        added = list(added)
+        for ordinal in changed + added:
+            item = items[ordinal]
+            self._item_text_index.add(ordinal, self._item_text_fields(item))
+            self._item_name_index.add(ordinal, item.name)
+            for field, values in self.ITEM_FILTER_FIELDS.items():
+                self._item_field_indexes[field].add(ordinal, values(item))
+            if item.value:
+                self._item_value_index.add(ordinal, item.value)
+            self._item_quest_index.add(ordinal, item.quest_requirements)
+
+        if added:
+            self._item_columns = ItemColumns(items)
+        else:
+            self._item_columns.update(changed, items)
+
+    @staticmethod
+    def _parse_sort(sort: str) -> tuple:
+        """Split a sort spec like "-damage" into (field, descending)."""
+        field = sort.lstrip("-")
+        if field not in ITEM_NUMERIC_FIELDS:
+            raise ValueError(f"Cannot sort by {field!r}, expected one of: {', '.join(ITEM_NUMERIC_FIELDS)}")
+        return field, sort.startswith("-")
+
+    def _item_search_result(self, query, category, subcategory, rarity, trader,
+                            min_value, max_value, stat_ranges=None, sort=None) -> SearchResult:
+        """Resolve item filters to ordered ordinals, memoized per dataset version."""
+        stat_ranges = tuple(stat_ranges or ())
+        cache_key = ("items", self._versions["items"], query, category, subcategory,
+                     rarity, trader, min_value, max_value, stat_ranges, sort)
+        result = self._search_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        filters = {"category": category, "subcategory": subcategory, "rarity": rarity, "trader": trader}
+        candidates = self._intersect_filters(self._item_field_indexes, filters)
+
+        if min_value is not None or max_value is not None:
+            value_index = self._item_value_index
+            if candidates is not None and len(candidates) < value_index.count_between(min_value, max_value):
+                candidates = value_index.filter(candidates, min_value, max_value)
+            else:
+                in_range = value_index.between(min_value, max_value)
+                candidates = set(in_range) if candidates is None else candidates.intersection(in_range)
+
+        if stat_ranges:
+            in_range = self._item_columns.ordinals_matching(stat_ranges)
+            candidates = set(in_range) if candidates is None else candidates.intersection(in_range)
+
+        ranked = []
+        if query:
+            # Fall back to fuzzy name matching when no word matches, e.g. on typos
+            ranked = (
+                self._item_text_index.search(query)
+                or self._item_name_index.search(query, limit=self.FUZZY_FALLBACK_LIMIT)
+            )
+            if not ranked:
+                candidates = set()
+
+        result = self._rank(candidates, ranked, len(self._all_items))
+        if sort:
+            field, descending = self._parse_sort(sort)
+            result = SearchResult(*self._item_columns.sort_keys(field, result.ordinals, descending))
+
+        self._search_cache[cache_key] = result
+        return result
+
     async def search_items(
         self,
         query: Optional[str] = None,
@@ -135,53 +1263,175 @@ class ArcDataService:
         trader: Optional[str] = None,
         min_value: Optional[int] = None,
         max_value: Optional[int] = None,
+        stat_ranges: Optional[List[tuple]] = None,
+        sort: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> tuple:
-        """Search and filter items."""
+        """
+        Search and filter items.
+
+        `stat_ranges` holds (field, min, max) tuples over numeric fields, and
+        `sort` names a numeric field, prefixed with "-" for descending.
+        Returns (items, total, next_cursor). Raises ValueError for a malformed
+        or stale cursor, or an unknown field.
+        """
         items = await self.get_all_items()
+        result = self._item_search_result(query, category, subcategory, rarity, trader,
+                                          min_value, max_value, stat_ranges, sort)
+        # Content digest, not version: it means the same data in every worker
+        page, next_cursor = result.page(limit, offset, cursor, self.get_digest("items"))
+        return [items[o].to_model() for o in page], len(result), next_cursor
 
-        # Apply filters
-        filtered = items
-
-        if query:
-            query_lower = query.lower()
-            filtered = [
-                item for item in filtered
-                if query_lower in item.name.lower()
-                or (item.description and query_lower in item.description.lower())
-            ]
-
-        if category:
-            filtered = [item for item in filtered if item.category == category]
-
-        if subcategory:
-            filtered = [item for item in filtered if item.subcategory == subcategory]
-
-        if rarity:
-            filtered = [item for item in filtered if item.rarity == rarity]
-
-        if trader:
-            filtered = [item for item in filtered if trader in item.traders]
-
-        if min_value is not None:
-            filtered = [item for item in filtered if item.value and item.value >= min_value]
-
-        if max_value is not None:
-            filtered = [item for item in filtered if item.value and item.value <= max_value]
-
-        total = len(filtered)
-        paginated = filtered[offset:offset + limit]
-
-        return paginated, total
+    async def get_item_facets(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        rarity: Optional[str] = None,
+        trader: Optional[str] = None,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        stat_ranges: Optional[List[tuple]] = None
+    ) -> dict:
+        """Count items per category, rarity and trader within the current filter."""
+        items = await self.get_all_items()
+        cache_key = ("item_facets", self._versions["items"], query, category, subcategory,
+                     rarity, trader, min_value, max_value, tuple(stat_ranges or ()))
+        facets = self._search_cache.get(cache_key)
+        if facets is None:
+            result = self._item_search_result(query, category, subcategory, rarity, trader,
+                                              min_value, max_value, stat_ranges)
+            facets = count_facets(items, result.ordinals, self.ITEM_FACET_FIELDS)
+            self._search_cache[cache_key] = facets
+        return facets
+
+    async def get_item_aggregates(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        rarity: Optional[str] = None,
+        trader: Optional[str] = None,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None,
+        stat_ranges: Optional[List[tuple]] = None
+    ) -> dict:
+        """Count, min, max and mean of each numeric field within the current filter."""
+        await self.get_all_items()
+        result = self._item_search_result(query, category, subcategory, rarity, trader,
+                                          min_value, max_value, stat_ranges)
+        return self._item_columns.aggregate(result.ordinals)
 
     async def get_item_by_id(self, item_id: str) -> Optional[Item]:
         """Get a single item by ID."""
         items = await self.get_all_items()
-        for item in items:
-            if item.id == item_id:
-                return item
-        return None
+        ordinal = self._item_ordinals.get(item_id)
+        return items[ordinal].to_model() if ordinal is not None else None
+
+    async def get_many(self, collection: str, ids: Iterable[str]) -> dict:
+        """
+        Resolve many ids of one collection at once.
+
+        `collection` is one of items, quests, maps, weapons or armor. Returns
+        a dict of the ids that were found; missing ids are simply absent.
+        """
+        if collection == "items":
+            items = await self.get_all_items()
+            return {
+                item_id: items[self._item_ordinals[item_id]].to_model()
+                for item_id in ids if item_id in self._item_ordinals
+            }
+
+        if collection == "quests":
+            await self.get_all_quests()
+            lookup = self._quests_by_id
+        elif collection == "maps":
+            await self.get_all_maps()
+            lookup = self._maps_by_id
+        else:
+            await self.get_all_items()
+            lookup = {
+                "weapons": self._weapons_by_id,
+                "armor": self._armor_by_id,
+            }[collection]
+
+        found = {}
+        for record_id in ids:
+            record = lookup.get(record_id)
+            if record is not None:
+                found[record_id] = record
+        return found
+
+    async def get_batch(self, collection: str, ids: Iterable[str]) -> tuple:
+        """
+        Resolve ids of one collection (see get_many) in request order, dropping repeats.
+
+        Returns (records, missing ids).
+        """
+        ids = list(dict.fromkeys(ids))
+        found = await self.get_many(collection, ids)
+        records = [found[record_id] for record_id in ids if record_id in found]
+        missing = [record_id for record_id in ids if record_id not in found]
+        return records, missing
+
+    # ===== OFFLINE SYNC =====
+
+    # Datasets in the offline bundle, in cursor order; events and traders are
+    # live data with short TTLs and are fetched online
+    SYNC_DATASETS = ("items", "quests", "maps")
+
+    def _records_by_id(self, dataset: str, ids: Iterable[str]) -> list:
+        """Current records of a synced dataset for the given ids, as models."""
+        if dataset == "items":
+            return [self._all_items[self._item_ordinals[item_id]].to_model() for item_id in ids]
+        lookup = self._quests_by_id if dataset == "quests" else self._maps_by_id
+        return [lookup[record_id] for record_id in ids]
+
+    async def _load_synced(self):
+        await self.get_all_items()
+        await self.get_all_quests()
+        await self.get_all_maps()
+
+    def _sync_digests(self) -> Dict[str, str]:
+        return {dataset: self.get_digest(dataset) for dataset in self.SYNC_DATASETS}
+
+    async def get_bundle(self) -> dict:
+        """Every record of the synced datasets and the digest of each (see get_digest)."""
+        await self._load_synced()
+        # Read without awaiting, so no reload lands between records and digests
+        bundle = {"digests": self._sync_digests()}
+        for dataset in self.SYNC_DATASETS:
+            bundle[dataset] = self._records_by_id(dataset, self._id_fingerprints[dataset])
+        return bundle
+
+    async def get_changes_since(self, digests: Dict[str, str]) -> dict:
+        """
+        Records added, changed and removed in each synced dataset since the given digests.
+
+        Computed by diffing the retained id->fingerprint map of each digest
+        against the current one. Digests name contents, not process-local
+        versions, so one from another worker or from before a restart means
+        the same data. A dataset whose digest is not retained here comes
+        back whole, with `reset` set.
+        """
+        await self._load_synced()
+        delta = {"digests": self._sync_digests()}
+        for dataset, history in self._id_history.items():
+            current = self._id_fingerprints[dataset]
+            base = history.get(digests.get(dataset))
+            if base is None:
+                changes = {"added": list(current), "changed": [], "removed": []}
+            else:
+                changes = diff_fingerprints(base, current)
+            delta[dataset] = {
+                "reset": base is None,
+                "added": self._records_by_id(dataset, changes["added"]),
+                "changed": self._records_by_id(dataset, changes["changed"]),
+                "removed": changes["removed"],
+            }
+        return delta
 
     async def get_categories(self) -> List[str]:
         """Get all available categories."""
@@ -197,107 +1447,148 @@ class ArcDataService:
         """Fetch current events and timers."""
         cache_key = "events"
         if cache_key in _events_cache:
+            self._revalidate_if_stale(cache_key, self._load_events)
             return _events_cache[cache_key]
 
+        return await self._single_flight(cache_key, self._load_events)
+
+    async def _load_events(self) -> List[dict]:
+        """Fetch events from MetaForge and cache them."""
+        cache_key = "events"
         try:
-            response = await self.client.get(f"{settings.metaforge_api_url}/events")
+            response = await self.upstreams["metaforge"].get(f"{settings.metaforge_api_url}/events")
             response.raise_for_status()
             events = response.json()
-            _events_cache[cache_key] = events
+            if events != self._last_good.get(cache_key):
+                self._bump_version("events")
+            self._store(_events_cache, cache_key, events)
             return events
         except Exception as e:
             print(f"Events API error: {e}")
-            return []
+            return self._keep_last_good(_events_cache, cache_key)
 
     async def fetch_traders(self) -> List[dict]:
         """Fetch trader information."""
         cache_key = "traders"
         if cache_key in _traders_cache:
+            self._revalidate_if_stale(cache_key, self._load_traders)
             return _traders_cache[cache_key]
 
+        return await self._single_flight(cache_key, self._load_traders)
+
+    async def _load_traders(self) -> List[dict]:
+        """Fetch traders from MetaForge and cache them."""
+        cache_key = "traders"
         try:
-            response = await self.client.get(f"{settings.metaforge_api_url}/traders")
+            response = await self.upstreams["metaforge"].get(f"{settings.metaforge_api_url}/traders")
             response.raise_for_status()
             traders = response.json()
-            _traders_cache[cache_key] = traders
+            if traders != self._last_good.get(cache_key):
+                self._bump_version("traders")
+            self._store(_traders_cache, cache_key, traders)
             return traders
         except Exception as e:
             print(f"Traders API error: {e}")
-            return []
+            return self._keep_last_good(_traders_cache, cache_key)
 
     # ===== QUESTS =====
 
-    async def fetch_quests_from_metaforge(self) -> List[dict]:
-        """Fetch quests from MetaForge API."""
+    async def fetch_quests_from_metaforge(self, conditional: bool = False,
+                                          on_page: Optional[Callable] = None) -> Optional[List[dict]]:
+        """Fetch all pages of quests from MetaForge API. Returns None if unchanged (see _fetch_paged)."""
         try:
-            response = await self.client.get(
+            return await self._fetch_paged(
+                "metaforge:quests",
                 f"{settings.metaforge_api_url}/quests",
-                params={"limit": 500}
+                "quests",
+                conditional=conditional,
+                on_page=on_page
             )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("quests", data) if isinstance(data, dict) else data
+        except IncompleteFetch as e:
+            # As for items: a cut-off fetch never replaces a full load
+            print(f"MetaForge quests API warning: {e}")
+            return [] if conditional else e.records
         except Exception as e:
             print(f"MetaForge quests API error: {e}")
             return []
 
     def _normalize_quest(self, raw: dict) -> Quest:
         """Normalize quest data into unified format."""
-        quest_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
-
-        objectives = []
-        for obj in raw.get("objectives", []):
-            objectives.append(QuestObjective(
-                description=obj.get("description", ""),
-                type=obj.get("type", "unknown"),
-                target=obj.get("target"),
-                count=obj.get("count"),
-                location=obj.get("location")
-            ))
-
-        rewards = None
-        if raw.get("rewards"):
-            r = raw["rewards"]
-            rewards = QuestReward(
-                experience=r.get("experience") or r.get("xp"),
-                currency=r.get("currency") or r.get("credits"),
-                items=r.get("items", []),
-                reputation=r.get("reputation")
-            )
-
-        return Quest(
-            id=str(quest_id),
-            name=raw.get("name", "Unknown Quest"),
-            description=raw.get("description"),
-            giver=raw.get("giver") or raw.get("trader") or raw.get("npc"),
-            type=raw.get("type") or raw.get("quest_type"),
-            level_requirement=raw.get("level_requirement") or raw.get("min_level"),
-            prerequisites=raw.get("prerequisites", []),
-            objectives=objectives,
-            required_items=raw.get("required_items", []),
-            rewards=rewards,
-            location=raw.get("location") or raw.get("map"),
-            image_url=raw.get("image") or raw.get("icon")
-        )
+        return normalize_quest(raw)
 
     async def get_all_quests(self, force_refresh: bool = False) -> List[Quest]:
         """Get all quests."""
         cache_key = "all_quests"
 
         if not force_refresh and cache_key in _quests_cache:
+            self._revalidate_if_stale(cache_key, self._load_quests)
             return _quests_cache[cache_key]
 
-        raw_quests = await self.fetch_quests_from_metaforge()
+        return await self._single_flight(cache_key, self._load_quests)
 
-        if not raw_quests:
-            return []
+    async def _load_quests(self) -> List[Quest]:
+        """Fetch and normalize quests, reusing unchanged records."""
+        cache_key = "all_quests"
 
-        # Filter to only include valid dict items
-        valid_quests = [raw for raw in raw_quests if isinstance(raw, dict)]
-        quests = [self._normalize_quest(raw) for raw in valid_quests]
-        _quests_cache[cache_key] = quests
+        normalizer = IncrementalNormalizer(self._quest_entries, self._normalize_quest)
+        raw_quests = await self.fetch_quests_from_metaforge(
+            conditional=self._loaded_from.get(cache_key) == "metaforge:quests",
+            on_page=normalizer.add
+        )
+
+        if raw_quests is None:
+            self._record_refresh(cache_key, changed=False)
+            self._store(_quests_cache, cache_key, self._all_quests)
+            return self._all_quests
+
+        if not raw_quests:
+            # Keep serving the last loaded quests so the search index stays consistent
+            self._keep_last_good(_quests_cache, cache_key)
+            return self._all_quests
+
+        quests, fingerprints = normalizer.entries, normalizer.fingerprints
+        self._quest_entries = normalizer.by_fingerprint
+        self._loaded_from[cache_key] = "metaforge:quests"
+        if fingerprints == self._quest_fingerprints:
+            self._record_refresh(cache_key, changed=False)
+            self._store(_quests_cache, cache_key, self._all_quests)
+            return self._all_quests
+
+        self._all_quests = quests
+        self._quest_fingerprints = fingerprints
+        self._quests_by_id = self._index_by_id(quests)
+        self._quest_text_index = self._build_text_index(quests, self._quest_text_fields)
+        self._quest_name_index = self._build_name_index(quests)
+        self._quest_field_indexes = self._build_field_indexes(quests, self.QUEST_FILTER_FIELDS)
+        self._bump_version("quests")
+        self._record_changes("quests", quests, fingerprints)
+        self._record_refresh(cache_key, changed=True)
+        self._store(_quests_cache, cache_key, quests)
         return quests
 
+    def _quest_search_result(self, query, giver, quest_type, location) -> SearchResult:
+        """Resolve quest filters to ordered ordinals, memoized per dataset version."""
+        cache_key = ("quests", self._versions["quests"], query, giver, quest_type, location)
+        result = self._search_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        filters = {"giver": giver, "type": quest_type, "location": location}
+        candidates = self._intersect_filters(self._quest_field_indexes, filters)
+
+        ranked = []
+        if query:
+            ranked = (
+                self._quest_text_index.search(query)
+                or self._quest_name_index.search(query, limit=self.FUZZY_FALLBACK_LIMIT)
+            )
+            if not ranked:
+                candidates = set()
+
+        result = self._rank(candidates, ranked, len(self._all_quests))
+        self._search_cache[cache_key] = result
+        return result
+
     async def search_quests(
         self,
         query: Optional[str] = None,
@@ -305,40 +1596,41 @@ class ArcDataService:
         quest_type: Optional[str] = None,
         location: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> tuple:
-        """Search and filter quests."""
-        quests = await self.get_all_quests()
-        filtered = quests
+        """
+        Search and filter quests.
 
-        if query:
-            query_lower = query.lower()
-            filtered = [
-                q for q in filtered
-                if query_lower in q.name.lower()
-                or (q.description and query_lower in q.description.lower())
-            ]
-
-        if giver:
-            filtered = [q for q in filtered if q.giver == giver]
-
-        if quest_type:
-            filtered = [q for q in filtered if q.type == quest_type]
-
-        if location:
-            filtered = [q for q in filtered if q.location == location]
+        Returns (quests, total, next_cursor). Raises ValueError for a malformed
+        or stale cursor.
+        """
+        quests = await self.get_all_quests()
+        result = self._quest_search_result(query, giver, quest_type, location)
+        page, next_cursor = result.page(limit, offset, cursor, self.get_digest("quests"))
+        return [quests[o] for o in page], len(result), next_cursor
 
-        total = len(filtered)
-        paginated = filtered[offset:offset + limit]
-        return paginated, total
+    async def get_quest_facets(
+        self,
+        query: Optional[str] = None,
+        giver: Optional[str] = None,
+        quest_type: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> dict:
+        """Count quests per giver, type and location within the current filter."""
+        quests = await self.get_all_quests()
+        cache_key = ("quest_facets", self._versions["quests"], query, giver, quest_type, location)
+        facets = self._search_cache.get(cache_key)
+        if facets is None:
+            result = self._quest_search_result(query, giver, quest_type, location)
+            facets = count_facets(quests, result.ordinals, self.QUEST_FILTER_FIELDS)
+            self._search_cache[cache_key] = facets
+        return facets
 
     async def get_quest_by_id(self, quest_id: str) -> Optional[Quest]:
         """Get a single quest by ID."""
-        quests = await self.get_all_quests()
-        for quest in quests:
-            if quest.id == quest_id:
-                return quest
-        return None
+        await self.get_all_quests()
+        return self._quests_by_id.get(quest_id)
 
     async def get_quest_givers(self) -> List[str]:
         """Get all quest givers."""
@@ -348,12 +1640,16 @@ class ArcDataService:
 
     # ===== MAPS =====
 
-    async def fetch_maps_from_metaforge(self) -> List[dict]:
-        """Fetch maps from MetaForge API."""
+    async def fetch_maps_from_metaforge(self, conditional: bool = False) -> Optional[List[dict]]:
+        """Fetch maps from MetaForge API. Returns None if unchanged (see _get_json)."""
         try:
-            response = await self.client.get(f"{settings.metaforge_api_url}/maps")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(
+                "metaforge:maps",
+                f"{settings.metaforge_api_url}/maps",
+                conditional=conditional
+            )
+            if data is None:
+                return None
             return data.get("maps", data) if isinstance(data, dict) else data
         except Exception as e:
             print(f"MetaForge maps API error: {e}")
@@ -361,137 +1657,169 @@ class ArcDataService:
 
     def _normalize_map(self, raw: dict) -> GameMap:
         """Normalize map data into unified format."""
-        map_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
-
-        markers = []
-        for m in raw.get("markers", []) + raw.get("pois", []):
-            markers.append(MapMarker(
-                id=m.get("id", str(len(markers))),
-                name=m.get("name", "Unknown"),
-                type=m.get("type", "landmark"),
-                x=m.get("x", 0),
-                y=m.get("y", 0),
-                description=m.get("description"),
-                icon=m.get("icon"),
-                items=m.get("items", []),
-                quests=m.get("quests", [])
-            ))
-
-        extractions = []
-        for e in raw.get("extractions", []) + raw.get("exits", []):
-            extractions.append(MapMarker(
-                id=e.get("id", str(len(extractions))),
-                name=e.get("name", "Extraction"),
-                type="extraction",
-                x=e.get("x", 0),
-                y=e.get("y", 0),
-                description=e.get("description")
-            ))
-
-        zones = []
-        for z in raw.get("zones", []):
-            zones.append(MapZone(
-                id=z.get("id", str(len(zones))),
-                name=z.get("name", "Zone"),
-                type=z.get("type", "unknown"),
-                bounds=z.get("bounds", []),
-                threat_level=z.get("threat_level"),
-                description=z.get("description")
-            ))
-
-        return GameMap(
-            id=str(map_id),
-            name=raw.get("name", "Unknown Map"),
-            description=raw.get("description"),
-            image_url=raw.get("image") or raw.get("map_image"),
-            thumbnail_url=raw.get("thumbnail"),
-            width=raw.get("width"),
-            height=raw.get("height"),
-            markers=markers,
-            zones=zones,
-            extractions=extractions
-        )
+        return normalize_map(raw)
 
     async def get_all_maps(self, force_refresh: bool = False) -> List[GameMap]:
         """Get all maps."""
         cache_key = "all_maps"
 
         if not force_refresh and cache_key in _maps_cache:
+            self._revalidate_if_stale(cache_key, self._load_maps)
             return _maps_cache[cache_key]
 
-        raw_maps = await self.fetch_maps_from_metaforge()
+        return await self._single_flight(cache_key, self._load_maps)
 
-        if not raw_maps:
-            return []
+    async def _load_maps(self) -> List[GameMap]:
+        """Fetch and normalize maps, reusing unchanged records."""
+        cache_key = "all_maps"
 
-        # Filter to only include valid dict items
-        valid_maps = [raw for raw in raw_maps if isinstance(raw, dict)]
-        maps = [self._normalize_map(raw) for raw in valid_maps]
-        _maps_cache[cache_key] = maps
+        raw_maps = await self.fetch_maps_from_metaforge(
+            conditional=self._loaded_from.get(cache_key) == "metaforge:maps"
+        )
+
+        if raw_maps is None:
+            self._record_refresh(cache_key, changed=False)
+            self._store(_maps_cache, cache_key, self._all_maps)
+            return self._all_maps
+
+        if not raw_maps:
+            self._keep_last_good(_maps_cache, cache_key)
+            return self._all_maps
+
+        normalizer = IncrementalNormalizer(self._map_entries, self._normalize_map)
+        normalizer.add(raw_maps)
+        maps, fingerprints = normalizer.entries, normalizer.fingerprints
+        self._map_entries = normalizer.by_fingerprint
+        self._loaded_from[cache_key] = "metaforge:maps"
+        if fingerprints == self._map_fingerprints:
+            self._record_refresh(cache_key, changed=False)
+            self._store(_maps_cache, cache_key, self._all_maps)
+            return self._all_maps
+
+        self._all_maps = maps
+        self._map_fingerprints = fingerprints
+        self._maps_by_id = self._index_by_id(maps)
+        self._marker_refs = [
+            (game_map, marker)
+            for game_map in maps
+            for marker in game_map.markers + game_map.extractions
+        ]
+        self._marker_name_index = self._build_name_index([marker for _, marker in self._marker_refs])
+        self._bump_version("maps")
+        self._record_changes("maps", maps, fingerprints)
+        self._record_refresh(cache_key, changed=True)
+        self._store(_maps_cache, cache_key, maps)
         return maps
 
     async def get_map_by_id(self, map_id: str) -> Optional[GameMap]:
         """Get a single map by ID."""
-        maps = await self.get_all_maps()
-        for game_map in maps:
-            if game_map.id == map_id:
-                return game_map
-        return None
+        await self.get_all_maps()
+        return self._maps_by_id.get(map_id)
+
+    # ===== SUGGESTIONS =====
+
+    SUGGEST_KINDS = ("item", "quest", "marker")
+
+    # Most fuzzy matches returned when a full-text query finds nothing
+    FUZZY_FALLBACK_LIMIT = 50
+
+    def _suggestion(self, kind: str, ordinal: int, score: float) -> dict:
+        if kind == "item":
+            record, map_id = self._all_items[ordinal], None
+        elif kind == "quest":
+            record, map_id = self._all_quests[ordinal], None
+        else:
+            game_map, record = self._marker_refs[ordinal]
+            map_id = game_map.id
+        return {"type": kind, "id": record.id, "name": record.name, "map_id": map_id, "score": score}
+
+    async def suggest(self, query: str, limit: int = 10,
+                      kinds: Optional[Iterable[str]] = None) -> List[dict]:
+        """Typo-tolerant typeahead over item, quest and map marker names."""
+        kinds = [kind for kind in (kinds or self.SUGGEST_KINDS) if kind in self.SUGGEST_KINDS]
+        indexes = {}
+        if "item" in kinds:
+            await self.get_all_items()
+            indexes["item"] = self._item_name_index
+        if "quest" in kinds:
+            await self.get_all_quests()
+            indexes["quest"] = self._quest_name_index
+        if "marker" in kinds:
+            await self.get_all_maps()
+            indexes["marker"] = self._marker_name_index
+
+        candidates = [
+            (score, rank, ordinal, kind)
+            for rank, (kind, index) in enumerate(indexes.items())
+            for ordinal, score in index.search(query, limit)
+        ]
+        best = heapq.nsmallest(limit, candidates, key=lambda c: (-c[0], c[1], c[2]))
+        return [self._suggestion(kind, ordinal, score) for score, _, ordinal, kind in best]
 
     # ===== WEAPONS & LOADOUTS =====
 
     async def get_weapons(self) -> List[Weapon]:
         """Get all weapons from items database."""
-        items = await self.get_all_items()
-        weapons = []
-
-        weapon_categories = {"weapon", "weapons", "primary", "secondary", "pistol",
-                           "rifle", "smg", "shotgun", "sniper"}
-
-        for item in items:
-            if item.category and item.category.lower() in weapon_categories:
-                stats = item.stats or ItemStats()
-                weapons.append(Weapon(
-                    id=item.id,
-                    name=item.name,
-                    type=item.subcategory or item.category,
-                    rarity=item.rarity,
-                    base_damage=stats.damage or 0,
-                    fire_rate=stats.fire_rate or 0,
-                    accuracy=stats.accuracy or 0,
-                    recoil=0,  # May not be in stats
-                    range=stats.range or 0,
-                    magazine_size=30,  # Default
-                    reload_time=2.0,  # Default
-                    mod_slots=[],
-                    image_url=item.image_url
-                ))
-
-        return weapons
+        await self.get_all_items()
+        return self._weapons
+
+    async def get_weapon_by_id(self, weapon_id: str) -> Optional[Weapon]:
+        """Get a single weapon by ID."""
+        await self.get_all_items()
+        return self._weapons_by_id.get(weapon_id)
 
     async def get_armor(self) -> List[ArmorPiece]:
         """Get all armor from items database."""
-        items = await self.get_all_items()
-        armor_list = []
-
-        armor_categories = {"armor", "helmet", "vest", "chest", "legs", "gear"}
-
-        for item in items:
-            if item.category and item.category.lower() in armor_categories:
-                stats = item.stats or ItemStats()
-                armor_list.append(ArmorPiece(
-                    id=item.id,
-                    name=item.name,
-                    slot=item.subcategory or "chest",
-                    rarity=item.rarity,
-                    armor_value=stats.armor or 0,
-                    durability=stats.durability or 100,
-                    weight=item.weight or 0,
-                    special_effects=[],
-                    image_url=item.image_url
-                ))
-
-        return armor_list
+        await self.get_all_items()
+        return self._armor
+
+    async def get_armor_by_id(self, armor_id: str) -> Optional[ArmorPiece]:
+        """Get a single armor piece by ID."""
+        await self.get_all_items()
+        return self._armor_by_id.get(armor_id)
+
+    WEAPON_CATEGORIES = {"weapon", "weapons", "primary", "secondary", "pistol",
+                         "rifle", "smg", "shotgun", "sniper"}
+    ARMOR_CATEGORIES = {"armor", "helmet", "vest", "chest", "legs", "gear"}
+
+    def _weapon_from_item(self, item: Item) -> Optional[Weapon]:
+        """Derive a weapon from an item, or None if the item is not a weapon."""
+        if item.category and item.category.lower() in self.WEAPON_CATEGORIES:
+            # Built from an already validated item, so no need to validate again
+            stats = item.stats or ItemStats()
+            return Weapon.model_construct(
+                id=item.id,
+                name=item.name,
+                type=item.subcategory or item.category,
+                rarity=item.rarity,
+                base_damage=float(stats.damage or 0),
+                fire_rate=float(stats.fire_rate or 0),
+                accuracy=float(stats.accuracy or 0),
+                recoil=0.0,  # May not be in stats
+                range=float(stats.range or 0),
+                magazine_size=30,  # Default
+                reload_time=2.0,  # Default
+                mod_slots=[],
+                image_url=item.image_url
+            )
+        return None
+
+    def _armor_from_item(self, item: Item) -> Optional[ArmorPiece]:
+        """Derive an armor piece from an item, or None if the item is not armor."""
+        if item.category and item.category.lower() in self.ARMOR_CATEGORIES:
+            stats = item.stats or ItemStats()
+            return ArmorPiece.model_construct(
+                id=item.id,
+                name=item.name,
+                slot=item.subcategory or "chest",
+                rarity=item.rarity,
+                armor_value=float(stats.armor or 0),
+                durability=float(stats.durability or 100),
+                weight=float(item.weight or 0),
+                special_effects=[],
+                image_url=item.image_url
+            )
+        return None
 
     def calculate_weapon_dps(self, weapon: Weapon) -> float:
         """Calculate DPS for a weapon."""
@@ -0,0 +1,93 @@
+import hashlib
+from typing import Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import get_settings
+from .data_service import data_service
+
+settings = get_settings()
+
+# Datasets each GET route family is derived from, most specific prefix first.
+# Routes not listed here (status, health...) get no validators.
+ROUTE_DATASETS = (
+    ("/api/events/traders", ("traders",)),
+    ("/api/events", ("events",)),
+    ("/api/items", ("items",)),
+    ("/api/loadouts", ("items",)),
+    ("/api/quests", ("quests", "items")),
+    ("/api/maps", ("maps", "quests")),
+    ("/api/search", ("items", "quests", "maps")),
+    ("/api/stats", ("items", "quests", "maps")),
+    ("/api/bundle", ("items", "quests", "maps")),
+    ("/api/sync", ("items", "quests", "maps")),
+)
+
+
+def route_datasets(path: str) -> Optional[Tuple[str, ...]]:
+    for prefix, datasets in ROUTE_DATASETS:
+        if path == prefix or path.startswith(prefix + "/"):
+            return datasets
+    return None
+
+
+def etag_for(request: Request, datasets: Tuple[str, ...]) -> str:
+    """Weak ETag of a GET: the datasets' current contents plus path and query."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    basis = "|".join([settings.app_version, request.url.path, query,
+                      *(data_service.get_digest(dataset) for dataset in datasets)])
+    return f'W/"{hashlib.sha256(basis.encode()).hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in tags)
+
+
+def cache_headers(request: Request, datasets: Tuple[str, ...]) -> dict:
+    # Fresh for as long as the least fresh dataset; a client may not keep
+    # a response past the server's own next refresh
+    max_age = min(data_service.freshness(dataset) for dataset in datasets)
+    return {"ETag": etag_for(request, datasets), "Cache-Control": f"public, max-age={max_age}"}
+
+
+class ConditionalGetMiddleware:
+    """
+    ETag and Cache-Control on read endpoints, and 304 Not Modified for If-None-Match.
+
+    The ETag is computed before the route runs, so a client polling unchanged
+    data costs no filtering or serialization, and the value sent is the one
+    for the data the route went on to read: a reload landing mid-request
+    changes the next ETag, never this one. When a dataset the route reads is
+    not loaded yet its digest isn't known up front, and the response goes
+    out without validators.
+
+    Plain ASGI rather than BaseHTTPMiddleware: no extra task or streaming
+    wrapper per request, only a header edit on the way out.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            return await self.app(scope, receive, send)
+        datasets = route_datasets(scope["path"])
+        if datasets is None or not all(data_service.touch(dataset) for dataset in datasets):
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+        headers = cache_headers(request, datasets)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, headers["ETag"]):
+            return await Response(status_code=304, headers=headers)(scope, receive, send)
+
+        async def send_with_validators(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
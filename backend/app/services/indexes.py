@@ -0,0 +1,261 @@
+import heapq
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_EMPTY: Set[int] = frozenset()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TextIndex:
+    """Tokenized inverted index with prefix matching and weighted ranking.
+
+    Documents are identified by their ordinal in the collection the index was
+    built from. Each field carries a weight so that, for example, name hits
+    rank above description hits.
+    """
+
+    # Exact token matches score higher than prefix-only matches
+    PREFIX_PENALTY = 0.5
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = weights
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []
+
+    def add(self, ordinal: int, fields: Dict[str, Optional[str]]):
+        """Index the given fields of a document."""
+        for field, text in fields.items():
+            weight = self.weights.get(field, 1.0)
+            for token in set(tokenize(text)):
+                postings = self._postings.setdefault(token, {})
+                if postings.get(ordinal, 0.0) < weight:
+                    postings[ordinal] = weight
+        self._vocabulary = []
+
+    def remove(self, ordinal: int, fields: Dict[str, Optional[str]]):
+        """Remove a document, given the same fields it was added with."""
+        for text in fields.values():
+            for token in set(tokenize(text)):
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+                postings.pop(ordinal, None)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary = []
+
+    def _ensure_vocabulary(self):
+        if not self._vocabulary and self._postings:
+            self._vocabulary = sorted(self._postings)
+
+    def _expand(self, token: str) -> Iterable[str]:
+        """Yield all indexed tokens starting with the given prefix."""
+        self._ensure_vocabulary()
+        start = bisect_left(self._vocabulary, token)
+        for candidate in self._vocabulary[start:]:
+            if not candidate.startswith(token):
+                break
+            yield candidate
+
+    def _match_token(self, token: str) -> Dict[int, float]:
+        """Score every document containing a token that starts with `token`."""
+        scores: Dict[int, float] = {}
+        for candidate in self._expand(token):
+            factor = 1.0 if candidate == token else self.PREFIX_PENALTY
+            for ordinal, weight in self._postings[candidate].items():
+                score = weight * factor
+                if score > scores.get(ordinal, 0.0):
+                    scores[ordinal] = score
+        return scores
+
+    def search(self, query: str) -> List[Tuple[int, float]]:
+        """
+        Return (ordinal, score) pairs matching every query token, best first.
+
+        Each query token matches indexed tokens by prefix, so partially typed
+        words still find results. Ties keep collection order.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        # Start from the rarest token so intersections stay small
+        matches = sorted((self._match_token(t) for t in set(tokens)), key=len)
+        scores = dict(matches[0])
+        for token_scores in matches[1:]:
+            scores = {
+                ordinal: score + token_scores[ordinal]
+                for ordinal, score in scores.items()
+                if ordinal in token_scores
+            }
+            if not scores:
+                break
+
+        return sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))
+
+
+class FieldIndex:
+    """Posting sets mapping each value of a field to the ordinals that carry it."""
+
+    def __init__(self):
+        self._postings: Dict[Hashable, Set[int]] = {}
+
+    def add(self, ordinal: int, values: Iterable[Hashable]):
+        for value in values:
+            if value is not None:
+                self._postings.setdefault(value, set()).add(ordinal)
+
+    def remove(self, ordinal: int, values: Iterable[Hashable]):
+        for value in values:
+            postings = self._postings.get(value)
+            if postings is None:
+                continue
+            postings.discard(ordinal)
+            if not postings:
+                del self._postings[value]
+
+    def get(self, value: Hashable) -> Set[int]:
+        """Ordinals carrying `value`. The returned set must not be mutated."""
+        return self._postings.get(value, _EMPTY)
+
+    def values(self) -> List[Hashable]:
+        return list(self._postings)
+
+
+class RangeIndex:
+    """Numeric values kept sorted for bisect-based range filtering."""
+
+    def __init__(self):
+        self._values: Dict[int, float] = {}
+        self._keys: List[float] = []
+        self._ordinals: List[int] = []
+        self._dirty = False
+
+    def add(self, ordinal: int, value: Optional[float]):
+        if value is None:
+            return
+        self._values[ordinal] = value
+        self._dirty = True
+
+    def remove(self, ordinal: int):
+        if self._values.pop(ordinal, None) is not None:
+            self._dirty = True
+
+    def _ensure_sorted(self):
+        if self._dirty:
+            pairs = sorted((value, ordinal) for ordinal, value in self._values.items())
+            self._keys = [value for value, _ in pairs]
+            self._ordinals = [ordinal for _, ordinal in pairs]
+            self._dirty = False
+
+    def value_of(self, ordinal: int) -> Optional[float]:
+        return self._values.get(ordinal)
+
+    def count_between(self, low: Optional[float] = None, high: Optional[float] = None) -> int:
+        start, end = self._bounds(low, high)
+        return max(end - start, 0)
+
+    def between(self, low: Optional[float] = None, high: Optional[float] = None) -> List[int]:
+        """Ordinals whose value lies in the inclusive range, in value order."""
+        start, end = self._bounds(low, high)
+        return self._ordinals[start:end]
+
+    def _bounds(self, low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        self._ensure_sorted()
+        start = 0 if low is None else bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect_right(self._keys, high)
+        return start, end
+
+    def filter(self, ordinals: Iterable[int], low: Optional[float] = None,
+               high: Optional[float] = None) -> Set[int]:
+        """Keep only the given ordinals whose value lies in the inclusive range."""
+        result = set()
+        for ordinal in ordinals:
+            value = self._values.get(ordinal)
+            if value is None:
+                continue
+            if (low is None or value >= low) and (high is None or value <= high):
+                result.add(ordinal)
+        return result
+
+
+def trigrams(text: Optional[str], prefix: bool = False) -> Set[str]:
+    """
+    Character trigrams of each token, padded so word boundaries count.
+
+    With `prefix`, the last token is treated as still being typed and gets
+    no trailing pad, so "rus" matches "rusted" as well as "rus".
+    """
+    tokens = tokenize(text)
+    grams = set()
+    for i, token in enumerate(tokens):
+        tail = "" if prefix and i == len(tokens) - 1 else " "
+        padded = f"  {token}{tail}"
+        grams.update(padded[j:j + 3] for j in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """Trigram index over short names for typo-tolerant matching."""
+
+    # Fraction of the query's trigrams a name must share to count as a match
+    MIN_SIMILARITY = 0.5
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._sizes: Dict[int, int] = {}
+
+    def add(self, ordinal: int, text: Optional[str]):
+        grams = trigrams(text)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(ordinal)
+        self._sizes[ordinal] = len(grams)
+
+    def remove(self, ordinal: int, text: Optional[str]):
+        """Remove a name, given the same text it was added with."""
+        for gram in trigrams(text):
+            postings = self._postings.get(gram)
+            if postings is None:
+                continue
+            postings.discard(ordinal)
+            if not postings:
+                del self._postings[gram]
+        self._sizes.pop(ordinal, None)
+
+    def search(self, query: str, limit: int = 10,
+               min_similarity: Optional[float] = None) -> List[Tuple[int, float]]:
+        """
+        Return up to `limit` (ordinal, score) pairs, best first.
+
+        Score is the share of query trigrams found in the name, refined by
+        overall overlap so closer-length names rank first.
+        """
+        grams = trigrams(query, prefix=True)
+        if not grams:
+            return []
+        threshold = self.MIN_SIMILARITY if min_similarity is None else min_similarity
+
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for ordinal in self._postings.get(gram, ()):
+                shared[ordinal] = shared.get(ordinal, 0) + 1
+
+        scored = []
+        needed = threshold * len(grams)
+        for ordinal, count in shared.items():
+            if count < needed:
+                continue
+            containment = count / len(grams)
+            jaccard = count / (len(grams) + self._sizes[ordinal] - count)
+            scored.append((round(0.7 * containment + 0.3 * jaccard, 4), ordinal))
+
+        best = heapq.nsmallest(limit, scored, key=lambda pair: (-pair[0], pair[1]))
+        return [(ordinal, score) for score, ordinal in best]
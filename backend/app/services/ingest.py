@@ -0,0 +1,191 @@
+import codecs
+import hashlib
+import json
+import math
+from typing import List, Optional
+
+import httpx
+
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",:}]"
+
+
+class JsonRecordStream:
+    """
+    Incrementally decode records from a JSON payload as chunks arrive.
+
+    Accepts either a top-level array of records or an object holding the
+    records under `key`. Records are returned as soon as each one is
+    complete, so the full response text is never held in memory. Any other
+    top-level object members are collected in `meta` (e.g. pagination).
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.meta: dict = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._in_object = False
+        self._closed = False
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """Add a chunk of the body and return the records it completed."""
+        self._buf += self._text.decode(chunk)
+        return self._drain()
+
+    def close(self) -> List[dict]:
+        """Flush the last records. Raises ValueError if the payload was truncated."""
+        self._buf += self._text.decode(b"", final=True)
+        self._closed = True
+        records = self._drain()
+        if self._state != "done":
+            raise ValueError("Truncated JSON payload")
+        return records
+
+    def _skip(self, chars: str = _WHITESPACE):
+        while self._pos < len(self._buf) and self._buf[self._pos] in chars:
+            self._pos += 1
+
+    def _decode_value(self):
+        """Decode the next complete value, or return (None, False) if more input is needed."""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._closed:
+                raise
+            return None, False
+        # A value is only complete once a delimiter follows it: "1500." or
+        # "1e" decodes as 1500 or 1 with the rest of the number still to come
+        if end == len(self._buf) or self._buf[end] not in _DELIMITERS:
+            if not self._closed:
+                return None, False
+            if end < len(self._buf):
+                raise ValueError(f"Malformed JSON value at {self._buf[self._pos:end + 1]!r}")
+        self._pos = end
+        return value, True
+
+    def _drain(self) -> List[dict]:
+        records = []
+        while True:
+            self._skip()
+            if self._pos >= len(self._buf) or self._state == "done":
+                break
+            char = self._buf[self._pos]
+
+            if self._state == "start":
+                if char == "[":
+                    self._state = "array"
+                elif char == "{":
+                    self._state, self._in_object = "member", True
+                else:
+                    raise ValueError("Expected a JSON array or object")
+                self._pos += 1
+
+            elif self._state == "array":
+                if char == ",":
+                    self._pos += 1
+                elif char == "]":
+                    self._pos += 1
+                    self._state = "member" if self._in_object else "done"
+                else:
+                    start = self._pos
+                    record, complete = self._decode_value()
+                    if not complete:
+                        self._pos = start
+                        break
+                    records.append(record)
+
+            elif self._state == "member":
+                if char == ",":
+                    self._pos += 1
+                    continue
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                    continue
+                start = self._pos
+                name, complete = self._decode_value()
+                if complete:
+                    self._skip()
+                    complete = self._buf.startswith(":", self._pos)
+                if complete:
+                    self._pos += 1
+                    self._skip()
+                    if name == self.key and self._buf.startswith("[", self._pos):
+                        self._pos += 1
+                        self._state = "array"
+                        continue
+                    value, complete = self._decode_value()
+                if not complete:
+                    self._pos = start
+                    break
+                self.meta[name] = value
+
+        # Drop consumed input so the buffer only holds the record in progress
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        return records
+
+
+class IncompleteFetch(Exception):
+    """A paged fetch that stopped at ingest_max_pages with pages left upstream."""
+
+    def __init__(self, message: str, records: List[dict]):
+        super().__init__(message)
+        self.records = records
+
+
+class Page:
+    """One fetched page: its records, metadata and cache validators."""
+
+    def __init__(self, records: List[dict], meta: dict, digest: str,
+                 etag: Optional[str], last_modified: Optional[str]):
+        self.records = records
+        self.meta = meta
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+async def stream_page(client: httpx.AsyncClient, url: str, key: str,
+                      params: Optional[dict] = None, headers: Optional[dict] = None) -> Optional[Page]:
+    """
+    GET one page and decode its records while the body streams in.
+
+    Returns None when the upstream answers 304 Not Modified.
+    """
+    async with client.stream("GET", url, params=params, headers=headers) as response:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        stream = JsonRecordStream(key)
+        digest = hashlib.sha256()
+        records = []
+        async for chunk in response.aiter_bytes():
+            digest.update(chunk)
+            records.extend(stream.feed(chunk))
+        records.extend(stream.close())
+        return Page(
+            records, stream.meta, digest.hexdigest(),
+            response.headers.get("etag"), response.headers.get("last-modified")
+        )
+
+
+def total_pages(meta: dict, page_size: int) -> Optional[int]:
+    """
+    Read the page count from common pagination metadata, if the upstream sent any.
+
+    `count` is not read: many APIs use it for the records on the current page.
+    """
+    sources = [meta] + [meta[k] for k in ("pagination", "meta") if isinstance(meta.get(k), dict)]
+    for source in sources:
+        for name in ("totalPages", "total_pages", "pages"):
+            if isinstance(source.get(name), int):
+                return source[name]
+        for name in ("total", "totalCount", "total_count"):
+            if isinstance(source.get(name), int):
+                return max(1, math.ceil(source[name] / page_size))
+    return None
@@ -0,0 +1,102 @@
+import asyncio
+import re
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Raw field names the sources use for the same item attribute
+ITEM_FIELD_ALIASES = {
+    "id": ("id", "_id", "slug"),
+    "description": ("description", "desc"),
+    "subcategory": ("subcategory", "type"),
+    "rarity": ("rarity", "tier"),
+    "value": ("value", "price"),
+    "crafting": ("crafting", "recipe"),
+    "recycle": ("recycle", "recycling"),
+    "quest_requirements": ("quests",),
+    "image_url": ("image", "icon"),
+}
+
+
+def slugify(value) -> str:
+    return _SLUG_RE.sub("-", str(value).lower()).strip("-")
+
+
+def _match_keys(raw: dict) -> List[str]:
+    """Keys a record can be reconciled on, most specific first."""
+    return [slugify(raw[field]) for field in ("id", "slug", "_id", "name") if raw.get(field)]
+
+
+def _present(value) -> bool:
+    return value is not None and value != "" and value != [] and value != {}
+
+
+def merge_records(records_by_source: Dict[str, List[dict]], order: Sequence[str],
+                  precedence: Dict[str, Sequence[str]],
+                  aliases: Dict[str, Sequence[str]]) -> List[Tuple[dict, Dict[str, str]]]:
+    """
+    Reconcile raw records from several sources into one record per entity.
+
+    Records are matched on their slugified id, slug or name, and two records
+    from the same source are never paired. For each field, the first source
+    in its `precedence` list (then `order`) with a non-empty value wins; all
+    raw names of the field in `aliases` are taken from that source. Returns
+    (merged record, {field: source}) pairs in order of first appearance,
+    walking the sources in `order`.
+    """
+    groups: List[Dict[str, dict]] = []
+    by_key: Dict[str, Dict[str, dict]] = {}
+    for source in order:
+        for raw in records_by_source.get(source) or ():
+            if not isinstance(raw, dict):
+                continue
+            keys = _match_keys(raw)
+            group = next((by_key[k] for k in keys if k in by_key and source not in by_key[k]), None)
+            if group is None:
+                group = {}
+                groups.append(group)
+            group[source] = raw
+            for key in keys:
+                by_key.setdefault(key, group)
+
+    field_of = {name: field for field, names in aliases.items() for name in names}
+    merged = []
+    for group in groups:
+        fields = dict.fromkeys(field_of.get(name, name) for raw in group.values() for name in raw)
+        record, provenance = {}, {}
+        for field in fields:
+            names = aliases.get(field, (field,))
+            preferred = list(precedence.get(field, ()))
+            for source in preferred + [s for s in order if s not in preferred]:
+                raw = group.get(source)
+                values = {name: raw[name] for name in names if _present(raw.get(name))} if raw else {}
+                if values:
+                    record.update(values)
+                    provenance[field] = source
+                    break
+        merged.append((record, provenance))
+    return merged
+
+
+async def hedged(attempt: Callable[[], Awaitable], delay: float):
+    """
+    Run `attempt()`, racing a second copy if the first has not answered within `delay`.
+
+    Whichever copy first returns a usable result wins and the other is
+    cancelled. Fetchers report failure as [], so a failed copy only wins
+    if the other fails too.
+    """
+    tasks = [asyncio.ensure_future(attempt())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.append(asyncio.ensure_future(attempt()))
+        result = []
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result is None or result:
+                return result
+        return result
+    finally:
+        for task in tasks:
+            task.cancel()
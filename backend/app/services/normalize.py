@@ -0,0 +1,188 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, TypeVar
+
+from ..models.items import Item, ItemStats, CraftingRecipe, RecycleYield
+from ..models.quests import Quest, QuestObjective, QuestReward
+from ..models.maps import GameMap, MapMarker, MapZone
+
+T = TypeVar("T")
+
+# Upstream records are validated once, here, when they are normalized. Models
+# rebuilt later from that validated data skip validation (build_model), and
+# responses are encoded from models as they are (see response_cache.json_response).
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+def build_model(cls, values: dict, fields_set=None):
+    """
+    Instantiate a model from a complete field dict without validating it.
+
+    Only for values that already went through validation once, such as
+    compact records turned back into models (see records.py).
+    """
+    model = _new(cls)
+    _set(model, "__dict__", values)
+    _set(model, "__pydantic_fields_set__", set(values if fields_set is None else fields_set))
+    _set(model, "__pydantic_extra__", None)
+    _set(model, "__pydantic_private__", None)
+    return model
+
+
+def normalize_item(raw: dict) -> Item:
+    """Normalize item data from different sources into unified format."""
+    # Handle different field names from different APIs
+    item_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
+
+    stats = None
+    if raw.get("stats"):
+        stats = ItemStats(**raw["stats"])
+
+    crafting = None
+    if raw.get("crafting") or raw.get("recipe"):
+        craft_data = raw.get("crafting") or raw.get("recipe", {})
+        crafting = CraftingRecipe(
+            result_quantity=craft_data.get("result_quantity", 1),
+            ingredients=craft_data.get("ingredients", {}),
+            crafting_time=craft_data.get("time"),
+            required_hideout_level=craft_data.get("hideout_level")
+        )
+
+    recycle = None
+    if raw.get("recycle") or raw.get("recycling"):
+        recycle_data = raw.get("recycle") or raw.get("recycling", {})
+        recycle = RecycleYield(materials=recycle_data.get("materials", recycle_data))
+
+    return Item(
+        id=str(item_id),
+        name=raw.get("name", "Unknown"),
+        description=raw.get("description") or raw.get("desc"),
+        category=raw.get("category", "misc"),
+        subcategory=raw.get("subcategory") or raw.get("type"),
+        rarity=raw.get("rarity") or raw.get("tier"),
+        weight=raw.get("weight"),
+        value=raw.get("value") or raw.get("price"),
+        stats=stats,
+        crafting=crafting,
+        recycle=recycle,
+        traders=raw.get("traders", []),
+        quest_requirements=raw.get("quests", []),
+        image_url=raw.get("image") or raw.get("icon")
+    )
+
+
+def normalize_quest(raw: dict) -> Quest:
+    """Normalize quest data into unified format."""
+    quest_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
+
+    objectives = []
+    for obj in raw.get("objectives", []):
+        objectives.append(QuestObjective(
+            description=obj.get("description", ""),
+            type=obj.get("type", "unknown"),
+            target=obj.get("target"),
+            count=obj.get("count"),
+            location=obj.get("location")
+        ))
+
+    rewards = None
+    if raw.get("rewards"):
+        r = raw["rewards"]
+        rewards = QuestReward(
+            experience=r.get("experience") or r.get("xp"),
+            currency=r.get("currency") or r.get("credits"),
+            items=r.get("items", []),
+            reputation=r.get("reputation")
+        )
+
+    return Quest(
+        id=str(quest_id),
+        name=raw.get("name", "Unknown Quest"),
+        description=raw.get("description"),
+        giver=raw.get("giver") or raw.get("trader") or raw.get("npc"),
+        type=raw.get("type") or raw.get("quest_type"),
+        level_requirement=raw.get("level_requirement") or raw.get("min_level"),
+        prerequisites=raw.get("prerequisites", []),
+        objectives=objectives,
+        required_items=raw.get("required_items", []),
+        rewards=rewards,
+        location=raw.get("location") or raw.get("map"),
+        image_url=raw.get("image") or raw.get("icon")
+    )
+
+
+def normalize_map(raw: dict) -> GameMap:
+    """Normalize map data into unified format."""
+    map_id = raw.get("id") or raw.get("_id") or raw.get("slug", "unknown")
+
+    markers = []
+    for m in raw.get("markers", []) + raw.get("pois", []):
+        markers.append(MapMarker(
+            id=m.get("id", str(len(markers))),
+            name=m.get("name", "Unknown"),
+            type=m.get("type", "landmark"),
+            x=m.get("x", 0),
+            y=m.get("y", 0),
+            description=m.get("description"),
+            icon=m.get("icon"),
+            items=m.get("items", []),
+            quests=m.get("quests", [])
+        ))
+
+    extractions = []
+    for e in raw.get("extractions", []) + raw.get("exits", []):
+        extractions.append(MapMarker(
+            id=e.get("id", str(len(extractions))),
+            name=e.get("name", "Extraction"),
+            type="extraction",
+            x=e.get("x", 0),
+            y=e.get("y", 0),
+            description=e.get("description")
+        ))
+
+    zones = []
+    for z in raw.get("zones", []):
+        zones.append(MapZone(
+            id=z.get("id", str(len(zones))),
+            name=z.get("name", "Zone"),
+            type=z.get("type", "unknown"),
+            bounds=z.get("bounds", []),
+            threat_level=z.get("threat_level"),
+            description=z.get("description")
+        ))
+
+    return GameMap(
+        id=str(map_id),
+        name=raw.get("name", "Unknown Map"),
+        description=raw.get("description"),
+        image_url=raw.get("image") or raw.get("map_image"),
+        thumbnail_url=raw.get("thumbnail"),
+        width=raw.get("width"),
+        height=raw.get("height"),
+        markers=markers,
+        zones=zones,
+        extractions=extractions
+    )
+
+
+def _normalize_chunk(normalize: Callable[[dict], T], raws: List[dict]) -> List[T]:
+    return [normalize(raw) for raw in raws]
+
+
+def normalize_batch(normalize: Callable[[dict], T], raws: List[dict],
+                    processes: int = 0, pool_threshold: int = 0) -> List[T]:
+    """
+    Normalize records in order, across `processes` worker processes when
+    there are at least `pool_threshold` of them (0 processes: in-process).
+
+    `normalize` must be a module-level function so it can be pickled.
+    """
+    if processes <= 0 or len(raws) < max(pool_threshold, 1):
+        return _normalize_chunk(normalize, raws)
+    size = math.ceil(len(raws) / (processes * 4))
+    chunks = [raws[i:i + size] for i in range(0, len(raws), size)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        parts = pool.map(_normalize_chunk, [normalize] * len(chunks), chunks)
+        return [record for part in parts for record in part]
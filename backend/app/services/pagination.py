@@ -0,0 +1,85 @@
+import base64
+import json
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def encode_cursor(key: Tuple[float, int], version: str) -> str:
+    """Encode a (score, ordinal) keyset position in a dataset version as an opaque token."""
+    raw = json.dumps([*key, version], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, version: str) -> Tuple[float, int]:
+    """
+    Decode a token from encode_cursor. Raises ValueError if it is malformed,
+    or was issued for another version: ordinals shift when a dataset is
+    reloaded, so resuming from it would skip or repeat records.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, ordinal, cursor_version = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = float(score), int(ordinal)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if cursor_version != version:
+        raise ValueError("Stale cursor: the data changed since it was issued, start again from the first page")
+    return key
+
+
+class SearchResult:
+    """
+    Ordered ordinals matching a search, pageable by offset or keyset cursor.
+
+    Unranked results are in collection order. Ranked results are ordered by
+    descending score, then collection order, and carry one score per ordinal.
+    """
+
+    def __init__(self, ordinals: Sequence[int], scores: Optional[List[float]] = None):
+        self.ordinals = ordinals
+        self.scores = scores
+        self._keys = None
+        if scores is not None:
+            self._keys = [(-score, ordinal) for score, ordinal in zip(scores, ordinals)]
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def _key_at(self, position: int) -> Tuple[float, int]:
+        score = self.scores[position] if self.scores is not None else 0.0
+        return score, self.ordinals[position]
+
+    def _start_after(self, key: Tuple[float, int]) -> int:
+        score, ordinal = key
+        if self._keys is None:
+            return bisect_right(self.ordinals, ordinal)
+        return bisect_right(self._keys, (-score, ordinal))
+
+    def page(self, limit: int, offset: int = 0, cursor: Optional[str] = None,
+             version: str = "") -> Tuple[Sequence[int], Optional[str]]:
+        """
+        Return one page of ordinals and the cursor for the next page.
+
+        A cursor takes precedence over `offset` and resumes right after the
+        last record the client saw, so deep pages cost the same as the first.
+        `version` identifies the data the ordinals refer to; a cursor is only
+        accepted for the version it was issued for.
+        """
+        start = self._start_after(decode_cursor(cursor, version)) if cursor else offset
+        end = start + limit
+        next_cursor = encode_cursor(self._key_at(end - 1), version) if end < len(self.ordinals) else None
+        return self.ordinals[start:end], next_cursor
+
+
+def count_facets(records: Sequence, ordinals: Iterable[int],
+                 fields: Dict[str, Callable]) -> Dict[str, Dict[str, int]]:
+    """Count each value of each facet field across the given records."""
+    counts: Dict[str, Dict[str, int]] = {field: {} for field in fields}
+    for ordinal in ordinals:
+        record = records[ordinal]
+        for field, values in fields.items():
+            field_counts = counts[field]
+            for value in values(record):
+                if value is not None:
+                    field_counts[value] = field_counts.get(value, 0) + 1
+    return counts
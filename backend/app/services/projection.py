@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..models.items import Item
+from ..models.maps import GameMap
+
+# Sparse fieldsets for list endpoints: `fields=a,b,c` or a named `view`. The
+# record id is always included. Projection happens on the model, before
+# serialization, so unrequested nested blocks are never encoded.
+
+# Counts a map projection can carry instead of the lists themselves
+MAP_COUNTS = {"marker_count": "markers", "extraction_count": "extractions", "zone_count": "zones"}
+
+ITEM_VIEWS = {
+    "summary": ("id", "name", "category", "subcategory", "rarity", "value", "image_url"),
+}
+MAP_VIEWS = {
+    "summary": ("id", "name", "description", "thumbnail_url", "image_url",
+                "marker_count", "extraction_count", "zone_count"),
+}
+
+ITEM_FIELDS = tuple(Item.model_fields)
+MAP_FIELDS = tuple(GameMap.model_fields) + tuple(MAP_COUNTS)
+
+
+def parse_fields(fields: Optional[str], view: Optional[str], allowed: Tuple[str, ...],
+                 views: dict) -> Optional[Tuple[str, ...]]:
+    """
+    Resolve a `fields` list or `view` name to the fields to return, or None for all.
+
+    `fields` wins over `view`. Raises ValueError for an unknown field or view.
+    """
+    if fields:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown field {unknown[0]!r}, expected any of: {', '.join(allowed)}")
+        return tuple(dict.fromkeys(["id", *requested]))
+    if view and view != "full":
+        if view not in views:
+            raise ValueError(f"Unknown view {view!r}, expected one of: full, {', '.join(views)}")
+        return views[view]
+    return None
+
+
+def project(record: BaseModel, fields: Tuple[str, ...]) -> dict:
+    """Dump only `fields` of a model, JSON-ready."""
+    return record.model_dump(mode="json", include=set(fields))
+
+
+def project_map(game_map: GameMap, fields: Tuple[str, ...]) -> dict:
+    body = project(game_map, fields)
+    for count, attribute in MAP_COUNTS.items():
+        if count in fields:
+            body[count] = len(getattr(game_map, attribute))
+    return body
@@ -0,0 +1,113 @@
+import sys
+from typing import NamedTuple, Optional, Tuple
+
+from ..models.items import Item, ItemStats, CraftingRecipe, RecycleYield
+from .normalize import build_model
+
+# Items are held in memory as compact records and turned into pydantic models
+# only when an API response needs them. Records use __slots__ (no per-instance
+# __dict__), tuples instead of lists and dicts, and interned strings for the
+# enumerated values (category, rarity, traders, quest and material ids...)
+# that repeat across thousands of items.
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _intern_counts(counts: dict) -> Tuple[Tuple[str, int], ...]:
+    return tuple((sys.intern(name), count) for name, count in counts.items())
+
+
+class StatsRecord(NamedTuple):
+    damage: Optional[float]
+    fire_rate: Optional[float]
+    accuracy: Optional[float]
+    range: Optional[float]
+    armor: Optional[float]
+    durability: Optional[float]
+    weight: Optional[float]
+
+
+class CraftingRecord(NamedTuple):
+    result_quantity: int
+    ingredients: Tuple[Tuple[str, int], ...]
+    crafting_time: Optional[int]
+    required_hideout_level: Optional[int]
+
+
+class ItemRecord:
+    """
+    Compact, read-only stand-in for an Item.
+
+    Exposes the same attribute names as Item, so indexes and filters read
+    either. `stats` and `crafting` are named tuples, `recycle` is a tuple of
+    (material, count) pairs, and list fields are tuples.
+    """
+
+    __slots__ = (
+        "id", "name", "description", "category", "subcategory", "rarity", "weight", "value",
+        "stats", "crafting", "recycle", "traders", "quest_requirements", "image_url",
+    )
+
+    def __init__(self, item: Item):
+        self.id = item.id
+        self.name = item.name
+        self.description = item.description
+        self.category = sys.intern(item.category)
+        self.subcategory = _intern(item.subcategory)
+        self.rarity = _intern(item.rarity)
+        self.weight = item.weight
+        self.value = item.value
+        self.stats = None
+        if item.stats:
+            self.stats = StatsRecord._make(getattr(item.stats, field) for field in StatsRecord._fields)
+        self.crafting = None
+        if item.crafting:
+            crafting = item.crafting
+            self.crafting = CraftingRecord(
+                crafting.result_quantity, _intern_counts(crafting.ingredients),
+                crafting.crafting_time, crafting.required_hideout_level
+            )
+        self.recycle = _intern_counts(item.recycle.materials) if item.recycle else None
+        self.traders = tuple(map(sys.intern, item.traders))
+        self.quest_requirements = tuple(map(sys.intern, item.quest_requirements))
+        self.image_url = item.image_url
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def to_model(self) -> Item:
+        """Build the Item this record stands for. The values were validated on the way in."""
+        stats = crafting = recycle = None
+        if self.stats:
+            stats = build_model(ItemStats, self.stats._asdict())
+        if self.crafting:
+            crafting = build_model(CraftingRecipe, {
+                "result_quantity": self.crafting.result_quantity,
+                "ingredients": dict(self.crafting.ingredients),
+                "crafting_time": self.crafting.crafting_time,
+                "required_hideout_level": self.crafting.required_hideout_level,
+            })
+        if self.recycle is not None:
+            recycle = build_model(RecycleYield, {"materials": dict(self.recycle)})
+        return build_model(Item, {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "subcategory": self.subcategory,
+            "rarity": self.rarity,
+            "weight": self.weight,
+            "value": self.value,
+            "stats": stats,
+            "crafting": crafting,
+            "recycle": recycle,
+            "traders": list(self.traders),
+            "quest_requirements": list(self.quest_requirements),
+            "image_url": self.image_url,
+        })
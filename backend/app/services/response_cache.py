@@ -0,0 +1,162 @@
+import asyncio
+import gzip
+import json
+from typing import Awaitable, Callable, Dict, Iterable, Sequence
+
+from cachetools import LRUCache
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from ..core.config import get_settings
+from .data_service import data_service
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+settings = get_settings()
+
+# Encodings large bodies may be sent in, best first
+_PREFERENCE = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(content) -> bytes:
+    """Encode a response body the way FastAPI would, with orjson when it is installed."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, default=_default, ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode()
+
+
+def json_response(content) -> Response:
+    """
+    A JSON response encoded straight from `content`.
+
+    For routes returning models built from validated data: FastAPI would
+    otherwise dump them to dicts and validate those against the route's
+    response_model before encoding. The response_model still documents the route.
+    """
+    return Response(encode_json(content), media_type="application/json")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """The body in one of the _PREFERENCE content encodings."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.brotli_quality)
+    return gzip.compress(body, compresslevel=settings.gzip_level, mtime=0)
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    """The available encoding the client accepts with the highest q, preferring br, then gzip."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    best, best_q = "identity", 0.0
+    for encoding in _PREFERENCE:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class ResponseCache:
+    """
+    Encoded JSON bodies of read endpoints, keyed by path, query and dataset digests.
+
+    A hit is a dict lookup: the body is built and encoded once per dataset
+    contents. Large bodies are compressed lazily, into the encoding a
+    request's Accept-Encoding prefers, and that result is stored next to
+    the body, so each encoding is produced at most once per entry. Entries
+    of a dataset are dropped when it changes (see
+    ArcDataService.add_change_listener), and the key's digests keep a body
+    built from other data from ever being served for it. Digests, unlike
+    version numbers, cannot collide between local and shared reloads.
+    """
+
+    def __init__(self, maxsize: int):
+        self._bodies: LRUCache = LRUCache(maxsize=maxsize)
+        self.stats = {"hits": 0, "misses": 0, "compressions": 0}
+
+    async def serve(self, request: Request, datasets: Sequence[str],
+                    build: Callable[[], Awaitable], compress_on_miss: bool = True) -> Response:
+        """
+        Respond with the cached body for this request, or `build()` and cache it.
+
+        `datasets` are the datasets the body is derived from, and `build`
+        returns the content the route would otherwise return. Routes whose
+        keys are mostly one-off (free-form queries) pass `compress_on_miss`
+        False: a body is then only compressed once it is requested again.
+        """
+        query = tuple(sorted(request.query_params.multi_items()))
+        key = None
+        # A dataset that expired from the data cache must be reloaded by build()
+        # first, and the body is then not cached: its key is not known up front
+        if all(data_service.touch(dataset) for dataset in datasets):
+            # Taken before build(): a reload finishing while it runs must not
+            # file a body of the old data under the new digests
+            key = (request.url.path, query, tuple(datasets), data_service.get_digests(datasets))
+            encodings = self._bodies.get(key)
+            if encodings is not None:
+                self.stats["hits"] += 1
+                return await self._respond(request, encodings, may_compress=True)
+
+        self.stats["misses"] += 1
+        encodings = {"identity": encode_json(await build())}
+        if key is not None:
+            self._bodies[key] = encodings
+        return await self._respond(request, encodings, may_compress=compress_on_miss)
+
+    async def _respond(self, request: Request, encodings: Dict[str, bytes], may_compress: bool) -> Response:
+        """Send the stored encoding the client prefers, compressing it first if allowed and missing."""
+        body = encodings["identity"]
+        available = encodings
+        if may_compress and len(body) >= settings.compress_min_size:
+            available = ("identity", *_PREFERENCE)
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""), available)
+        if encoding not in encodings:
+            # Once per encoding and entry, off the event loop
+            encodings[encoding] = await asyncio.to_thread(compress, body, encoding)
+            self.stats["compressions"] += 1
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(encodings[encoding], media_type="application/json", headers=headers)
+
+    def invalidate(self, change: dict):
+        """Drop every body derived from the dataset in a changelog entry."""
+        for key in [key for key in self._bodies if change["dataset"] in key[2]]:
+            del self._bodies[key]
+
+    def status(self) -> dict:
+        return {
+            **self.stats,
+            "entries": len(self._bodies),
+            "encoder": "orjson" if orjson else "json",
+            "encodings": list(_PREFERENCE),
+        }
+
+
+response_cache = ResponseCache(settings.response_cache_size)
+data_service.add_change_listener(response_cache.invalidate)
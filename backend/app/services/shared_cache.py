@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import LockError
+
+_PREFIX = "arc"
+_CHANNEL = f"{_PREFIX}:datasets"
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+class SharedCache:
+    """
+    Redis tier shared by every worker: versioned dataset snapshots, a refresh
+    lock per dataset, and a pub/sub channel announcing each publication.
+
+    Snapshots are stored under arc:snapshot:<dataset>:<version>, with
+    arc:snapshot:<dataset>:current naming the latest. Versions come from one
+    cluster-wide counter so they never collide between workers. Each is
+    stored behind an HMAC of its key and bytes, and one that does not verify
+    is never handed out: workers unpickle snapshots, so an unsigned one from
+    anyone with write access to Redis would run code in every worker.
+    """
+
+    def __init__(self, url: str, lock_timeout: float, secret: str):
+        self.redis = redis.from_url(url)
+        self.lock_timeout = lock_timeout
+        self._secret = secret.encode()
+        self.worker_id = uuid.uuid4().hex
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(dataset: str, version) -> str:
+        return f"{_PREFIX}:snapshot:{dataset}:{version}"
+
+    def _signature(self, key: str, data: bytes) -> bytes:
+        return hmac.new(self._secret, key.encode() + b"\0" + data, hashlib.sha256).digest()
+
+    async def connect(self, on_message: Callable[[dict], Awaitable[None]]):
+        """Check the connection and start passing other workers' announcements to `on_message`."""
+        await self.redis.ping()
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(_CHANNEL)
+        self._listener = asyncio.create_task(self._listen(on_message))
+
+    async def _listen(self, on_message: Callable[[dict], Awaitable[None]]):
+        async for message in self._pubsub.listen():
+            try:
+                announcement = json.loads(message["data"])
+                if announcement.get("worker") != self.worker_id:
+                    await on_message(announcement)
+            except Exception as e:
+                print(f"Shared cache message error: {e}")
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        await self.redis.aclose()
+
+    async def current_version(self, dataset: str) -> Optional[int]:
+        version = await self.redis.get(self._key(dataset, "current"))
+        return int(version) if version is not None else None
+
+    async def get(self, dataset: str, version: int) -> Optional[bytes]:
+        """A stored snapshot, or None if there is none or its signature does not verify."""
+        key = self._key(dataset, version)
+        signed = await self.redis.get(key)
+        if signed is None:
+            return None
+        signature, data = signed[:_SIGNATURE_SIZE], signed[_SIGNATURE_SIZE:]
+        if not hmac.compare_digest(signature, self._signature(key, data)):
+            print(f"Shared cache: rejected {key}, bad signature")
+            return None
+        return data
+
+    async def publish(self, dataset: str, data: Optional[bytes], ttl: int) -> Optional[int]:
+        """
+        Store a new snapshot of a dataset and announce it to the other workers.
+
+        With `data` None the dataset was refreshed but unchanged, and only
+        its freshness is announced. Returns the version announced.
+        """
+        if data is None:
+            version = await self.current_version(dataset)
+        else:
+            version = await self.redis.incr(f"{_PREFIX}:version")
+            async with self.redis.pipeline(transaction=True) as pipe:
+                key = self._key(dataset, version)
+                pipe.set(key, self._signature(key, data) + data, ex=ttl)
+                pipe.set(self._key(dataset, "current"), version, ex=ttl)
+                await pipe.execute()
+        announcement = {
+            "dataset": dataset,
+            "version": version,
+            "worker": self.worker_id,
+            "published_at": time.time(),
+        }
+        await self.redis.publish(_CHANNEL, json.dumps(announcement))
+        return version
+
+    async def acquire_lock(self, dataset: str):
+        """Take the dataset's refresh lock without waiting. Returns None if another worker holds it."""
+        lock = self.redis.lock(f"{_PREFIX}:lock:{dataset}", timeout=self.lock_timeout)
+        return lock if await lock.acquire(blocking=False) else None
+
+    async def release_lock(self, lock):
+        try:
+            await lock.release()
+        except LockError:
+            # Held past lock_timeout and already expired
+            pass
+
+    async def wait_unlocked(self, dataset: str, timeout: float, interval: float = 0.2):
+        """Wait until nobody holds the dataset's refresh lock, for at most `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not await self.redis.exists(f"{_PREFIX}:lock:{dataset}"):
+                return
+            await asyncio.sleep(interval)
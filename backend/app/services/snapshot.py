@@ -0,0 +1,103 @@
+import mmap
+import os
+import pickle
+import struct
+from typing import Optional
+
+# Layout: header, pickled state, then each out-of-band buffer (numpy columns)
+# as a length followed by its bytes, aligned so arrays can be viewed in place
+MAGIC = b"ARCSNAP"
+# Bump on any change to the container or to the per-dataset state layout
+# (ArcDataService._dataset_state); the tag covers DATASET_FIELDS
+FORMAT_VERSION = 3  # 2: items held as ItemRecord, 3: tag carries the dataset layout
+_HEADER = struct.Struct("<7sBH")  # magic, format version, tag length
+_LENGTH = struct.Struct("<Q")
+_ALIGN = 16
+
+
+def _pad(size: int) -> bytes:
+    return b"\0" * (-size % _ALIGN)
+
+
+def encode_snapshot(state: dict, tag: str) -> bytes:
+    """
+    Serialize service state into the snapshot format.
+
+    `tag` (the app version and dataset layout) is stored in the header so a
+    snapshot written by another release, whose pickled classes or fields may
+    differ, is never loaded.
+    """
+    buffers = []
+    payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    tag_bytes = tag.encode()
+    parts = [
+        _HEADER.pack(MAGIC, FORMAT_VERSION, len(tag_bytes)), tag_bytes,
+        _LENGTH.pack(len(buffers)), _LENGTH.pack(len(payload)), payload,
+    ]
+    offset = sum(len(part) for part in parts)
+    for buffer in buffers:
+        raw = buffer.raw()
+        header = _LENGTH.pack(raw.nbytes)
+        padding = _pad(offset + len(header))
+        parts += [header, padding, raw]
+        offset += len(header) + len(padding) + raw.nbytes
+    return b"".join(parts)
+
+
+def write_snapshot(path: str, data: bytes):
+    """Atomically replace the snapshot at `path`."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def decode_snapshot(view: memoryview, tag: str) -> Optional[dict]:
+    """
+    Load state from snapshot bytes, or return None if they are not for this tag.
+
+    Numpy columns are viewed straight from `view`, which must be writable
+    for them to be patched later.
+    """
+    magic, version, tag_length = _HEADER.unpack_from(view, 0)
+    offset = _HEADER.size
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    if bytes(view[offset:offset + tag_length]).decode() != tag:
+        return None
+    offset += tag_length
+
+    (buffer_count,) = _LENGTH.unpack_from(view, offset)
+    (payload_length,) = _LENGTH.unpack_from(view, offset + _LENGTH.size)
+    offset += 2 * _LENGTH.size
+    payload = view[offset:offset + payload_length]
+    offset += payload_length
+
+    buffers = []
+    for _ in range(buffer_count):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        offset += len(_pad(offset))
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(payload, buffers=buffers)
+
+
+def read_snapshot(path: str, tag: str) -> Optional[dict]:
+    """
+    Load state from a snapshot file, or return None if there is none for this tag.
+
+    The file is memory-mapped copy-on-write: numpy columns are used straight
+    from the mapping and only pages that later get patched are copied.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+    except FileNotFoundError:
+        return None
+    return decode_snapshot(view, tag)
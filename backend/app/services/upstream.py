@@ -0,0 +1,164 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+T = TypeVar("T")
+
+# Statuses worth retrying: the upstream is overloaded or briefly failing
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `failure_threshold` failed calls in a row the circuit opens and
+    calls fail fast. Once `reset_timeout` seconds have passed, one trial call
+    is let through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+
+    def allow(self):
+        """Raise CircuitOpenError unless a call may go through now."""
+        if self.state == "closed":
+            return
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._trial_running:
+            self._trial_running = True
+            return
+        raise CircuitOpenError("circuit open")
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_running = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """Let another half-open trial through after one ended without an outcome."""
+        self._trial_running = False
+
+    def snapshot(self) -> dict:
+        retry_in = None
+        if self.state == "open":
+            retry_in = round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 1)
+        return {"state": self.state, "consecutive_failures": self.failures, "retry_in": retry_in}
+
+
+class UpstreamClient:
+    """
+    Connection pool, retry policy and circuit breaker for one upstream.
+
+    Requests are retried on transport errors and RETRY_STATUSES with full
+    jitter exponential backoff. A call that still fails counts once against
+    the breaker; client errors such as 404 do not.
+    """
+
+    def __init__(self, name: str, max_connections: int, timeout: httpx.Timeout,
+                 retries: int, backoff_base: float, backoff_max: float,
+                 breaker: CircuitBreaker, http2: bool = False,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.name = name
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+            http2=http2 and HTTP2_AVAILABLE,
+            transport=transport,
+        )
+        self.stats = {"calls": 0, "retries": 0, "failures": 0, "rejected": 0}
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def call(self, request: Callable[[httpx.AsyncClient], Awaitable[T]]) -> T:
+        """
+        Run `request(client)` under the retry policy and circuit breaker.
+
+        `request` may return a response or raise httpx.HTTPStatusError; either
+        way a retryable status is retried. The final response is returned
+        as is, so callers still check its status.
+        """
+        try:
+            self.breaker.allow()
+        except CircuitOpenError:
+            self.stats["rejected"] += 1
+            raise CircuitOpenError(f"{self.name} circuit open, failing fast")
+        self.stats["calls"] += 1
+        try:
+            return await self._attempts(request)
+        except BaseException:
+            # Cancelled or failed outside the transport: free a half-open trial
+            self.breaker.release_trial()
+            raise
+
+    async def _attempts(self, request: Callable[[httpx.AsyncClient], Awaitable[T]]) -> T:
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                result = await request(self.client)
+                status = result.status_code if isinstance(result, httpx.Response) else None
+                if status not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return result
+                if last_attempt:
+                    self._failed()
+                    return result
+                await result.aclose()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    raise
+                if last_attempt:
+                    self._failed()
+                    raise
+            except httpx.TransportError:
+                if last_attempt:
+                    self._failed()
+                    raise
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._backoff(attempt))
+
+    def _failed(self):
+        self.stats["failures"] += 1
+        self.breaker.record_failure()
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.call(lambda client: client.get(url, **kwargs))
+
+    def status(self) -> dict:
+        return {**self.breaker.snapshot(), **self.stats}
+
+    async def aclose(self):
+        await self.client.aclose()
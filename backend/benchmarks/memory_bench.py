@@ -0,0 +1,46 @@
+"""
+Memory held by the item collection: pydantic models vs compact records.
+
+Items are decoded from JSON first, as they would be from an upstream
+response, so repeated strings start out as separate objects. Run from
+backend/:
+
+    python -m benchmarks.memory_bench [--items 50000]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from app.services.normalize import normalize_item
+from app.services.records import ItemRecord
+from benchmarks.normalize_bench import synthetic_items
+
+
+def measure(label: str, build, raws: list) -> int:
+    """Bytes still allocated by `build(raws)` once raw records are released."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    collection = build(json.loads(json.dumps(raws)))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    print(f"{label:<20} {size / 2**20:8.1f} MiB {size / len(collection):8.0f} B/item")
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    args = parser.parse_args()
+
+    raws = synthetic_items(args.items)
+    print(f"{args.items:,} synthetic items")
+    before = measure("pydantic models", lambda rs: [normalize_item(r) for r in rs], raws)
+    after = measure("item records", lambda rs: [ItemRecord(normalize_item(r)) for r in rs], raws)
+    print(f"reduction: {1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Normalization throughput on a synthetic item payload.
+
+Compares normalizing in-process with spreading the batch over a process
+pool (normalize_batch). Run from backend/:
+
+    python -m benchmarks.normalize_bench [--items 50000] [--processes 4]
+"""
+import argparse
+import os
+import random
+import time
+
+from app.services.normalize import normalize_batch, normalize_item
+
+CATEGORIES = ["weapon", "armor", "material", "consumable", "rifle", "helmet"]
+RARITIES = ["common", "uncommon", "rare", "epic", "legendary"]
+TRADERS = ["celeste", "shani", "lance", "apollo", "tian wen"]
+WORDS = ["rusted", "gear", "battery", "wire", "scrap", "plate", "rifle", "core", "lens", "fuse"]
+
+
+def synthetic_items(count: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        item = {
+            "id": f"item-{i}",
+            "name": " ".join(rng.sample(WORDS, 2)).title() + f" {i}",
+            "description": "A " + " ".join(rng.sample(WORDS, 5)),
+            "category": rng.choice(CATEGORIES),
+            "type": rng.choice(["light", "heavy", None]),
+            "rarity": rng.choice(RARITIES),
+            "value": rng.randint(1, 5000),
+            "weight": round(rng.random() * 5, 2),
+            "traders": rng.sample(TRADERS, rng.randint(0, 2)),
+            "quests": [f"quest-{rng.randint(0, 200)}" for _ in range(rng.randint(0, 2))],
+            "image": f"https://example.com/items/{i}.png",
+        }
+        if i % 2:
+            item["stats"] = {
+                "damage": rng.randint(1, 80),
+                "fire_rate": rng.randint(0, 900),
+                "accuracy": rng.randint(10, 100),
+                "range": rng.randint(5, 300),
+            }
+        if i % 3 == 0:
+            item["recipe"] = {
+                "ingredients": {rng.choice(WORDS): rng.randint(1, 5) for _ in range(3)},
+                "time": rng.randint(10, 600),
+            }
+        if i % 4 == 0:
+            item["recycle"] = {"materials": {rng.choice(WORDS): rng.randint(1, 3)}}
+        items.append(item)
+    return items
+
+
+def run(label: str, normalize, raws: list) -> float:
+    started = time.perf_counter()
+    result = normalize(raws)
+    elapsed = time.perf_counter() - started
+    assert len(result) == len(raws)
+    rate = len(raws) / elapsed
+    print(f"{label:<28} {elapsed:8.3f}s {rate:12,.0f} records/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    raws = synthetic_items(args.items)
+    print(f"{args.items:,} synthetic items")
+    in_process = run("in-process", lambda rs: normalize_batch(normalize_item, rs), raws)
+    pooled = run(
+        f"{args.processes} processes",
+        lambda rs: normalize_batch(normalize_item, rs, args.processes),
+        raws
+    )
+    print(f"pool speedup: {pooled / in_process:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
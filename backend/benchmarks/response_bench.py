@@ -0,0 +1,67 @@
+"""
+Response encoding of a large item payload: response_model vs json_response.
+
+A route declaring response_model has FastAPI dump the returned models to
+dicts, validate those against the model again and then encode them;
+json_response encodes the already-validated models directly. Both routes
+are served through the test client, and their bodies must decode the
+same. Run from backend/:
+
+    python -m benchmarks.response_bench [--items 50000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.items import ItemBatchResponse
+from app.services.normalize import normalize_item
+from app.services.response_cache import json_response
+from benchmarks.normalize_bench import synthetic_items
+
+
+def build_app(items: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/validated", response_model=ItemBatchResponse)
+    async def validated():
+        return ItemBatchResponse(items=items, missing=[])
+
+    @app.get("/encoded", response_model=ItemBatchResponse)
+    async def encoded():
+        return json_response(ItemBatchResponse(items=items, missing=[]))
+
+    return app
+
+
+def run(label: str, client: TestClient, path: str, repeat: int) -> float:
+    client.get(path)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(path)
+        assert response.status_code == 200
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms/request {len(response.content) / 2**20:8.1f} MiB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = [normalize_item(raw) for raw in synthetic_items(args.items)]
+    client = TestClient(build_app(items))
+    assert json.loads(client.get("/validated").content) == json.loads(client.get("/encoded").content)
+
+    print(f"{args.items:,} items per response")
+    validated = run("response_model", client, "/validated", args.repeat)
+    encoded = run("json_response", client, "/encoded", args.repeat)
+    print(f"json_response speedup: {validated / encoded:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from app.services import data_service as data_service_module
+from app.services.data_service import ArcDataService
+from app.services.normalize import normalize_item
+from app.services.records import ItemRecord
+
+EVENTS = [{"id": "storm", "name": "Electromagnetic Storm"}]
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    data_service_module._events_cache.clear()
+    yield
+    data_service_module._events_cache.clear()
+
+
+def test_last_good_events_outlive_a_dead_upstream(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "upstream_retries", 0)
+    requests = []
+    up = {"ok": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=EVENTS) if up["ok"] else httpx.Response(503)
+
+    service = ArcDataService(transport=httpx.MockTransport(handler))
+    assert asyncio.run(service.fetch_events()) == EVENTS
+    loaded_at = service._loaded_at["events"]
+
+    # Past the hard TTL, with the upstream down: one inline reload fails...
+    up["ok"] = False
+    data_service_module._events_cache.clear()
+    assert asyncio.run(service.fetch_events()) == EVENTS
+    assert len(requests) == 2
+
+    # ...and the last good events are cached again, still stale, so the
+    # requests after it neither wait on nor hit the upstream
+    for _ in range(5):
+        assert asyncio.run(service.fetch_events()) == EVENTS
+    assert len(requests) == 2
+    assert service._loaded_at["events"] == loaded_at
+
+
+def item(i: int, **changes) -> ItemRecord:
+    raw = {
+        "id": f"item-{i}",
+        "name": ["Rusted Gear", "Battery Pack", "Wire Spool"][i % 3] + f" {i}",
+        "description": "Salvaged parts" if i % 2 else None,
+        "category": ["material", "weapon"][i % 2],
+        "rarity": ["common", "rare", "epic"][i % 3],
+        "value": i * 10,
+        "traders": ["celeste", "shani"][:i % 3],
+        "quests": [f"q{i % 4}"],
+        "stats": {"damage": i, "range": 100 - i} if i % 2 else {},
+    }
+    raw.update(changes)
+    return ItemRecord(normalize_item(raw))
+
+
+def index_state(service: ArcDataService) -> dict:
+    """Everything the item indexes hold, in a comparable form."""
+    columns = service._item_columns
+    return {
+        "text": service._item_text_index._postings,
+        "names": (service._item_name_index._postings, service._item_name_index._sizes),
+        "fields": {field: index._postings for field, index in service._item_field_indexes.items()},
+        "values": service._item_value_index.between(),
+        "quests": service._item_quest_index._postings,
+        # NaN never equals itself: the valid masks below tell missing values apart
+        "columns": {field: np.nan_to_num(columns.data[field], nan=-1).tolist() for field in columns.data},
+        "valid": {field: columns.valid[field].tolist() for field in columns.valid},
+    }
+
+
+def test_patched_item_indexes_match_a_rebuild():
+    old_items = [item(i) for i in range(12)]
+    new_items = list(old_items)
+    new_items[1] = item(1, name="Copper Coil", rarity="legendary", traders=[], value=0)
+    new_items[4] = item(4, category="armor", quests=[], stats={"armor": 40})
+    new_items[9] = item(9, description="Rusted casing", value=5)
+    new_items += [item(i) for i in range(12, 15)]
+
+    patched = ArcDataService()
+    patched._all_items = old_items
+    patched._build_item_indexes(old_items)
+    patched._all_items = new_items
+    patched._patch_item_indexes(old_items, [1, 4, 9], range(12, 15))
+
+    rebuilt = ArcDataService()
+    rebuilt._all_items = new_items
+    rebuilt._build_item_indexes(new_items)
+
+    assert index_state(patched) == index_state(rebuilt)
+
+
+def test_patched_columns_update_in_place_without_additions():
+    old_items = [item(i) for i in range(6)]
+    new_items = list(old_items)
+    new_items[3] = item(3, stats={"damage": 99})
+
+    patched = ArcDataService()
+    patched._all_items = old_items
+    patched._build_item_indexes(old_items)
+    patched._all_items = new_items
+    patched._patch_item_indexes(old_items, [3], [])
+
+    rebuilt = ArcDataService()
+    rebuilt._all_items = new_items
+    rebuilt._build_item_indexes(new_items)
+
+    assert index_state(patched) == index_state(rebuilt)
@@ -0,0 +1,76 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services import http_cache
+from app.services.http_cache import ConditionalGetMiddleware
+
+
+class FakeData:
+    """Stands in for data_service: one dataset a route may see reloaded."""
+
+    def __init__(self):
+        self.digest = "old"
+        self.loaded = True
+
+    def touch(self, dataset: str) -> bool:
+        return self.loaded
+
+    def get_digest(self, dataset: str) -> str:
+        return self.digest
+
+    def freshness(self, dataset: str) -> int:
+        return 60
+
+
+def make_client(monkeypatch, data: FakeData) -> TestClient:
+    monkeypatch.setattr(http_cache, "data_service", data)
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware)
+
+    @app.get("/api/items")
+    async def items():
+        body = {"data": data.digest}
+        # A reload lands while the route runs
+        data.digest = "new"
+        return body
+
+    @app.get("/api/status")
+    async def status():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_etag_is_the_one_for_the_data_the_route_read(monkeypatch):
+    data = FakeData()
+    client = make_client(monkeypatch, data)
+
+    first = client.get("/api/items")
+    assert first.json() == {"data": "old"}
+    assert first.headers["cache-control"] == "public, max-age=60"
+
+    # The ETag sent with "old" must not validate against "new"
+    second = client.get("/api/items", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200 and second.json() == {"data": "new"}
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_unchanged_data_answers_304_without_running_the_route(monkeypatch):
+    data = FakeData()
+    client = make_client(monkeypatch, data)
+
+    etag = client.get("/api/items").headers["etag"]
+    data.digest = "old"
+    response = client.get("/api/items", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.headers["etag"] == etag
+    assert data.digest == "old"
+
+
+def test_no_validators_while_loading_or_off_dataset_routes(monkeypatch):
+    data = FakeData()
+    data.loaded = False
+    client = make_client(monkeypatch, data)
+
+    assert "etag" not in client.get("/api/items").headers
+    data.loaded = True
+    assert "etag" not in client.get("/api/status").headers
@@ -0,0 +1,69 @@
+from app.services.indexes import FieldIndex, RangeIndex, TextIndex
+
+WEIGHTS = {"name": 3.0, "description": 1.0}
+DOCS = [
+    {"name": "Rusted Gear", "description": "Salvaged from old machines"},
+    {"name": "Battery Pack", "description": "Rusted casing, still charged"},
+    {"name": "Gearbox", "description": None},
+    {"name": "Wire Spool", "description": "Copper wire"},
+]
+
+
+def text_index() -> TextIndex:
+    index = TextIndex(WEIGHTS)
+    for ordinal, doc in enumerate(DOCS):
+        index.add(ordinal, doc)
+    return index
+
+
+def test_text_search_matches_prefixes_and_ranks_exact_name_hits_first():
+    index = text_index()
+    # "gear" is a whole token of doc 0 and a prefix of doc 2's "gearbox"
+    assert index.search("gear") == [(0, 3.0), (2, 1.5)]
+    # Name hits outrank description hits
+    assert index.search("rusted") == [(0, 3.0), (1, 1.0)]
+    assert [ordinal for ordinal, _ in index.search("ru")] == [0, 1]
+
+
+def test_text_search_requires_every_token():
+    index = text_index()
+    assert [ordinal for ordinal, _ in index.search("rust gea")] == [0]
+    assert index.search("rusted wire") == []
+    assert index.search("  ") == []
+
+
+def test_text_remove_forgets_tokens():
+    index = text_index()
+    index.remove(2, DOCS[2])
+    assert index.search("gearb") == []
+    assert [ordinal for ordinal, _ in index.search("gear")] == [0]
+
+
+def test_field_index_postings():
+    index = FieldIndex()
+    index.add(0, ("weapon",))
+    index.add(1, ("armor",))
+    index.add(2, ("weapon", None))
+    assert index.get("weapon") == {0, 2}
+    assert index.get("missing") == set()
+
+    index.remove(0, ("weapon",))
+    index.remove(1, ("armor",))
+    assert index.get("weapon") == {2}
+    assert sorted(index.values()) == ["weapon"]
+
+
+def test_range_index_queries_are_inclusive_and_track_changes():
+    index = RangeIndex()
+    for ordinal, value in enumerate([50, 10, None, 30, 10]):
+        index.add(ordinal, value)
+
+    assert index.between(10, 30) == [1, 4, 3]
+    assert index.between(low=30) == [3, 0]
+    assert index.count_between(high=10) == 2
+    assert index.filter([0, 1, 2, 3], 20, 60) == {0, 3}
+
+    index.remove(0)
+    index.add(2, 20)
+    assert index.between() == [1, 4, 2, 3]
+    assert index.value_of(0) is None
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services import data_service as data_service_module
+from app.services.data_service import ArcDataService
+from app.services.ingest import IncompleteFetch, JsonRecordStream, total_pages
+
+PAGE_SIZE = 3
+QUESTS = [{"id": f"q{i}", "name": f"Quest {i}"} for i in range(8)]
+
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "ingest_page_size", PAGE_SIZE)
+
+
+def test_total_pages_reads_totals_but_not_page_counts():
+    assert total_pages({"totalPages": 4}, PAGE_SIZE) == 4
+    assert total_pages({"pagination": {"total": 7}}, PAGE_SIZE) == 3
+    assert total_pages({"meta": {"total_count": 3}}, PAGE_SIZE) == 1
+    # Records on this page, not in the collection
+    assert total_pages({"count": 3}, PAGE_SIZE) is None
+
+
+@pytest.mark.parametrize("payload", [
+    b'{"total": 5, "items": [], "x": 1500.0}',
+    b'{"items": [{"id": "a", "value": -2.5e+3}, {"id": "b", "value": 10}], "total": 2}',
+    b'[{"id": "a", "weight": 0.25}, {"id": "b", "weight": 1E2}]',
+])
+def test_stream_decodes_the_same_at_every_split(payload):
+    expected = json.loads(payload)
+    for offset in range(len(payload) + 1):
+        stream = JsonRecordStream("items")
+        records = stream.feed(payload[:offset]) + stream.feed(payload[offset:]) + stream.close()
+        if isinstance(expected, list):
+            assert records == expected, offset
+        else:
+            assert records == expected["items"], offset
+            assert stream.meta == {k: v for k, v in expected.items() if k != "items"}, offset
+
+
+def test_stream_rejects_a_truncated_number():
+    stream = JsonRecordStream("items")
+    stream.feed(b'{"items": [], "x": 1500.')
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def fetch_quests(meta) -> tuple:
+    """Fetch QUESTS paged by PAGE_SIZE, each page carrying `meta(page_records)`."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        records = QUESTS[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        return httpx.Response(200, json={"quests": records, **meta(records)})
+
+    service = ArcDataService(transport=httpx.MockTransport(handler))
+    records = asyncio.run(service._fetch_paged(
+        "metaforge:quests", "https://metaforge.test/quests", "quests"
+    ))
+    return records, requested
+
+
+def test_page_count_from_count_field_is_not_trusted():
+    records, _ = fetch_quests(lambda page: {"count": len(page)})
+    assert [quest["id"] for quest in records] == [quest["id"] for quest in QUESTS]
+
+
+def test_full_single_page_keeps_probing():
+    records, requested = fetch_quests(lambda page: {"totalPages": 1})
+    assert len(records) == len(QUESTS)
+    assert requested == [1, 2, 3]
+
+
+def test_total_drives_concurrent_pages():
+    records, requested = fetch_quests(lambda page: {"total": len(QUESTS)})
+    assert len(records) == len(QUESTS)
+    assert sorted(requested) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("meta", [lambda page: {"total": len(QUESTS)}, lambda page: {}])
+def test_page_cap_raises_with_the_pages_it_fetched(monkeypatch, meta):
+    monkeypatch.setattr(data_service_module.settings, "ingest_max_pages", 2)
+    with pytest.raises(IncompleteFetch) as raised:
+        fetch_quests(meta)
+    assert [quest["id"] for quest in raised.value.records] == ["q0", "q1", "q2", "q3", "q4", "q5"]
+
+
+def test_cut_off_quests_only_stand_in_for_a_missing_load(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "ingest_max_pages", 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        records = QUESTS[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        return httpx.Response(200, json={"quests": records, "total": len(QUESTS)})
+
+    service = ArcDataService(transport=httpx.MockTransport(handler))
+    assert len(asyncio.run(service.fetch_quests_from_metaforge())) == 6
+    assert asyncio.run(service.fetch_quests_from_metaforge(conditional=True)) == []
+    assert "metaforge:quests" not in service._validators
@@ -0,0 +1,19 @@
+from fastapi.testclient import TestClient
+
+from app.api import items as items_api
+from app.main import app
+
+
+def test_aggregates_take_the_value_range_like_search(monkeypatch):
+    calls = []
+
+    async def get_item_aggregates(**filters):
+        calls.append(filters)
+        return {}
+
+    monkeypatch.setattr(items_api.data_service, "get_item_aggregates", get_item_aggregates)
+    response = TestClient(app).get("/api/items/aggregates?category=weapon&min_value=100&max_value=500")
+
+    assert response.status_code == 200
+    assert calls[0]["category"] == "weapon"
+    assert (calls[0]["min_value"], calls[0]["max_value"]) == (100, 500)
@@ -0,0 +1,42 @@
+from app.services.merge import ITEM_FIELD_ALIASES, merge_records
+
+ORDER = ["metaforge", "ardb", "raidtheory"]
+PRECEDENCE = {"crafting": ["raidtheory", "metaforge", "ardb"]}
+
+
+def merge(records_by_source: dict) -> list:
+    return merge_records(records_by_source, ORDER, PRECEDENCE, ITEM_FIELD_ALIASES)
+
+
+def test_sources_fill_each_others_gaps_in_order():
+    [(record, provenance)] = merge({
+        "metaforge": [{"id": "rusted-gear", "name": "Rusted Gear", "value": None, "description": ""}],
+        "ardb": [{"id": "Rusted Gear", "price": 120, "desc": "Old gear", "rarity": "common"}],
+        "raidtheory": [{"id": "rusted_gear", "value": 999, "rarity": "uncommon"}],
+    })
+    # Empty values don't count; the first source in `order` with one wins
+    assert record == {
+        "id": "rusted-gear", "name": "Rusted Gear", "price": 120, "desc": "Old gear", "rarity": "common",
+    }
+    assert provenance == {
+        "id": "metaforge", "name": "metaforge", "value": "ardb", "description": "ardb", "rarity": "ardb",
+    }
+
+
+def test_field_precedence_overrides_source_order_with_all_aliases():
+    [(record, provenance)] = merge({
+        "metaforge": [{"id": "rifle", "crafting": {"metal": 2}}],
+        "raidtheory": [{"id": "rifle", "recipe": {"metal": 3}}],
+    })
+    assert record["recipe"] == {"metal": 3} and "crafting" not in record
+    assert provenance["crafting"] == "raidtheory"
+
+
+def test_records_match_by_slug_and_never_pair_within_a_source():
+    merged = merge({
+        "metaforge": [{"id": "a", "name": "Wire"}, {"id": "b", "name": "Wire"}],
+        "ardb": [{"slug": "wire", "value": 5}, {"id": "c", "name": "Fuse"}],
+    })
+    names = [(record.get("id"), record.get("name"), record.get("value")) for record, _ in merged]
+    # Order of first appearance; "wire" pairs with the first Wire only
+    assert names == [("a", "Wire", 5), ("b", "Wire", None), ("c", "Fuse", None)]
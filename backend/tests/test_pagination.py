@@ -0,0 +1,24 @@
+import pytest
+
+from app.services.pagination import SearchResult
+
+
+def test_cursor_resumes_after_last_record():
+    result = SearchResult([0, 2, 3, 5, 8], [5.0, 4.0, 4.0, 2.0, 1.0])
+    first, cursor = result.page(2, version="v1")
+    second, cursor = result.page(2, cursor=cursor, version="v1")
+    third, cursor = result.page(2, cursor=cursor, version="v1")
+    assert [*first, *second, *third] == [0, 2, 3, 5, 8]
+    assert cursor is None
+
+
+def test_cursor_from_another_version_is_rejected():
+    result = SearchResult(range(10))
+    _, cursor = result.page(3, version="v1")
+    with pytest.raises(ValueError, match="Stale cursor"):
+        result.page(3, cursor=cursor, version="v2")
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        SearchResult(range(10)).page(3, cursor="not-a-cursor", version="v1")
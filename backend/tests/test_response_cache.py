@@ -0,0 +1,130 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.services.response_cache import ResponseCache
+
+BODY = {"records": [{"id": f"record-{i}", "name": "x" * 20} for i in range(200)]}
+
+
+def make_client(cache: ResponseCache) -> TestClient:
+    app = FastAPI()
+
+    async def build():
+        return BODY
+
+    @app.get("/listing")
+    async def listing(request: Request):
+        return await cache.serve(request, (), build)
+
+    @app.get("/search")
+    async def search(request: Request):
+        return await cache.serve(request, (), build, compress_on_miss=False)
+
+    return TestClient(app)
+
+
+def get(client: TestClient, path: str, accept_encoding: str):
+    response = client.get(path, headers={"Accept-Encoding": accept_encoding})
+    return response.headers.get("content-encoding"), response
+
+
+def test_only_the_requested_encoding_is_produced_once():
+    cache = ResponseCache(maxsize=8)
+    client = make_client(cache)
+
+    encoding, response = get(client, "/listing", "identity")
+    assert encoding is None and response.json() == BODY
+    assert cache.stats["compressions"] == 0
+
+    for _ in range(3):
+        encoding, response = get(client, "/listing", "gzip")
+        assert encoding == "gzip" and response.json() == BODY
+    assert cache.stats["compressions"] == 1
+
+
+def test_one_off_keys_are_compressed_only_when_requested_again():
+    cache = ResponseCache(maxsize=8)
+    client = make_client(cache)
+
+    encoding, _ = get(client, "/search?q=rare", "gzip")
+    assert encoding is None
+    assert cache.stats["compressions"] == 0
+
+    encoding, response = get(client, "/search?q=rare", "gzip")
+    assert encoding == "gzip" and response.json() == BODY
+    assert cache.stats["compressions"] == 1
+
+
+def test_small_bodies_are_never_compressed():
+    cache = ResponseCache(maxsize=8)
+    app = FastAPI()
+
+    @app.get("/tiny")
+    async def tiny(request: Request):
+        async def build():
+            return {"ok": True}
+        return await cache.serve(request, (), build)
+
+    client = TestClient(app)
+    for _ in range(2):
+        encoding, _ = get(client, "/tiny", "gzip")
+        assert encoding is None
+    assert cache.stats["compressions"] == 0
+
+
+class FakeData:
+    """Stands in for data_service: one dataset whose contents build() may replace."""
+
+    def __init__(self):
+        self.digest = "old"
+        self.loaded = True
+
+    def touch(self, dataset: str) -> bool:
+        return self.loaded
+
+    def get_digests(self, datasets) -> tuple:
+        return tuple(self.digest for _ in datasets)
+
+
+def test_body_is_filed_under_the_digest_it_was_built_from(monkeypatch):
+    from app.services import response_cache as module
+
+    data = FakeData()
+    monkeypatch.setattr(module, "data_service", data)
+    cache = ResponseCache(maxsize=8)
+    app = FastAPI()
+    builds = []
+
+    @app.get("/listing")
+    async def listing(request: Request):
+        async def build():
+            body = {"data": data.digest}
+            builds.append(body["data"])
+            # A reload lands while the body is being built
+            data.digest = "new"
+            return body
+        return await cache.serve(request, ("items",), build)
+
+    client = TestClient(app)
+    assert client.get("/listing").json() == {"data": "old"}
+    assert client.get("/listing").json() == {"data": "new"}
+    assert builds == ["old", "new"]
+
+
+def test_body_built_while_loading_is_not_cached(monkeypatch):
+    from app.services import response_cache as module
+
+    data = FakeData()
+    data.loaded = False
+    monkeypatch.setattr(module, "data_service", data)
+    cache = ResponseCache(maxsize=8)
+    app = FastAPI()
+
+    @app.get("/listing")
+    async def listing(request: Request):
+        async def build():
+            return BODY
+        return await cache.serve(request, ("items",), build)
+
+    assert TestClient(app).get("/listing").json() == BODY
+    assert cache.status()["entries"] == 0
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.services import data_service as data_service_module
+from app.services.data_service import ArcDataService
+from app.services.shared_cache import SharedCache
+
+QUESTS = [{"id": f"q{i}", "name": f"Quest {i}", "giver": "celeste"} for i in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def no_disk_snapshot(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "snapshot_path", "")
+
+
+def shared_cache(server, secret: str = "secret") -> SharedCache:
+    shared = SharedCache("redis://localhost", lock_timeout=5.0, secret=secret)
+    shared.redis = fakeredis.aioredis.FakeRedis(server=server)
+    return shared
+
+
+def test_publish_and_get_verify_signature():
+    async def run():
+        server = fakeredis.FakeServer()
+        writer, reader, stranger = shared_cache(server), shared_cache(server), shared_cache(server, "other")
+        version = await writer.publish("quests", b"snapshot", ttl=60)
+
+        assert await reader.current_version("quests") == version
+        assert await reader.get("quests", version) == b"snapshot"
+        # Signed with another secret
+        assert await stranger.get("quests", version) is None
+
+        # Written to Redis by someone without the secret
+        key = writer._key("quests", version)
+        stored = await writer.redis.get(key)
+        await writer.redis.set(key, stored[:-1] + b"!")
+        assert await reader.get("quests", version) is None
+        await writer.redis.set(key, b"snapshot")
+        assert await reader.get("quests", version) is None
+
+    asyncio.run(run())
+
+
+def test_refresh_lock_is_exclusive():
+    async def run():
+        server = fakeredis.FakeServer()
+        caches = [shared_cache(server) for _ in range(3)]
+        locks = await asyncio.gather(*(cache.acquire_lock("items") for cache in caches))
+        held = [lock for lock in locks if lock is not None]
+        assert len(held) == 1
+
+        await caches[0].release_lock(held[0])
+        await asyncio.wait_for(caches[1].wait_unlocked("items", timeout=1.0), 2.0)
+        assert await caches[2].acquire_lock("items") is not None
+
+    asyncio.run(run())
+
+
+def test_three_workers_load_once_and_adopt():
+    upstream_calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/quests"):
+            upstream_calls.append(request.url)
+            return httpx.Response(200, json={"quests": QUESTS})
+        return httpx.Response(404)
+
+    async def run():
+        server = fakeredis.FakeServer()
+        workers = [ArcDataService(transport=httpx.MockTransport(handler)) for _ in range(3)]
+        announced = [[] for _ in workers]
+        for worker, entries in zip(workers, announced):
+            shared = shared_cache(server)
+            await shared.connect(worker._on_shared_message)
+            worker._shared = shared
+            worker.add_change_listener(entries.append)
+
+        await asyncio.gather(*(
+            worker._load_coordinated("all_quests", worker._load_quests) for worker in workers
+        ))
+
+        # One worker fetched and published, the others adopted its snapshot
+        assert len(upstream_calls) == 1
+        versions = {worker._versions["quests"] for worker in workers}
+        assert len(versions) == 1 and versions != {0}
+        for worker in workers:
+            assert [quest.id for quest in worker._all_quests] == [quest["id"] for quest in QUESTS]
+            assert set(worker._quests_by_id) == {quest["id"] for quest in QUESTS}
+        # Adopting workers log and announce the change like the loading one
+        for worker, entries in zip(workers, announced):
+            assert [entry["dataset"] for entry in entries] == ["quests"]
+            assert sorted(entries[0]["added"]) == sorted(quest["id"] for quest in QUESTS)
+            assert list(worker.changelog) == entries
+
+        for worker in workers:
+            await worker._shared.close()
+
+    asyncio.run(run())
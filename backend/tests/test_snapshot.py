@@ -0,0 +1,58 @@
+import numpy as np
+
+from app.services.columns import ItemColumns
+from app.services.normalize import normalize_item
+from app.services.records import ItemRecord
+from app.services.snapshot import encode_snapshot, read_snapshot, write_snapshot
+
+TAG = "0.1.0+test"
+
+
+def state() -> dict:
+    items = [
+        ItemRecord(normalize_item({"id": f"item-{i}", "name": f"Gear {i}", "category": "material",
+                                   "value": (i + 1) * 10, "stats": {"damage": i}}))
+        for i in range(5)
+    ]
+    return {"items": {"fields": {"_all_items": items, "_item_columns": ItemColumns(items)}, "version": 3}}
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "data" / "snapshot.bin")
+    original = state()
+    write_snapshot(path, encode_snapshot(original, TAG))
+
+    loaded = read_snapshot(path, TAG)
+    fields = loaded["items"]["fields"]
+    assert loaded["items"]["version"] == 3
+    assert [item.id for item in fields["_all_items"]] == [item.id for item in original["items"]["fields"]["_all_items"]]
+    assert fields["_all_items"][2].stats.damage == 2
+    columns = fields["_item_columns"]
+    assert columns.data["value"].tolist() == [10, 20, 30, 40, 50]
+    assert columns.valid["damage"].all()
+
+
+def test_other_tag_or_no_file_loads_nothing(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    assert read_snapshot(path, TAG) is None
+    write_snapshot(path, encode_snapshot(state(), TAG))
+    assert read_snapshot(path, "0.2.0+test") is None
+    open(path, "wb").close()
+    assert read_snapshot(path, TAG) is None
+
+
+def test_mapped_columns_patch_in_place_without_touching_the_file(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, encode_snapshot(state(), TAG))
+
+    fields = read_snapshot(path, TAG)["items"]["fields"]
+    columns = fields["_item_columns"]
+    assert columns.data["value"].flags.writeable
+    items = list(fields["_all_items"])
+    items[1] = ItemRecord(normalize_item({"id": "item-1", "name": "Gear 1", "category": "material"}))
+    columns.update([1], items)
+    assert np.isnan(columns.data["value"][1]) and not columns.valid["value"][1]
+
+    # Copy-on-write: the snapshot on disk still holds the old value
+    reread = read_snapshot(path, TAG)["items"]["fields"]["_item_columns"]
+    assert reread.data["value"][1] == 20
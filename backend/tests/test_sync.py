@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import data_service as data_service_module
+from app.services.data_service import ArcDataService
+
+ALPHA = {"id": "alpha", "name": "Alpha", "category": "material"}
+ALPHA_V2 = {**ALPHA, "name": "Alpha v2"}
+BETA = {"id": "beta", "name": "Beta", "category": "material"}
+
+
+@pytest.fixture(autouse=True)
+def no_disk_snapshot(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "snapshot_path", "")
+
+
+def upstream(items: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/items"):
+            return httpx.Response(200, json={"items": items})
+        if path.endswith("/quests"):
+            return httpx.Response(200, json={"quests": [{"id": "q1", "name": "Quest"}]})
+        if path.endswith("/maps"):
+            return httpx.Response(200, json={"maps": [{"id": "dam", "name": "Dam"}]})
+        return httpx.Response(404)
+    return httpx.MockTransport(handler)
+
+
+async def load(worker: ArcDataService, items: list):
+    """Load every synced dataset into `worker` from an upstream serving `items`."""
+    for client in worker.upstreams.values():
+        client.client = httpx.AsyncClient(transport=upstream(items))
+    worker._source_records.clear()
+    await worker._load_items()
+    await worker._load_quests()
+    await worker._load_maps()
+
+
+def item_names(records) -> list:
+    return sorted(record.name for record in records)
+
+
+def test_cursor_from_other_data_resets_instead_of_matching_versions():
+    async def run():
+        a, b = ArcDataService(), ArcDataService()
+        await load(a, [ALPHA])
+        await load(b, [ALPHA_V2, BETA])
+        # Same process-local versions, different contents
+        assert a._versions == b._versions
+
+        since = (await a.get_bundle())["digests"]
+        delta = await b.get_changes_since(since)
+        assert delta["items"]["reset"]
+        assert item_names(delta["items"]["added"]) == ["Alpha v2", "Beta"]
+        # Same quests and maps in both workers: the cursor is valid for them
+        assert not delta["quests"]["reset"] and delta["quests"]["added"] == []
+
+    asyncio.run(run())
+
+
+def test_delta_between_retained_contents():
+    async def run():
+        worker = ArcDataService()
+        await load(worker, [ALPHA, BETA])
+        since = (await worker.get_bundle())["digests"]
+        await load(worker, [ALPHA_V2, {"id": "gamma", "name": "Gamma", "category": "material"}])
+
+        items = (await worker.get_changes_since(since))["items"]
+        assert not items["reset"]
+        assert item_names(items["added"]) == ["Gamma"]
+        assert item_names(items["changed"]) == ["Alpha v2"]
+        assert items["removed"] == ["beta"]
+
+        # A worker that loaded the same data answers the same cursor
+        other = ArcDataService()
+        await load(other, [ALPHA, BETA])
+        await load(other, [ALPHA_V2, {"id": "gamma", "name": "Gamma", "category": "material"}])
+        assert (await other.get_changes_since(since))["items"]["removed"] == ["beta"]
+
+    asyncio.run(run())
+
+
+def test_retained_contents_are_bounded(monkeypatch):
+    monkeypatch.setattr(data_service_module.settings, "sync_retained_versions", 3)
+
+    async def run():
+        worker = ArcDataService()
+        await load(worker, [ALPHA])
+        since = (await worker.get_bundle())["digests"]
+        for n in range(4):
+            await load(worker, [ALPHA, {**BETA, "name": f"Beta {n}"}])
+        assert len(worker._id_history["items"]) == 3
+        assert (await worker.get_changes_since(since))["items"]["reset"]
+
+    asyncio.run(run())
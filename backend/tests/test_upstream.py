@@ -0,0 +1,156 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import upstream as upstream_module
+from app.services.upstream import CircuitBreaker, CircuitOpenError, UpstreamClient
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(upstream_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    """Backoff delays requested, with full jitter pinned to its upper bound."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(upstream_module.asyncio, "sleep", sleep)
+    monkeypatch.setattr(upstream_module.random, "uniform", lambda low, high: high)
+    return delays
+
+
+def make_client(responses, retries=2, threshold=2, reset_timeout=30.0):
+    """An UpstreamClient answering from `responses` (statuses or exceptions) in turn, then 200."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = responses.pop(0) if responses else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={})
+
+    client = UpstreamClient(
+        "test", max_connections=1, timeout=httpx.Timeout(1.0), retries=retries,
+        backoff_base=0.25, backoff_max=0.75,
+        breaker=CircuitBreaker(threshold, reset_timeout),
+        transport=httpx.MockTransport(handler),
+    )
+    return client, requests
+
+
+def get(client: UpstreamClient) -> httpx.Response:
+    return asyncio.run(client.get("https://upstream.test/items"))
+
+
+def test_retries_retryable_statuses_with_capped_backoff(sleeps):
+    client, requests = make_client([503, 429])
+    assert get(client).status_code == 200
+    assert len(requests) == 3
+    assert sleeps == [0.25, 0.5]
+    assert client.status()["retries"] == 2
+    assert client.breaker.state == "closed"
+
+    client, _ = make_client([500, 500, 500, 500], retries=3, threshold=5)
+    get(client)
+    assert sleeps[2:] == [0.25, 0.5, 0.75]
+
+
+def test_retries_transport_errors(sleeps):
+    client, requests = make_client([httpx.ConnectError("refused")])
+    assert get(client).status_code == 200
+    assert len(requests) == 2
+
+
+def test_client_errors_are_not_retried_or_counted(sleeps):
+    client, requests = make_client([404, 404, 404], threshold=1)
+    assert get(client).status_code == 404
+    assert len(requests) == 1 and sleeps == []
+    assert client.breaker.state == "closed"
+    assert client.status()["failures"] == 0
+
+
+def test_exhausted_retries_return_last_response_and_count_once(sleeps):
+    client, requests = make_client([502, 502, 502], threshold=2)
+    assert get(client).status_code == 502
+    assert len(requests) == 3
+    assert client.status()["failures"] == 1
+    assert client.breaker.failures == 1 and client.breaker.state == "closed"
+
+
+def test_breaker_opens_fails_fast_and_half_opens(sleeps, clock):
+    client, requests = make_client([httpx.ConnectError("down")] * 2, retries=0, threshold=2)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            get(client)
+    assert client.breaker.state == "open"
+
+    # Open: no request reaches the upstream
+    with pytest.raises(CircuitOpenError):
+        get(client)
+    assert len(requests) == 2
+    assert client.status()["rejected"] == 1
+
+    # Past reset_timeout one trial goes through and closes it on success
+    clock.now += 30.0
+    assert get(client).status_code == 200
+    assert client.breaker.state == "closed" and client.breaker.failures == 0
+
+
+def test_failed_half_open_trial_reopens(sleeps, clock):
+    client, requests = make_client([503, 503], retries=0, threshold=1)
+    get(client)
+    assert client.breaker.state == "open"
+
+    clock.now += 30.0
+    assert get(client).status_code == 503
+    assert client.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        get(client)
+    assert len(requests) == 2
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    breaker.allow()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    # A trial that ended without an outcome (e.g. cancelled) frees the slot
+    breaker.release_trial()
+    breaker.allow()
+
+
+def test_raised_status_errors_follow_the_same_policy(sleeps):
+    async def fetch(http: httpx.AsyncClient) -> httpx.Response:
+        response = await http.get("https://upstream.test/items")
+        response.raise_for_status()
+        return response
+
+    client, requests = make_client([503])
+    assert asyncio.run(client.call(fetch)).status_code == 200
+    assert len(requests) == 2
+
+    client, requests = make_client([403], threshold=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.call(fetch))
+    assert len(requests) == 1
+    assert client.breaker.state == "closed"
@@ -45,7 +45,7 @@ function App() {
             )}
           </div>
 
-          <SearchBar onSearch={search} placeholder="Search weapons, gear, materials..." />
+          <SearchBar onSearch={search} placeholder="Search weapons, gear, materials..." suggestTypes="item" />
 
           <div className="mt-4">
             <Filters
@@ -1,22 +1,51 @@
 import { useState } from 'react';
+import { useSuggestions } from '../hooks/useItems';
 
-export default function SearchBar({ onSearch, placeholder = "Search items..." }) {
+export default function SearchBar({ onSearch, placeholder = "Search items...", suggestTypes = null }) {
   const [query, setQuery] = useState('');
+  const [open, setOpen] = useState(false);
+  const [highlighted, setHighlighted] = useState(-1);
+  // Typeahead only when the page asks for it
+  const suggestions = useSuggestions(suggestTypes ? query : '', suggestTypes);
+  const showSuggestions = open && suggestions.length > 0;
+
+  const choose = (suggestion) => {
+    setQuery(suggestion.name);
+    setOpen(false);
+    onSearch(suggestion.name);
+  };
 
   const handleSubmit = (e) => {
     e.preventDefault();
+    setOpen(false);
     onSearch(query);
   };
 
   const handleChange = (e) => {
     const value = e.target.value;
     setQuery(value);
+    setOpen(true);
+    setHighlighted(-1);
     // Debounced search on type
     if (value.length === 0 || value.length >= 2) {
       onSearch(value);
     }
   };
 
+  const handleKeyDown = (e) => {
+    if (!showSuggestions) return;
+    if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+      e.preventDefault();
+      const step = e.key === 'ArrowDown' ? 1 : -1;
+      setHighlighted(prev => (prev + step + suggestions.length) % suggestions.length);
+    } else if (e.key === 'Enter' && highlighted >= 0) {
+      e.preventDefault();
+      choose(suggestions[highlighted]);
+    } else if (e.key === 'Escape') {
+      setOpen(false);
+    }
+  };
+
   return (
     <form onSubmit={handleSubmit} className="w-full">
       <div className="relative">
@@ -24,7 +53,13 @@ export default function SearchBar({ onSearch, placeholder = "Search items..." })
           type="text"
           value={query}
           onChange={handleChange}
+          onKeyDown={handleKeyDown}
+          onFocus={() => setOpen(true)}
+          onBlur={() => setOpen(false)}
           placeholder={placeholder}
+          role="combobox"
+          aria-expanded={showSuggestions}
+          aria-autocomplete="list"
           className="w-full px-4 py-3 pl-12 bg-arc-dark border border-gray-700 rounded-lg
                      text-gray-100 placeholder-gray-500 focus:outline-none focus:border-arc-accent
                      transition-colors"
@@ -42,6 +77,33 @@ export default function SearchBar({ onSearch, placeholder = "Search items..." })
             d="M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z"
           />
         </svg>
+
+        {/* Typeahead suggestions */}
+        {showSuggestions && (
+          <ul
+            role="listbox"
+            className="absolute z-50 w-full mt-1 bg-arc-dark border border-gray-700 rounded-lg
+                       shadow-lg overflow-hidden"
+          >
+            {suggestions.map((suggestion, i) => (
+              <li
+                key={`${suggestion.type}:${suggestion.id}`}
+                role="option"
+                aria-selected={i === highlighted}
+                onMouseDown={(e) => {
+                  // Keep focus, so the input's blur doesn't close the list first
+                  e.preventDefault();
+                  choose(suggestion);
+                }}
+                className={`px-4 py-2 cursor-pointer text-gray-100 ${
+                  i === highlighted ? 'bg-gray-700' : 'hover:bg-gray-800'
+                }`}
+              >
+                {suggestion.name}
+              </li>
+            ))}
+          </ul>
+        )}
       </div>
     </form>
   );
@@ -116,3 +116,27 @@ export function useStats() {
 
   return { stats, loading };
 }
+
+export function useSuggestions(query, types = null, delay = 150) {
+  const [suggestions, setSuggestions] = useState([]);
+
+  useEffect(() => {
+    if (query.trim().length < 2) {
+      setSuggestions([]);
+      return;
+    }
+    // Wait for a pause in typing, and drop answers to queries typed over since
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      api.getSuggestions(query, types)
+        .then(data => { if (!cancelled) setSuggestions(data.suggestions || []); })
+        .catch(console.error);
+    }, delay);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [query, types, delay]);
+
+  return suggestions;
+}
@@ -29,7 +29,7 @@ export default function ItemsPage() {
     <div className="max-w-7xl mx-auto px-4 py-6">
       {/* Search and Filters */}
       <div className="mb-6 space-y-4">
-        <SearchBar onSearch={search} placeholder="Search weapons, gear, materials..." />
+        <SearchBar onSearch={search} placeholder="Search weapons, gear, materials..." suggestTypes="item" />
         <Filters
           onCategoryChange={filterByCategory}
           onRarityChange={filterByRarity}
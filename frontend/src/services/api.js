@@ -55,6 +55,14 @@ export async function getRelatedItems(itemId) {
   return fetchWithCache(`${API_BASE}/items/${itemId}/related`);
 }
 
+export async function getSuggestions(query, types = null) {
+  const searchParams = new URLSearchParams({ q: query });
+  if (types) searchParams.set('types', types);
+
+  const url = `${API_BASE}/search/suggest?${searchParams.toString()}`;
+  return fetchWithCache(url);
+}
+
 export async function getEvents() {
   return fetchWithCache(`${API_BASE}/events`);
 }